@@ -1,3 +1,5 @@
+import numpy as np
+
 from deephyper.benchmark.benchmark_functions import *
 
 def griewank_():
@@ -31,7 +33,7 @@ def dixonprice_():
     return max_dixonprice, (a, b), minimas
 
 def polynome_2():
-    p = lambda x: -sum([x_i**2 for x_i in x])
+    p = lambda x: -np.sum(np.asarray(x)**2, axis=-1)
     a = -50
     b = 50
     minimas = lambda d: [0 for i in range(d)]
@@ -44,8 +46,15 @@ def levy_():
     minimas = lambda d: [1 for i in range(d)]
     return p, (a, b), minimas
 
+def rosen_():
+    p = lambda x: -roscenbrock(x)
+    a = -5
+    b = 10
+    minimas = lambda d: [1 for i in range(d)]
+    return p, (a, b), minimas
+
 def linear_():
-    p = lambda x: sum(x)
+    p = lambda x: np.sum(x, axis=-1)
     a = 100
     b = 1
     minimas = lambda d: [-1 for i in range(d)]
@@ -1 +1 @@
-from deephyper.benchmark.hps.polynome2.problem import (Problem, run)
\ No newline at end of file
+from deephyper.benchmark.hps.polynome2.problem import (Problem, run, run_vectorized)
\ No newline at end of file
@@ -27,5 +27,15 @@ def run(param_dict):
     return f(x)  # the objective
 
 
+def run_vectorized(param_dicts):
+    """Vectorized version of ``run`` to use with ``Evaluator.create(..., vectorized=True)``."""
+    f, _, _ = polynome_2()
+
+    num_dim = 10
+    X = np.array([[p[f"e{i}"] for i in range(num_dim)] for p in param_dicts])
+
+    return f(X).tolist()  # the objectives
+
+
 if __name__ == "__main__":
     print(Problem)
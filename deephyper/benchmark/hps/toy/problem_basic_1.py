@@ -33,5 +33,16 @@ def run(param_dict):
     return res  # the objective
 
 
+def run_vectorized(param_dicts):
+    """Vectorized version of ``run`` to use with ``Evaluator.create(..., vectorized=True)``."""
+
+    x = np.array([p["x"] for p in param_dicts])
+    y = np.array([p["y"] for p in param_dicts])
+
+    res = x + y
+
+    return res.tolist()  # the objectives
+
+
 if __name__ == "__main__":
     print(Problem)
@@ -87,6 +87,17 @@ def build_parser_from(cls):
         type=int,
         help="Type[int]. Number of seconds before killing the search. Defaults to 'None' when a time budget is not imposed.",
     )
+    parser.add_argument(
+        "--checkpoint-interval",
+        default=None,
+        type=float,
+        help="Type[float]. Minimum number of seconds between two checkpoints of the search saved in the log directory. Defaults to 'None' when the search is not checkpointed.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the search from the checkpoint saved in the log directory.",
+    )
 
     # add arguments for evaluators
     evaluator_added_arguments = add_arguments_from_signature(parser, Evaluator)
@@ -172,12 +183,23 @@ def main(**kwargs):
     kwargs = {k: v for k, v in kwargs.items() if k not in evaluator_kwargs}
     max_evals = kwargs.pop("max_evals")
     timeout = kwargs.pop("timeout")
-
-    # TODO: How about checkpointing and transfer learning?
+    checkpoint_interval = kwargs.pop("checkpoint_interval")
+    resume = kwargs.pop("resume")
 
     # execute the search
     # remaining kwargs are for the search
     logging.info("Starting the search")
-    search = search_cls(problem, evaluator, **kwargs)
-
-    search.search(max_evals=max_evals, timeout=timeout)
+    # the evaluator is None on the worker processes of the "mpicomm" backend
+    with evaluator as evaluator:
+        if evaluator is not None:
+            search = search_cls(problem, evaluator, **kwargs)
+
+            if resume:
+                logging.info("Loading the checkpoint of the search...")
+                search.load_checkpoint()
+
+            search.search(
+                max_evals=max_evals,
+                timeout=timeout,
+                checkpoint_interval=checkpoint_interval,
+            )
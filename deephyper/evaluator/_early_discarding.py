@@ -0,0 +1,133 @@
+import heapq
+
+import numpy as np
+from deephyper.core.exceptions import DeephyperRuntimeError
+
+# Key of the configurations received by the run-function holding the discarding rule
+EARLY_DISCARDING = "early_discarding"
+
+
+class EarlyDiscarding:
+    """Policy applied by the ``Evaluator`` to stop the trainings which are not expected to finish among the ``top_k`` best completed jobs. The learning curves reported by the ``run_function`` with ``deephyper.evaluator.report.Reporter`` are recorded when jobs are completed and each dispatched job receives a discarding rule computed from them, under the ``"early_discarding"`` key of its configuration. The ``Reporter`` of the job applies the rule each time an objective is recorded, the training is then stopped by the ``run_function`` and the job is gathered with its partial objective and the ``Job.DISCARDED`` status.
+
+    Args:
+        method (str, optional): ``"rank"`` discards a job when its objective at a given budget is lower than the ``top_k``-th best objective of the completed jobs at the same budget. ``"curve"`` fits a power-law model to the learning curve of the job and discards it when the extrapolated final objective is lower than the ``top_k``-th best final objective of the completed jobs. Defaults to ``"rank"``.
+        top_k (int, optional): number of best completed jobs a training has to compete with. Defaults to ``5``.
+        min_completed (int, optional): number of completed learning curves required before discarding jobs. Defaults to ``10``.
+        min_budget (int|float, optional): jobs are never discarded before this budget (e.g., number of epochs). Defaults to ``1``.
+
+    An example usage can be:
+
+    >>> evaluator = Evaluator.create(run_base_trainer, method="ray", method_kwargs={...}, early_discarding=EarlyDiscarding(method="curve"))
+
+    The rule is computed when the job is dispatched, the jobs completed while it runs are not taken into account. The learning curves are not received from the ``"subprocess"`` backend with ``persistent=False``.
+    """
+
+    METHODS = ["rank", "curve"]
+
+    def __init__(
+        self,
+        method: str = "rank",
+        top_k: int = 5,
+        min_completed: int = 10,
+        min_budget: float = 1,
+    ):
+        if not method in EarlyDiscarding.METHODS:
+            raise DeephyperRuntimeError(
+                f'The method "{method}" is not a valid early discarding method!'
+                f" Choose among: {', '.join(EarlyDiscarding.METHODS)}."
+            )
+        self.method = method
+        self.top_k = top_k
+        self.min_completed = min_completed
+        self.min_budget = min_budget
+
+        self._num_curves = 0
+        self._objectives = {}  # Budget -> objectives of the completed curves at this budget.
+        self._final_objectives = []  # (budget, objective) at the end of the completed curves.
+        self._rule = None  # Rule computed from the curves, None when a new curve is recorded.
+
+    def observe(self, reports: list):
+        """Record the learning curve of a completed job.
+
+        Args:
+            reports (list): the ``(budget, objective)`` reported by the job.
+        """
+        if len(reports) == 0:
+            return
+        self._num_curves += 1
+        for budget, objective in reports:
+            self._objectives.setdefault(budget, []).append(objective)
+        self._final_objectives.append(reports[-1])
+        self._rule = None
+
+    def rule(self) -> dict:
+        """Compute the discarding rule sent to the dispatched jobs.
+
+        Returns:
+            dict: the rule, ``None`` if not enough learning curves were completed.
+        """
+        if self._num_curves < max(self.min_completed, self.top_k):
+            return None
+
+        if self._rule is None:
+            self._rule = {"method": self.method, "min_budget": self.min_budget}
+            if self.method == "rank":
+                # (budget, threshold) pairs, the configurations can be encoded in JSON
+                self._rule["thresholds"] = [
+                    (budget, heapq.nlargest(self.top_k, objectives)[-1])
+                    for budget, objectives in self._objectives.items()
+                    if len(objectives) >= self.top_k
+                ]
+            else:
+                final_objectives = [obj for _, obj in self._final_objectives]
+                self._rule["threshold"] = heapq.nlargest(self.top_k, final_objectives)[-1]
+                self._rule["max_budget"] = max(b for b, _ in self._final_objectives)
+        return self._rule
+
+    @staticmethod
+    def discard(rule: dict, reports: list) -> bool:
+        """Apply a discarding rule to the learning curve of a running job.
+
+        Args:
+            rule (dict): the rule received by the job.
+            reports (list): the ``(budget, objective)`` reported so far by the job.
+
+        Returns:
+            bool: ``True`` if the training should be stopped.
+        """
+        budget, objective = reports[-1]
+        if budget < rule["min_budget"]:
+            return False
+
+        if rule["method"] == "rank":
+            threshold = dict(rule["thresholds"]).get(budget)
+            return threshold is not None and objective < threshold
+
+        if budget >= rule["max_budget"] or len(reports) < 3:
+            return False
+        prediction = predict_power_law(reports, rule["max_budget"])
+        return prediction < rule["threshold"]
+
+
+def predict_power_law(reports: list, budget: float) -> float:
+    """Extrapolate a learning curve to ``budget`` with the model ``y = a - b * x^(-c)``. The exponent ``c`` is selected on a grid and ``a, b`` are fitted by least squares.
+
+    Args:
+        reports (list): the ``(budget, objective)`` of the learning curve.
+        budget (float): the budget where the objective is predicted.
+
+    Returns:
+        float: the predicted objective.
+    """
+    x = np.array([b for b, _ in reports], dtype=float)
+    y = np.array([obj for _, obj in reports], dtype=float)
+
+    best_error, prediction = np.inf, y[-1]
+    for c in [0.25, 0.5, 1.0, 2.0]:
+        A = np.stack([np.ones_like(x), -(x ** -c)], axis=1)
+        (a, b), *_ = np.linalg.lstsq(A, y, rcond=None)
+        error = np.sum((A @ [a, b] - y) ** 2)
+        if error < best_error:
+            best_error, prediction = error, a - b * budget ** -c
+    return float(prediction)
@@ -1,7 +1,8 @@
 import asyncio
-import csv
+import collections
 import copy
 import importlib
+import math
 import json
 import os
 import sys
@@ -10,14 +11,19 @@ import warnings
 from typing import Dict, List
 
 import numpy as np
+import pandas as pd
 from deephyper.core.exceptions import DeephyperRuntimeError
-from deephyper.evaluator._job import Job
+from deephyper.evaluator import report, trace
+from deephyper.evaluator._early_discarding import EARLY_DISCARDING
+from deephyper.evaluator._job import BatchJob, Job
+from deephyper.evaluator._results_writer import ResultsWriter
 
 EVALUATORS = {
     "thread": "_thread_pool.ThreadPoolEvaluator",
     "process": "_process_pool.ProcessPoolEvaluator",
     "subprocess": "_subprocess.SubprocessEvaluator",
     "ray": "_ray.RayEvaluator",
+    "mpicomm": "_mpi_comm.MPICommEvaluator",
     # "balsam": "_balsam.BalsamEvaluator" # TODO
 }
 
@@ -47,26 +53,58 @@ class Evaluator:
         self.num_workers =  num_workers
         self.jobs = []  # Job objects currently submitted.
         self.n_jobs = 1
-        self._tasks_running = []  # List of AsyncIO Task objects currently running.
-        self._tasks_done = []  # Temp list to hold completed tasks from asyncio.
-        self._tasks_pending = []  # Temp list to hold pending tasks from asyncio.
+        self._tasks_running = set()  # Set of AsyncIO Task objects currently running.
+        self._tasks_done = collections.deque()  # Completion queue of tasks not gathered yet.
+        self._task_done_event = asyncio.Event()  # Set each time a task is completed.
         self.jobs_done = []  # List used to store all jobs completed by the evaluator.
         self.timestamp = (
             time.time()
         )  # Recorded time of when this evaluator interface was created.
         self._loop = None  # Event loop for asyncio.
-        self._start_dumping = False
+        self._evals = []  # Rows of the evaluations dumped so far.
+        self._results_writer = None  # Background writer of the "results.csv" file.
+        self.cache = None  # Cache memoizing the results of the run function.
+        self.vectorized = False  # If the run function evaluates a list of configurations.
+        self.batch_size = None  # Maximum number of configurations per call of a vectorized run function.
+        self._batch_tasks = set()  # AsyncIO Task objects evaluating a BatchJob.
+        self._cache_keys = {}  # Cache keys of the jobs missing in the cache.
+        self.job_timeout = None  # Maximum number of seconds allowed to evaluate a job.
+        self.straggler_policy = None  # Policy applied to the jobs running much longer than the others.
+        self._running_jobs = {}  # Job id -> (Job, AsyncIO Task) of the jobs executed by their own task.
+        self._backup_tasks = {}  # Job id -> AsyncIO Task executing a speculative copy of a straggler.
+        self._durations = []  # Durations of the jobs executed by their own task and completed.
+        self.tracing = False  # If the phases recorded inside the run function are collected.
+        self.search_spans = []  # (name, start, end) intervals spent by the search between evaluations.
+        self.early_discarding = None  # Policy stopping the trainings with unpromising learning curves.
 
         self._callbacks = [] if callbacks is None else callbacks
 
     @staticmethod
-    def create(run_function, method="subprocess", method_kwargs={}):
+    def create(
+        run_function,
+        method="subprocess",
+        method_kwargs={},
+        cache=None,
+        vectorized=False,
+        batch_size=None,
+        job_timeout=None,
+        straggler_policy=None,
+        tracing=False,
+        early_discarding=None,
+    ):
         """Create evaluator with a specific backend and configuration.
 
         Args:
             run_function (function): the function to execute in parallel.
-            method (str, optional): the backend to use in ["thread", "process", "subprocess", "ray"]. Defaults to "subprocess".
+            method (str, optional): the backend to use in ["thread", "process", "subprocess", "ray", "mpicomm"]. Defaults to "subprocess".
             method_kwargs (dict, optional): configuration dictionnary of the corresponding backend. Keys corresponds to the keyword arguments of the corresponding implementation. Defaults to "{}".
+            cache (Cache, optional): a cache from ``deephyper.evaluator.cache`` used to memoize the results of ``run_function``, configurations already evaluated are then not sent to the workers. Defaults to None.
+            vectorized (bool, optional): if ``True`` the ``run_function`` receives a list of configurations and returns the list (or 1-D array) of their results, submitted configurations are then packed in batches evaluated by a single call. Defaults to ``False``.
+            batch_size (int, optional): maximum number of configurations per call of a vectorized ``run_function``. Defaults to ``None``, the submitted configurations are spread evenly over ``num_workers`` calls.
+            job_timeout (float, optional): maximum number of seconds allowed to evaluate a job, counted from the moment the job is dispatched to a worker by the backend (the time waiting for a free worker is not counted). The execution of a job exceeding it is interrupted by the backend and the job is gathered with the ``Job.TIMEOUT`` status. Defaults to ``None``, no timeout.
+            straggler_policy (StragglerPolicy, optional): policy dropping or speculatively relaunching the jobs running much longer than the completed ones. Defaults to ``None``.
+            tracing (bool, optional): if ``True`` the phases recorded inside the ``run_function`` with ``deephyper.evaluator.trace.record`` are collected in ``job.events``. Defaults to ``False``.
+            early_discarding (EarlyDiscarding, optional): policy stopping the trainings whose learning curve, reported with ``deephyper.evaluator.report.Reporter``, is not expected to finish among the best completed jobs. Defaults to ``None``.
 
         Raises:
             DeephyperRuntimeError: if the ``method is`` not acceptable.
@@ -88,34 +126,246 @@ class Evaluator:
         mod = importlib.import_module(f"deephyper.evaluator.{mod_name}")
         eval_cls = getattr(mod, attr_name)
         evaluator = eval_cls(run_function, **method_kwargs)
+        evaluator.cache = cache
+        evaluator.vectorized = vectorized
+        evaluator.batch_size = batch_size
+        evaluator.job_timeout = job_timeout
+        evaluator.straggler_policy = straggler_policy
+        evaluator.tracing = tracing
+        evaluator.early_discarding = early_discarding
 
         return evaluator
 
+    def _on_task_done(self, task):
+        """Called by asyncio when a task is completed, moves it to the completion queue."""
+        self._tasks_running.discard(task)
+        self._tasks_done.append(task)
+        self._task_done_event.set()
+
     async def _get_at_least_n_tasks(self, n):
         # If a user requests a batch size larger than the number of currently-running tasks, set n to the number of tasks running.
-        if n > len(self._tasks_running):
+        num_tasks = len(self._tasks_running) + len(self._tasks_done)
+        if n > num_tasks:
             warnings.warn(
-                f"Requested a batch size ({n}) larger than currently running tasks ({len(self._tasks_running)}). Batch size has been set to the count of currently running tasks."
+                f"Requested a batch size ({n}) larger than currently running tasks ({num_tasks}). Batch size has been set to the count of currently running tasks."
             )
-            n = len(self._tasks_running)
+            n = num_tasks
 
         while len(self._tasks_done) < n:
-            self._tasks_done, self._tasks_pending = await asyncio.wait(
-                self._tasks_running, return_when="FIRST_COMPLETED"
-            )
+            self._task_done_event.clear()
+            if self.straggler_policy is None:
+                await self._task_done_event.wait()
+            else:
+                try:
+                    await asyncio.wait_for(
+                        self._task_done_event.wait(),
+                        timeout=self.straggler_policy.check_interval,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._check_stragglers()
 
     async def _run_jobs(self, configs):
+        new_jobs = []
         for config in configs:
             new_job = self.create_job(config)
             self._on_launch(new_job)
-            task = self.loop.create_task(self.execute(new_job))
-            self._tasks_running.append(task)
+            if self.cache is not None and self._lookup_cache(new_job):
+                # answer the job immediately without sending it to a worker
+                future = self.loop.create_future()
+                future.set_result(new_job)
+                self._on_task_done(future)
+            elif self.vectorized:
+                new_jobs.append(new_job)
+            else:
+                task = self.loop.create_task(self._execute_job(new_job))
+                task.add_done_callback(self._on_task_done)
+                self._tasks_running.add(task)
+                self._running_jobs[new_job.id] = (new_job, task)
+
+        if len(new_jobs) > 0:
+            batch_size = self.batch_size
+            if batch_size is None:
+                batch_size = math.ceil(len(new_jobs) / self.num_workers)
+            for i in range(0, len(new_jobs), batch_size):
+                self._run_batch(new_jobs[i : i + batch_size])
+
+    def _run_batch(self, jobs):
+        """Evaluate ``jobs`` with a single call of the vectorized run function. Each job is represented by its own future in the running tasks."""
+        futures = []
+        for _ in jobs:
+            future = self.loop.create_future()
+            future.add_done_callback(self._on_task_done)
+            self._tasks_running.add(future)
+            futures.append(future)
+        task = self.loop.create_task(self._execute_batch(jobs, futures))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _execute_job(self, job):
+        """Execute ``job`` with the backend, which enforces ``job_timeout`` once the job is dispatched to a worker. A job timed out or cancelled is returned with ``FAIL_RETURN_VALUE`` as result."""
+        try:
+            await self.execute(job)
+            self._on_returned(job)
+            # the time waiting for a free worker is not part of the runtime of the job
+            dispatched = self._dispatch_time(job)
+            if job.status == job.RUNNING and dispatched is not None:
+                self._durations.append(time.time() - dispatched)
+        except asyncio.TimeoutError:
+            job.status = job.TIMEOUT
+        except asyncio.CancelledError:
+            # the new status is set before cancelling the task, the job is then returned normally
+            if job.status == job.RUNNING:
+                raise
+        finally:
+            self._running_jobs.pop(job.id, None)
+            backup_task = self._backup_tasks.pop(job.id, None)
+            if backup_task is not None:
+                backup_task.cancel()
+
+        if job.status in (job.CANCELLED, job.TIMEOUT):
+            job.result = Evaluator.FAIL_RETURN_VALUE
+
+        return job
+
+    @staticmethod
+    def _dispatch_time(job):
+        """Return the time at which ``job`` was dispatched to a worker by the backend, ``None`` if it is still waiting for a free worker."""
+        for phase, timestamp in reversed(job.events):
+            if phase == trace.DISPATCHED:
+                return timestamp
+        return None
+
+    def _relaunch(self, job):
+        """Speculatively execute a copy of ``job``, the first execution completed provides the result."""
+        backup_job = Job(job.id, job.config, job.run_function)
+        backup_task = self.loop.create_task(self.execute(backup_job))
+        backup_task.add_done_callback(
+            lambda task: self._on_backup_done(job, task)
+        )
+        self._backup_tasks[job.id] = backup_task
+
+    def _on_backup_done(self, job, backup_task):
+        if backup_task.cancelled() or backup_task.exception() is not None:
+            return
+        if job.id in self._running_jobs:
+            # the copy completed first, the original execution is interrupted
+            backup_job = backup_task.result()
+            self._on_returned(backup_job)
+            job.result = backup_job.result
+            job.reports = backup_job.reports
+            if backup_job.status == job.DISCARDED:
+                job.status = job.DISCARDED
+            else:
+                job.status = job.DONE
+            self._running_jobs[job.id][1].cancel()
+
+    def _check_stragglers(self):
+        """Apply the ``straggler_policy`` to the jobs running longer than its threshold."""
+        threshold = self.straggler_policy.threshold(self._durations)
+        if threshold is None:
+            return
+
+        now = time.time()
+        for job, task in list(self._running_jobs.values()):
+            # the jobs waiting for a free worker are not running yet
+            dispatched = self._dispatch_time(job)
+            if (
+                job.status != job.RUNNING
+                or dispatched is None
+                or now - dispatched <= threshold
+            ):
+                continue
+            if self.straggler_policy.action == "drop":
+                job.status = job.TIMEOUT
+                task.cancel()
+            elif not job.id in self._backup_tasks:
+                self._relaunch(job)
+
+    def cancel(self, job_ids: list):
+        """Cancel submitted jobs which are not completed yet. Their execution is interrupted by the backend and they are returned by the next ``gather`` with the ``Job.CANCELLED`` status. Jobs evaluated by a vectorized ``run_function`` cannot be cancelled.
+
+        Args:
+            job_ids (list): identifiers of the jobs to cancel, unknown or completed jobs are ignored.
+        """
+        for job_id in job_ids:
+            if job_id in self._running_jobs:
+                job, task = self._running_jobs[job_id]
+                job.status = job.CANCELLED
+                task.cancel()
+
+    async def _execute_batch(self, jobs, futures):
+        try:
+            batch_job = await self.execute(BatchJob(jobs, self.run_function))
+            self._on_returned(batch_job)
+            results = list(batch_job.result)
+            if len(results) != len(jobs):
+                raise DeephyperRuntimeError(
+                    f"The vectorized run function returned {len(results)} results for {len(jobs)} configurations!"
+                )
+        except asyncio.TimeoutError:
+            for job, future in zip(jobs, futures):
+                job.status = job.TIMEOUT
+                job.result = Evaluator.FAIL_RETURN_VALUE
+                future.set_result(job)
+            return
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        for job, future, result in zip(jobs, futures, results):
+            job.result = result
+            future.set_result(job)
+
+    def _lookup_cache(self, job) -> bool:
+        """Set the result of ``job`` from the cache. Returns ``True`` if the result was found."""
+        key = self.cache.key(job.config)
+        try:
+            job.result = self.cache.get(key)
+        except KeyError:
+            self._cache_keys[job.id] = key
+            for cb in self._callbacks:
+                cb.on_cache_miss(job)
+            return False
+        for cb in self._callbacks:
+            cb.on_cache_hit(job)
+        return True
+
+    def _worker_config(self, job):
+        """Return the configuration sent to the worker evaluating ``job``. It holds the rule of the ``early_discarding`` policy computed from the jobs completed so far."""
+        if self.early_discarding is None or isinstance(job, BatchJob):
+            return job.config
+        rule = self.early_discarding.rule()
+        if rule is None:
+            return job.config
+        return {**job.config, EARLY_DISCARDING: rule}
+
+    def _worker_args(self, job):
+        """Return the function and the arguments to call in a worker to evaluate ``job``. When tracing, the ``run_function`` is wrapped to collect the phases recorded by the worker."""
+        if self.tracing:
+            return trace.run_traced, job.run_function, self._worker_config(job)
+        return job.run_function, self._worker_config(job)
+
+    def _on_returned(self, job):
+        """Called when the result of a job is received from its worker."""
+        if isinstance(job.result, trace.TracedResult):
+            for phase, timestamp in job.result.events:
+                job.add_event(phase, timestamp)
+            job.result = job.result.result
+        if isinstance(job.result, report.ReportedResult):
+            job.reports = job.result.reports
+            if job.result.discarded:
+                job.status = job.DISCARDED
+            job.result = job.result.result
+        job.add_event(trace.RETURNED)
 
     def _on_launch(self, job):
         """Called after a job is started."""
         job.status = job.RUNNING
 
         job.duration = time.time()
+        job.add_event(trace.SUBMITTED, job.duration)
 
         # call callbacks
         for cb in self._callbacks:
@@ -123,7 +373,8 @@ class Evaluator:
 
     def _on_done(self, job):
         """Called after a job has completed."""
-        job.status = job.DONE
+        if job.status == job.RUNNING:
+            job.status = job.DONE
 
         job.duration = time.time() - job.duration
         job.elapsed_sec = time.time() - self.timestamp
@@ -132,6 +383,21 @@ class Evaluator:
             if not (np.isfinite(job.result)):
                 job.result = Evaluator.FAIL_RETURN_VALUE
 
+        # failed and discarded evaluations are not memoized
+        key = self._cache_keys.pop(job.id, None)
+        if (
+            key is not None
+            and job.status == job.DONE
+            and not (
+                np.isscalar(job.result) and job.result == Evaluator.FAIL_RETURN_VALUE
+            )
+        ):
+            self.cache.set(key, job.result)
+
+        # learning curves of the completed trainings
+        if self.early_discarding is not None and job.status == job.DONE:
+            self.early_discarding.observe(job.reports)
+
         # call callbacks
         for cb in self._callbacks:
             cb.on_done(job)
@@ -144,6 +410,15 @@ class Evaluator:
         """
         raise NotImplementedError
 
+    def close(self):
+        """Release the resources (e.g., worker processes) held by the evaluator. The evaluator can still be used after being closed, the resources are then acquired again."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
     def submit(self, configs: List[Dict]):
         """Send configurations to be evaluated by available workers.
 
@@ -153,7 +428,7 @@ class Evaluator:
         self.loop = asyncio.get_event_loop()
         self.loop.run_until_complete(self._run_jobs(configs))
 
-    def gather(self, type, size=1):
+    def gather(self, type, size=1, timeout=None):
         """Collect the completed tasks from the evaluator in batches of one or more.
 
         Args:
@@ -165,30 +440,36 @@ class Evaluator:
                     "BATCH"
                         Specify a minimum batch size of jobs to collect from the evaluator.
             size (int, optional): The minimum batch size that we want to collect from the evaluator. Defaults to 1.
+            timeout (float, optional): Maximum number of seconds to wait for ``size`` jobs to complete. When the timeout expires the jobs completed so far are returned, possibly none. Defaults to ``None``, will wait until ``size`` jobs are completed.
 
         Raises:
             Exception: Raised when a gather operation other than "ALL" or "BATCH" is provided.
 
         Returns:
-            List[Job]: A batch of completed jobs that is at minimum the given size.
+            List[Job]: A batch of completed jobs that is at minimum the given size (unless ``timeout`` expired).
         """
         assert type in ["ALL", "BATCH"], f"Unsupported gather operation: {type}."
 
         results = []
 
         if type == "ALL":
-            size = len(self._tasks_running)  # Get all tasks.
+            size = len(self._tasks_running) + len(self._tasks_done)  # Get all tasks.
 
-        self.loop.run_until_complete(self._get_at_least_n_tasks(size))
-        for task in self._tasks_done:
+        try:
+            self.loop.run_until_complete(
+                asyncio.wait_for(self._get_at_least_n_tasks(size), timeout=timeout)
+            )
+        except asyncio.TimeoutError:
+            pass
+
+        while len(self._tasks_done) > 0:
+            task = self._tasks_done.popleft()
             job = task.result()
+            job.add_event(trace.GATHERED)
             self._on_done(job)
             results.append(job)
             self.jobs_done.append(job)
-            self._tasks_running.remove(task)
 
-        self._tasks_done = []
-        self._tasks_pending = []
         return results
 
     def create_job(self, config):
@@ -219,10 +500,63 @@ class Evaluator:
         else:
             return val
 
-    def dump_evals(
-        self, saved_keys = None, log_dir: str = "."
-    ):
-        """Dump evaluations to a CSV file name ``"results.csv"``
+    def add_search_span(self, name: str, start: float, end: float):
+        """Record an interval of time spent by the search between evaluations (e.g., fitting its surrogate model), it is reported as search overhead by ``get_trace_summary``.
+
+        Args:
+            name (str): name of the interval.
+            start (float): start timestamp.
+            end (float): end timestamp.
+        """
+        self.search_spans.append((name, start, end))
+
+    def save_trace(self, path: str = "trace.json"):
+        """Save the phases of all the jobs created by the evaluator and the intervals spent by the search as a Chrome trace JSON file (which can be viewed with ``chrome://tracing`` or Perfetto).
+
+        Args:
+            path (str, optional): path of the JSON file. Defaults to ``"trace.json"``.
+        """
+        trace.save_chrome_trace(path, self.jobs, self.search_spans)
+
+    def get_trace_summary(self) -> dict:
+        """Summarize the phases of all the jobs created by the evaluator.
+
+        Returns:
+            dict: the utilization of the workers, the mean duration of each phase and the search overhead, see ``deephyper.evaluator.trace.summary``.
+        """
+        return trace.summary(self.jobs, self.num_workers, self.search_spans)
+
+    def get_state(self) -> dict:
+        """State of the evaluator saved in the checkpoints of a search: the evaluations dumped so far, the number of jobs created and the configurations of the jobs not gathered yet.
+
+        Returns:
+            dict: the state which can be restored with ``set_state``.
+        """
+        return {
+            "evals": list(self._evals),
+            "n_jobs": self.n_jobs,
+            "pending": [
+                job.config
+                for job in self.jobs
+                if job.status in [Job.READY, Job.RUNNING]
+            ],
+        }
+
+    def set_state(self, state: dict) -> list:
+        """Restore the evaluations and the job counter saved by ``get_state``. The restored evaluations are written first in the ``"results.csv"`` file of the next ``dump_evals``.
+
+        Args:
+            state (dict): a state returned by ``get_state``.
+
+        Returns:
+            list: the configurations of the jobs which were not gathered, they have to be submitted again.
+        """
+        self._evals = list(state["evals"])
+        self.n_jobs = max(self.n_jobs, state["n_jobs"])
+        return [copy.deepcopy(config) for config in state["pending"]]
+
+    def dump_evals(self, saved_keys=None, log_dir: str = "."):
+        """Dump evaluations to a CSV file name ``"results.csv"``. The rows are appended to the file by a background thread and kept in memory to be returned by ``get_evals()``. When ``log_dir`` changes, a new file is started and ``get_evals()`` only returns the evaluations dumped in it.
 
         Args:
             saved_keys (list|callable): If ``None`` the whole ``job.config`` will be added as row of the CSV file. If a ``list`` filtered keys will be added as a row of the CSV file. If a ``callable`` the output dictionnary will be added as a row of the CSV file.
@@ -233,28 +567,58 @@ class Evaluator:
 
         for job in self.jobs_done:
             if saved_keys is None:
-                result = copy.deepcopy(job.config)
+                result = job.config
             elif type(saved_keys) is list:
-                decoded_key = copy.deepcopy(job.config)
-                result = {k: self.convert_for_csv(decoded_key[k]) for k in saved_keys}
+                result = {k: job.config[k] for k in saved_keys}
             elif callable(saved_keys):
-                result = copy.deepcopy(saved_keys(job))
+                result = saved_keys(job)
+            result = {k: self.convert_for_csv(v) for k, v in result.items()}
             result["id"] = job.id
             result["objective"] = job.result
             result[
                 "elapsed_sec"
             ] = job.elapsed_sec  # Time to complete from the intitilization of evaluator.
             result["duration"] = job.duration
+            result["status"] = Job.STATUS_NAMES[job.status]
             resultsList.append(result)
 
-            self.jobs_done.remove(job)
+        self.jobs_done = []
 
         if len(resultsList) != 0:
-            mode = "a" if self._start_dumping else "w"
-            with open(os.path.join(log_dir, "results.csv"), mode) as fp:
-                columns = resultsList[0].keys()
-                writer = csv.DictWriter(fp, columns)
-                if not (self._start_dumping):
-                    writer.writeheader()
-                    self._start_dumping = True
-                writer.writerows(resultsList)
+            path = os.path.join(log_dir, "results.csv")
+            if self._results_writer is None or self._results_writer.path != path:
+                restored_evals = []
+                if self._results_writer is not None:
+                    # the evaluations dumped in the previous file are not part of the new one
+                    self._results_writer.close()
+                    self._evals = []
+                else:
+                    # evaluations restored by "set_state"
+                    restored_evals = self._evals
+                self._results_writer = ResultsWriter(path)
+                self._results_writer.write(restored_evals)
+            self._results_writer.write(resultsList)
+            self._evals.extend(resultsList)
+
+    def flush_evals(self):
+        """Block until all the evaluations dumped by ``dump_evals`` are written in the ``"results.csv"`` file."""
+        if self._results_writer is not None:
+            self._results_writer.flush()
+
+    def get_evals(self) -> pd.DataFrame:
+        """Return the evaluations dumped by ``dump_evals`` without reading back the ``"results.csv"`` file.
+
+        Returns:
+            DataFrame: a pandas DataFrame with the same columns as the ``"results.csv"`` file.
+        """
+        columns = None if self._results_writer is None else self._results_writer.columns
+        df = pd.DataFrame(self._evals, columns=columns)
+
+        # infer numerical columns in the same way as when the CSV file is parsed
+        for col in df.columns:
+            if df[col].dtype == object:
+                try:
+                    df[col] = pd.to_numeric(df[col])
+                except (ValueError, TypeError):
+                    pass
+        return df
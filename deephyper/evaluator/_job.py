@@ -1,4 +1,5 @@
 import copy
+import time
 
 class Job:
     """Represents an evaluation executed by the ``Evaluator`` class.
@@ -12,6 +13,18 @@ class Job:
     READY = 0
     RUNNING = 1
     DONE = 2
+    CANCELLED = 3
+    TIMEOUT = 4
+    DISCARDED = 5
+
+    STATUS_NAMES = {
+        READY: "READY",
+        RUNNING: "RUNNING",
+        DONE: "DONE",
+        CANCELLED: "CANCELLED",
+        TIMEOUT: "TIMEOUT",
+        DISCARDED: "DISCARDED",
+    }
 
     def __init__(self, id, config:dict, run_function):
         self.id = id
@@ -22,11 +35,53 @@ class Job:
         self.elapsed_sec = 0 # in seconds
         self.status = self.READY
         self.result = None
+        self.events = []  # (phase, timestamp) recorded during the execution.
+        self.reports = []  # (budget, objective) reported during the execution.
+
+    def add_event(self, phase: str, timestamp: float = None):
+        """Record the end of a phase of the job, see ``deephyper.evaluator.trace``.
+
+        Args:
+            phase (str): name of the phase.
+            timestamp (float, optional): time of the event. Defaults to ``None`` for the current time.
+        """
+        self.events.append((phase, time.time() if timestamp is None else timestamp))
 
     def __repr__(self) -> str:
         return f"Job(id={self.id}, status={self.status}, config={self.config})"
 
+    def __getstate__(self):
+        # the run function is not saved with the job (e.g., in a checkpoint of the search)
+        state = self.__dict__.copy()
+        state["run_function"] = None
+        return state
+
     def __getitem__(self, index):
         cfg = copy.deepcopy(self.config)
         cfg.pop("id")
-        return (cfg, self.result)[index]
\ No newline at end of file
+        return (cfg, self.result)[index]
+
+
+class BatchJob:
+    """Represents a group of jobs evaluated by a single call of a vectorized ``run_function``. Backends of the ``Evaluator`` execute it as a regular ``Job`` where ``config`` is the list of configurations of the grouped jobs.
+
+    Args:
+        jobs (list(Job)): the grouped jobs.
+        run_function (callable): vectorized function executed by the ``Evaluator``, it receives a list of configurations and returns a list of results of the same length.
+    """
+
+    def __init__(self, jobs: list, run_function):
+        self.jobs = jobs
+        self.id = jobs[0].id
+        self.config = [job.config for job in jobs]
+        self.run_function = run_function
+        self.result = None
+
+    def add_event(self, phase: str, timestamp: float = None):
+        """Record the end of a phase for all the grouped jobs."""
+        timestamp = time.time() if timestamp is None else timestamp
+        for job in self.jobs:
+            job.add_event(phase, timestamp)
+
+    def __repr__(self) -> str:
+        return f"BatchJob(ids={[job.id for job in self.jobs]})"
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import traceback
+
+from deephyper.evaluator import trace
+from deephyper.evaluator._evaluator import Evaluator
+
+try:
+    from mpi4py import MPI
+except ImportError:
+    from deephyper.core.cli._mpi4py_mock import MPI
+
+logger = logging.getLogger(__name__)
+
+# Tags of the messages exchanged between the master and the workers
+TAG_JOB = 1
+TAG_RESULT = 2
+TAG_STOP = 3
+
+# Status of the results sent back to the master
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+class MPICommEvaluator(Evaluator):
+    """This evaluator uses a MPI communicator (``mpi4py``) as backend.
+
+    The rank ``0`` of the communicator executes the search and the other ranks are workers executing the ``run_function``. Configurations and results are exchanged as pickled messages: the master sends jobs with non-blocking sends and a single polling loop receives the results of all the workers with ``Iprobe`` on any source, the cost of a message does not depend on the number of ranks. When the communicator has a single rank (e.g., without ``mpirun`` or when ``mpi4py`` is not installed) the jobs are executed sequentially by the rank ``0``.
+
+    The evaluator must be used as a context manager, it is ``None`` on the worker ranks which only return from the ``with`` statement when the master exits it:
+
+    >>> with Evaluator.create(run, method="mpicomm") as evaluator:
+    ...     if evaluator is not None:
+    ...         search = AMBS(problem, evaluator)
+    ...         search.search(max_evals=100)
+
+    Then the script is executed with ``mpirun -np 4 python script.py``. A job cancelled or timed out cannot be interrupted, its worker is available again once it has sent back its result.
+
+    Args:
+        run_function (callable): functions to be executed by the ``Evaluator``.
+        num_workers (int, optional): Number of worker ranks used to compute the ``run_function``. Defaults to ``None``, all the ranks except ``0`` are used.
+        callbacks (list, optional): A list of callbacks to trigger custom actions at the creation or completion of jobs. Defaults to None.
+        comm (MPI.Comm, optional): the communicator to use. Defaults to ``None`` for ``MPI.COMM_WORLD``.
+        poll_interval (float, optional): number of seconds between two polls of the results received by the master. Defaults to ``0.001``.
+    """
+
+    def __init__(
+        self,
+        run_function,
+        num_workers: int = None,
+        callbacks=None,
+        comm=None,
+        poll_interval: float = 0.001,
+    ):
+        super().__init__(run_function, num_workers, callbacks)
+        self.comm = MPI.COMM_WORLD if comm is None else comm
+        self.rank = self.comm.Get_rank()
+        self.size = self.comm.size
+        self.poll_interval = poll_interval
+
+        max_workers = max(self.size - 1, 1)
+        if self.num_workers is None or self.num_workers == -1:
+            self.num_workers = max_workers
+        self.num_workers = min(self.num_workers, max_workers)
+
+        self._idle_ranks = None  # Queue of the worker ranks waiting for a job.
+        self._pending = {}  # Worker rank -> Future of the result of its job.
+        self._poller = None  # Task receiving the results sent by the workers.
+        logger.info(
+            f"MPIComm Evaluator (rank {self.rank}/{self.size}) will execute {self.run_function.__name__}() from module {self.run_function.__module__}"
+        )
+
+    @property
+    def is_master(self) -> bool:
+        return self.rank == 0
+
+    def __enter__(self):
+        if self.is_master:
+            return self
+        self._run_worker()
+        return None
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self.is_master:
+            self.close()
+            self._stop_workers()
+
+    def _run_worker(self):
+        """Execute the jobs received from the master until it sends the stop message."""
+        status = MPI.Status()
+        while True:
+            config = self.comm.recv(source=0, tag=MPI.ANY_TAG, status=status)
+            if status.Get_tag() == TAG_STOP:
+                break
+
+            try:
+                if self.tracing:
+                    message = (STATUS_OK, trace.run_traced(self.run_function, config))
+                else:
+                    message = (STATUS_OK, self.run_function(config))
+            except Exception:
+                message = (STATUS_ERROR, traceback.format_exc())
+
+            self.comm.send(message, dest=0, tag=TAG_RESULT)
+
+    def _stop_workers(self):
+        # a single rank has no worker to stop (the mock of MPI used without mpi4py has no requests)
+        if self.size == 1:
+            return
+        requests = [
+            self.comm.isend(None, dest=rank, tag=TAG_STOP)
+            for rank in range(1, self.size)
+        ]
+        MPI.Request.waitall(requests)
+
+    async def _poll_results(self):
+        status = MPI.Status()
+        while len(self._pending) > 0:
+            while self.comm.Iprobe(source=MPI.ANY_SOURCE, tag=TAG_RESULT, status=status):
+                source = status.Get_source()
+                message = self.comm.recv(source=source, tag=TAG_RESULT)
+                self._pending.pop(source).set_result(message)
+            await asyncio.sleep(self.poll_interval)
+
+    def _release_rank(self, rank):
+        self._idle_ranks.put_nowait(rank)
+
+    async def execute(self, job):
+
+        if self.size == 1:
+            job.add_event(trace.DISPATCHED)
+            function, *args = self._worker_args(job)
+            job.result = function(*args)
+            return job
+
+        if self._idle_ranks is None:
+            self._idle_ranks = asyncio.Queue()
+            for rank in range(1, self.num_workers + 1):
+                self._idle_ranks.put_nowait(rank)
+
+        rank = await self._idle_ranks.get()
+        job.add_event(trace.DISPATCHED)
+        future = self.loop.create_future()
+        # the rank is available again only when its result is received, even if the job is cancelled
+        future.add_done_callback(lambda _: self._release_rank(rank))
+        self._pending[rank] = future
+        request = self.comm.isend(self._worker_config(job), dest=rank, tag=TAG_JOB)
+
+        if self._poller is None or self._poller.done():
+            self._poller = self.loop.create_task(self._poll_results())
+
+        status, sol = await asyncio.wait_for(
+            asyncio.shield(future), timeout=self.job_timeout
+        )
+        request.wait()
+
+        if status == STATUS_ERROR:
+            raise RuntimeError(
+                f"{sol}\n\n Could not collect any result from the run_function in the master because an error happened in the worker rank {rank}."
+            )
+
+        job.result = sol
+
+        return job
@@ -1,9 +1,13 @@
 import logging
 import asyncio
+import os
+import signal
 
+from deephyper.evaluator import trace
 from deephyper.evaluator._evaluator import Evaluator
 
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 logger = logging.getLogger(__name__)
 
@@ -11,27 +15,88 @@ logger = logging.getLogger(__name__)
 class ProcessPoolEvaluator(Evaluator):
     """This evaluator uses the ``ProcessPoolExecutor`` as backend.
 
+    A pool of ``num_workers`` processes is shared by all the jobs. The processes are created at the first submission and shut down by ``close()``. Each process is managed by its own single-worker executor so that the process executing a job which is cancelled or timed out can be terminated (and replaced) without interrupting the other jobs.
+
     Args:
         run_function (callable): functions to be executed by the ``Evaluator``.
         num_workers (int, optional): Number of parallel processes used to compute the ``run_function``. Defaults to 1.
         callbacks (list, optional): A list of callbacks to trigger custom actions at the creation or completion of jobs. Defaults to None.
+        initializer (callable, optional): A function called once at the start of each worker process (e.g., to preload data used by the ``run_function``). Defaults to None.
+        initargs (tuple, optional): Arguments passed to ``initializer``. Defaults to ``()``.
     """
 
-    def __init__(self, run_function, num_workers: int=1, callbacks=None):
+    def __init__(
+        self,
+        run_function,
+        num_workers: int = 1,
+        callbacks=None,
+        initializer=None,
+        initargs=(),
+    ):
         super().__init__(run_function, num_workers, callbacks)
         self.sem = asyncio.Semaphore(num_workers)
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executors = set()  # Single-worker executors currently started.
+        self._idle_executors = []  # Executors waiting for a job.
+        self._pids = {}  # Executor -> PID of its worker process.
         logger.info(
             f"ProcessPool Evaluator will execute {self.run_function.__name__}() from module {self.run_function.__module__}"
         )
 
+    async def _acquire_executor(self):
+        if len(self._idle_executors) > 0:
+            return self._idle_executors.pop()
+        executor = ProcessPoolExecutor(
+            max_workers=1,
+            initializer=self.initializer,
+            initargs=self.initargs,
+        )
+        # the public API of the executor cannot interrupt a running call, the process is killed by its PID
+        try:
+            self._pids[executor] = await self.loop.run_in_executor(executor, os.getpid)
+        except (asyncio.CancelledError, BrokenProcessPool):
+            executor.shutdown(wait=False)
+            raise
+        self._executors.add(executor)
+        return executor
+
+    def _terminate_executor(self, executor):
+        self._executors.discard(executor)
+        pid = self._pids.pop(executor, None)
+        if pid is not None:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        executor.shutdown(wait=False)
+
     async def execute(self, job):
 
         async with self.sem:
 
-            executor = ProcessPoolExecutor(max_workers=1)
-            sol = await self.loop.run_in_executor(executor, job.run_function, job.config)
+            executor = await self._acquire_executor()
+            job.add_event(trace.DISPATCHED)
+            try:
+                sol = await asyncio.wait_for(
+                    self.loop.run_in_executor(executor, *self._worker_args(job)),
+                    timeout=self.job_timeout,
+                )
+            except (asyncio.CancelledError, asyncio.TimeoutError, BrokenProcessPool):
+                # the job was cancelled, timed out or its process crashed, a new process will be started for the next job
+                self._terminate_executor(executor)
+                raise
+            finally:
+                if executor in self._executors:
+                    self._idle_executors.append(executor)
 
             job.result = sol
 
+        return job
 
-        return job
\ No newline at end of file
+    def close(self):
+        for executor in self._executors:
+            executor.shutdown(wait=False)
+        self._executors = set()
+        self._idle_executors = []
+        self._pids = {}
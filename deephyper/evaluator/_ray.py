@@ -1,6 +1,8 @@
+import asyncio
 import logging
+
 import ray
-import time
+from deephyper.evaluator import trace
 from deephyper.evaluator._evaluator import Evaluator
 
 ray_initializer = None
@@ -8,6 +10,23 @@ ray_initializer = None
 logger = logging.getLogger(__name__)
 
 
+class RayWorker:
+    """Ray actor which evaluates the ``run_function`` in a long-lived process. The ``initializer`` is called once when the actor starts, for example to load data reused by all the jobs executed by the actor.
+
+    :meta private:
+    """
+
+    def __init__(self, run_function, initializer=None, *initargs):
+        if initializer is not None:
+            initializer(*initargs)
+        self.run_function = run_function
+
+    def execute(self, config, tracing=False):
+        if tracing:
+            return trace.run_traced(self.run_function, config)
+        return self.run_function(config)
+
+
 class RayEvaluator(Evaluator):
     """This evaluator uses the ``ray`` library as backend.
 
@@ -23,6 +42,20 @@ class RayEvaluator(Evaluator):
         num_gpus_per_task (float, optional): number of GPUs used per remote task. Defaults to None.
         ray_kwargs (dict, optional): other ray keyword arguments passed to ``ray.init(...)``. Defaults to {}.
         num_workers (int, optional): number of workers available to compute remote-tasks in parallel. Defaults to ``None``, or if it is ``-1`` it is automatically computed based with ``num_workers = int(num_cpus // num_cpus_per_task)``.
+        use_actors (bool, optional): if ``True`` the jobs are dispatched to a pool of ``num_workers`` Ray actors which stay alive across jobs (the state loaded in the actor's process is reused) instead of stateless remote tasks. Defaults to ``False``.
+        initializer (callable, optional): function called once at the start of each actor when ``use_actors=True``. Defaults to ``None``.
+        initargs (tuple, optional): arguments passed to ``initializer``. They are put once in the Ray object store and shared by all the actors. Defaults to ``()``.
+
+    The remote task or the actor executing a job which is cancelled or timed out is killed.
+
+    An example usage of actors which load the data once can be:
+
+    >>> def load(data):
+    ...     global DATA
+    ...     DATA = data
+    >>> def run(config):
+    ...     return score(DATA, config)
+    >>> evaluator = Evaluator.create(run, method="ray", method_kwargs={"use_actors": True, "initializer": load, "initargs": (load_data(),)})
     """
 
     def __init__(
@@ -37,6 +70,9 @@ class RayEvaluator(Evaluator):
         num_gpus_per_task: float = None,
         ray_kwargs: dict = {},
         num_workers: int = None,
+        use_actors: bool = False,
+        initializer=None,
+        initargs=(),
     ):
         super().__init__(run_function, num_workers, callbacks)
 
@@ -73,11 +109,93 @@ class RayEvaluator(Evaluator):
             num_gpus=self.num_gpus_per_task,
             # max_calls=1,
         )(self.run_function)
+        self._remote_run_traced = ray.remote(
+            num_cpus=self.num_cpus_per_task,
+            num_gpus=self.num_gpus_per_task,
+        )(trace.run_traced)
+        self._run_function_ref = None  # The run function put in the object store when tracing.
+
+        self.use_actors = use_actors
+        self.initializer = initializer
+        self.initargs = initargs
+        self._remote_worker_class = ray.remote(
+            num_cpus=self.num_cpus_per_task,
+            num_gpus=self.num_gpus_per_task,
+        )(RayWorker)
+        self._actors = []  # Actors currently alive.
+        self._idle_actors = None  # Queue of the actors waiting for a job.
+
+    def _create_actor(self):
+        actor = self._remote_worker_class.remote(
+            self.run_function, self.initializer, *self._initargs_refs
+        )
+        self._actors.append(actor)
+        return actor
+
+    def _start_actors(self):
+        # large arguments are copied once in the object store and shared by all actors
+        self._initargs_refs = [ray.put(arg) for arg in self.initargs]
+        self._idle_actors = asyncio.Queue()
+        for _ in range(self.num_workers):
+            self._idle_actors.put_nowait(self._create_actor())
 
     async def execute(self, job):
 
-        sol = await self._remote_run_function.remote(job.config)
+        if self.use_actors:
+            sol = await self._execute_actor(job)
+        else:
+            sol = await self._execute_task(job)
 
         job.result = sol
 
         return job
+
+    async def _execute_task(self, job):
+        job.add_event(trace.DISPATCHED)
+        if self.tracing:
+            if self._run_function_ref is None:
+                self._run_function_ref = ray.put(self.run_function)
+            ref = self._remote_run_traced.remote(
+                self._run_function_ref, self._worker_config(job)
+            )
+        else:
+            ref = self._remote_run_function.remote(self._worker_config(job))
+        try:
+            sol = await asyncio.wait_for(ref, timeout=self.job_timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            # the job was cancelled or timed out
+            ray.cancel(ref, force=True)
+            raise
+        return sol
+
+    async def _execute_actor(self, job):
+        if self._idle_actors is None:
+            self._start_actors()
+
+        idle_actors = self._idle_actors
+        actor = await idle_actors.get()
+        job.add_event(trace.DISPATCHED)
+        try:
+            sol = await asyncio.wait_for(
+                actor.execute.remote(self._worker_config(job), self.tracing),
+                timeout=self.job_timeout,
+            )
+        except (ray.exceptions.RayActorError, asyncio.CancelledError, asyncio.TimeoutError):
+            # the actor died or is killed because the job was cancelled, it is replaced by a new one
+            # unless the actors were killed by "close" in the meantime
+            if actor in self._actors:
+                self._actors.remove(actor)
+                ray.kill(actor)
+            actor = self._create_actor() if self._idle_actors is idle_actors else None
+            raise
+        finally:
+            if actor is not None and self._idle_actors is idle_actors:
+                idle_actors.put_nowait(actor)
+
+        return sol
+
+    def close(self):
+        for actor in self._actors:
+            ray.kill(actor)
+        self._actors = []
+        self._idle_actors = None
@@ -0,0 +1,118 @@
+import csv
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ResultsWriter:
+    """Append rows of evaluations to a CSV file from a background thread.
+
+    The columns of the file are the keys of the rows in their order of appearance, missing values are left empty. When a row has keys which are not columns yet, the file written so far is rewritten with the new columns through a temporary file (once for each new key). The file is flushed after each batch of rows and synchronized to disk (``fsync``) at most every ``fsync_interval`` seconds.
+
+    Args:
+        path (str): path of the CSV file, an existing file is overwritten.
+        fsync_interval (float, optional): minimum number of seconds between two synchronizations of the file to disk. Defaults to ``1.0``.
+    """
+
+    def __init__(self, path: str, fsync_interval: float = 1.0):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.columns = None
+        self._queue = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, rows: list):
+        """Schedule the writing of ``rows`` (a list of ``dict``), returns immediately."""
+        if self._error is not None:
+            raise self._error
+        if len(rows) > 0:
+            if self.columns is None:
+                self.columns = []
+            for row in rows:
+                for key in row:
+                    if not key in self.columns:
+                        self.columns.append(key)
+            self._queue.put((rows, list(self.columns)))
+
+    def flush(self):
+        """Block until all the scheduled rows are written to the file."""
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        """Write the remaining rows, synchronize the file to disk and stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        fp = open(self.path, "w+", newline="")
+        try:
+            writer = None
+            last_fsync = time.time()
+            unsynced = False
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.fsync_interval)
+                except queue.Empty:
+                    if unsynced:
+                        os.fsync(fp.fileno())
+                        last_fsync, unsynced = time.time(), False
+                    continue
+
+                try:
+                    if item is None:
+                        fp.flush()
+                        os.fsync(fp.fileno())
+                        break
+
+                    rows, columns = item
+                    if writer is None:
+                        writer = csv.DictWriter(fp, columns, restval="")
+                        writer.writeheader()
+                    elif columns != writer.fieldnames:
+                        fp, writer = self._add_columns(fp, columns)
+                    writer.writerows(rows)
+                    unsynced = True
+
+                    if self._queue.empty():
+                        fp.flush()
+                    if time.time() - last_fsync >= self.fsync_interval:
+                        fp.flush()
+                        os.fsync(fp.fileno())
+                        last_fsync, unsynced = time.time(), False
+                except Exception as e:
+                    logger.error(f"Failed to write results to {self.path}: {e}")
+                    self._error = e
+                finally:
+                    self._queue.task_done()
+        finally:
+            fp.close()
+
+    def _add_columns(self, fp, columns: list) -> tuple:
+        """Rewrite the rows already written in ``fp`` with the new ``columns``. The rows are written in a temporary file which replaces the file once complete, a crash during the rewrite leaves the previous file intact. It happens once for each new key.
+
+        Returns:
+            tuple: ``(fp, writer)`` the file opened to append the next rows and its writer.
+        """
+        fp.flush()
+        fp.seek(0)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", newline="") as tmp_fp:
+            writer = csv.DictWriter(tmp_fp, columns, restval="")
+            writer.writeheader()
+            writer.writerows(csv.DictReader(fp))
+            tmp_fp.flush()
+            os.fsync(tmp_fp.fileno())
+        fp.close()
+        os.replace(tmp_path, self.path)
+
+        fp = open(self.path, "a+", newline="")
+        return fp, csv.DictWriter(fp, columns, restval="")
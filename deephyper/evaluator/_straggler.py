@@ -0,0 +1,52 @@
+import numpy as np
+from deephyper.core.exceptions import DeephyperRuntimeError
+
+
+class StragglerPolicy:
+    """Policy applied by the ``Evaluator`` to the jobs running much longer than the others (stragglers). A running job is a straggler when its runtime exceeds ``factor`` times the ``quantile`` of the durations of the completed jobs. Runtimes and durations are measured from the dispatch of the job to a worker, the jobs waiting for a free worker are never stragglers.
+
+    Args:
+        quantile (float, optional): quantile of the durations of the completed jobs used as reference. Defaults to ``0.9``.
+        factor (float, optional): multiplicative factor applied to the reference duration. Defaults to ``2.0``.
+        action (str, optional): ``"drop"`` cancels the stragglers, they are then gathered with the ``Job.TIMEOUT`` status. ``"relaunch"`` speculatively executes a copy of each straggler and keeps the result of the execution which completes first. Defaults to ``"drop"``.
+        min_completed (int, optional): number of completed jobs required before detecting stragglers. Defaults to ``10``.
+        check_interval (float, optional): maximum number of seconds between two detections while the evaluator waits for jobs. Defaults to ``1.0``.
+
+    An example usage can be:
+
+    >>> evaluator = Evaluator.create(run, method="subprocess", method_kwargs={...}, straggler_policy=StragglerPolicy(action="relaunch"))
+    """
+
+    ACTIONS = ["drop", "relaunch"]
+
+    def __init__(
+        self,
+        quantile: float = 0.9,
+        factor: float = 2.0,
+        action: str = "drop",
+        min_completed: int = 10,
+        check_interval: float = 1.0,
+    ):
+        if not action in StragglerPolicy.ACTIONS:
+            raise DeephyperRuntimeError(
+                f'The action "{action}" is not a valid straggler action!'
+                f" Choose among: {', '.join(StragglerPolicy.ACTIONS)}."
+            )
+        self.quantile = quantile
+        self.factor = factor
+        self.action = action
+        self.min_completed = min_completed
+        self.check_interval = check_interval
+
+    def threshold(self, durations: list) -> float:
+        """Compute the runtime above which a running job is a straggler.
+
+        Args:
+            durations (list): durations (in seconds) of the completed jobs.
+
+        Returns:
+            float: the runtime threshold in seconds, ``None`` if not enough jobs are completed.
+        """
+        if len(durations) < max(self.min_completed, 1):
+            return None
+        return self.factor * float(np.quantile(durations, self.quantile))
@@ -5,61 +5,198 @@ import inspect
 import re
 import json
 import os
+import pickle
 
+from deephyper.evaluator import trace
 from deephyper.evaluator._evaluator import Evaluator
 from deephyper.evaluator._encoder import Encoder
+from deephyper.evaluator import _subprocess_worker
 
 logger = logging.getLogger(__name__)
 
 
+class _PersistentWorker:
+    """A long-lived Python interpreter which imported the ``run_function`` once and evaluates jobs received through its standard input.
+
+    :meta private:
+    """
+
+    def __init__(self, proc):
+        self.proc = proc
+        self.num_jobs = 0
+
+    @classmethod
+    async def start(cls, module_path, module_name, function_name):
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            _subprocess_worker.__file__,
+            module_path,
+            module_name,
+            function_name,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        return cls(proc)
+
+    @property
+    def alive(self):
+        return self.proc.returncode is None
+
+    async def run(self, config):
+        self.num_jobs += 1
+        self.proc.stdin.write(_subprocess_worker.pack(config))
+        await self.proc.stdin.drain()
+        header = await self.proc.stdout.readexactly(_subprocess_worker.HEADER.size)
+        (size,) = _subprocess_worker.HEADER.unpack(header)
+        payload = await self.proc.stdout.readexactly(size)
+        return pickle.loads(payload)
+
+    async def close(self):
+        if self.alive:
+            self.proc.stdin.close()
+            try:
+                await asyncio.wait_for(self.proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.proc.kill()
+                await self.proc.wait()
+
+
 class SubprocessEvaluator(Evaluator):
     """This evaluator uses the ``asyncio.create_subprocess_exec`` as backend.
 
+    By default a new Python interpreter is started for each job. With ``persistent=True`` the evaluator keeps ``num_workers`` long-lived interpreters which import the module of the ``run_function`` only once, jobs and results are then exchanged through pipes with a length-prefixed binary protocol.
+
+    The process executing a job which is cancelled or timed out is killed. The phases recorded inside the ``run_function`` are not collected by this evaluator.
+
     Args:
         run_function (callable): functions to be executed by the ``Evaluator``.
         num_workers (int, optional): Number of parallel processes used to compute the ``run_function``. Defaults to 1.
         callbacks (list, optional): A list of callbacks to trigger custom actions at the creation or completion of jobs. Defaults to None.
+        persistent (bool, optional): If ``True`` the worker processes are reused across jobs. Defaults to ``False``.
+        max_jobs_per_worker (int, optional): Number of jobs executed by a persistent worker before it is replaced by a new one. Defaults to ``None``, workers are only replaced when they crash.
     """
 
-    def __init__(self, run_function, num_workers: int=1, callbacks=None):
+    def __init__(
+        self,
+        run_function,
+        num_workers: int = 1,
+        callbacks=None,
+        persistent: bool = False,
+        max_jobs_per_worker: int = None,
+    ):
         super().__init__(run_function, num_workers, callbacks)
         self.sem = asyncio.Semaphore(num_workers)
+        self.persistent = persistent
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._workers = set()  # All persistent workers currently started.
+        self._idle_workers = []  # Persistent workers waiting for a job.
         logger.info(
             f"Subprocess Evaluator will execute {self.run_function.__name__}() from module {self.run_function.__module__}"
         )
 
     def _encode(self, job):
-        return json.loads(json.dumps(job.config, cls=Encoder))
+        return json.loads(json.dumps(self._worker_config(job), cls=Encoder))
+
+    def _run_function_location(self):
+        # Retrieve the path of the module holding the user-defined function given to the async evaluator.
+        # Pass this module path to the subprocess to add to its python path and use.
+        script_file = inspect.getfile(sys.modules[self.run_function.__module__])
+        module_path = os.path.dirname(script_file)
+        module_name = os.path.basename(script_file)[:-3]
+        return module_path, module_name, self.run_function.__name__
 
     async def execute(self, job):
         async with self.sem:
+            job.add_event(trace.DISPATCHED)
 
-            # Retrieve the path of the module holding the user-defined function given to the async evaluator.
-            # Pass this module path to the subprocess to add to its python path and use.
-            script_file = inspect.getfile(sys.modules[self.run_function.__module__])
-            module_path = os.path.dirname(script_file)
-            module_name = os.path.basename(script_file)[:-3]
-            # Code that will run on the subprocess.
-            code = f"import sys; sys.path.insert(1, '{module_path}'); from {module_name} import {self.run_function.__name__}; print('DH-OUTPUT:' + str({self.run_function.__name__}({self._encode(job)})))"
-            logger.debug(f"executing:  {code}")
-            proc = await asyncio.create_subprocess_exec(
-                sys.executable, '-c', code,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE)
-            # Retrieve the stdout byte array from the (stdout, stderr) tuple returned from the subprocess.
-            stdout, stderr = await proc.communicate()
-            # Search through the byte array using a regular expression and collect the return value of the user-defined function.
-            try:
-                retval_bytes = re.search(b'DH-OUTPUT:(.+)\n', stdout).group(1)
-            except AttributeError:
-                error = stderr.decode("utf-8")
-                raise RuntimeError(f"{error}\n\n Could not collect any result from the run_function in the main process because an error happened in the subprocess.")
-            # Finally, parse whether the return value from the user-defined function is a scalar, a list, or a dictionary.
-            retval = retval_bytes.replace(b"\'", b"\"") # For dictionaries, replace single quotes with double quotes!
-            sol = json.loads(retval)
+            if self.persistent:
+                execution = self._execute_persistent(job)
+            else:
+                execution = self._execute_subprocess(job)
+            # the execution is cancelled when it times out, its process is then killed
+            sol = await asyncio.wait_for(execution, timeout=self.job_timeout)
+
+            job.result = sol
 
+        return job
+
+    async def _execute_subprocess(self, job):
+        module_path, module_name, function_name = self._run_function_location()
+        # Code that will run on the subprocess.
+        code = f"import sys; sys.path.insert(1, '{module_path}'); from {module_name} import {function_name}; print('DH-OUTPUT:' + str({function_name}({self._encode(job)})))"
+        logger.debug(f"executing:  {code}")
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, '-c', code,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE)
+        # Retrieve the stdout byte array from the (stdout, stderr) tuple returned from the subprocess.
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            # the job was cancelled or timed out
+            proc.kill()
             await proc.wait()
+            raise
+        # Search through the byte array using a regular expression and collect the return value of the user-defined function.
+        try:
+            retval_bytes = re.search(b'DH-OUTPUT:(.+)\n', stdout).group(1)
+        except AttributeError:
+            error = stderr.decode("utf-8")
+            raise RuntimeError(f"{error}\n\n Could not collect any result from the run_function in the main process because an error happened in the subprocess.")
+        # Finally, parse whether the return value from the user-defined function is a scalar, a list, or a dictionary.
+        retval = retval_bytes.replace(b"\'", b"\"") # For dictionaries, replace single quotes with double quotes!
+        sol = json.loads(retval)
 
-            job.result = sol
+        await proc.wait()
+
+        return sol
+
+    async def _execute_persistent(self, job):
+        if len(self._idle_workers) > 0:
+            worker = self._idle_workers.pop()
+        else:
+            worker = await _PersistentWorker.start(*self._run_function_location())
+            self._workers.add(worker)
+
+        try:
+            status, sol = await worker.run(self._worker_config(job))
+        except asyncio.CancelledError:
+            # the job was cancelled or timed out, the busy worker is killed
+            self._workers.discard(worker)
+            worker.proc.kill()
+            await worker.proc.wait()
+            raise
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # the worker crashed, it is discarded and a new one will be started for the next job
+            self._workers.discard(worker)
+            await worker.close()
+            raise RuntimeError(
+                f"The persistent worker (pid={worker.proc.pid}) crashed while executing job {job.id}, returncode={worker.proc.returncode}."
+            )
+
+        if (
+            self.max_jobs_per_worker is not None
+            and worker.num_jobs >= self.max_jobs_per_worker
+        ):
+            self._workers.discard(worker)
+            await worker.close()
+        else:
+            self._idle_workers.append(worker)
+
+        if status == _subprocess_worker.STATUS_ERROR:
+            raise RuntimeError(
+                f"{sol}\n\n Could not collect any result from the run_function in the main process because an error happened in the subprocess."
+            )
+
+        return sol
+
+    async def _close_workers(self):
+        workers = list(self._workers)
+        self._workers.clear()
+        self._idle_workers.clear()
+        await asyncio.gather(*[worker.close() for worker in workers])
 
-        return job
\ No newline at end of file
+    def close(self):
+        if len(self._workers) > 0:
+            loop = asyncio.get_event_loop()
+            loop.run_until_complete(self._close_workers())
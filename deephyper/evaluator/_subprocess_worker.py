@@ -0,0 +1,71 @@
+"""Persistent worker used by the ``SubprocessEvaluator`` when ``persistent=True``.
+
+The worker is started once with the location of the ``run_function`` and then serves jobs sent by the evaluator until its standard input is closed. Messages are exchanged through the standard input/output of the worker with a length-prefixed binary protocol: an 8 bytes big-endian header giving the size of the payload followed by the pickled payload.
+
+This module is executed as a script by the evaluator and must only depend on the Python standard library.
+"""
+import os
+import pickle
+import struct
+import sys
+import traceback
+
+HEADER = struct.Struct("!Q")
+
+# Status of the messages sent back to the evaluator
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+def pack(obj) -> bytes:
+    """Serialize ``obj`` as a length-prefixed message."""
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return HEADER.pack(len(payload)) + payload
+
+
+def read_message(stream):
+    """Read a message from a binary ``stream``. Returns ``None`` when the stream is closed."""
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    (size,) = HEADER.unpack(header)
+    payload = stream.read(size)
+    if len(payload) < size:
+        return None
+    return pickle.loads(payload)
+
+
+def main(module_path: str, module_name: str, function_name: str):
+    # The protocol uses the original standard output, everything printed by the
+    # run-function (including C extensions) is redirected to standard error.
+    channel_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    channel_in = sys.stdin.buffer
+
+    sys.path.insert(1, module_path)
+    module = __import__(module_name, fromlist=[function_name])
+    run_function = getattr(module, function_name)
+
+    while True:
+        config = read_message(channel_in)
+        if config is None:
+            break
+
+        try:
+            message = (STATUS_OK, run_function(config))
+        except Exception:
+            message = (STATUS_ERROR, traceback.format_exc())
+
+        try:
+            data = pack(message)
+        except Exception:
+            data = pack((STATUS_ERROR, traceback.format_exc()))
+
+        channel_out.write(data)
+        channel_out.flush()
+
+
+if __name__ == "__main__":
+    # same search path as "python -c": the current directory replaces the directory of this script
+    sys.path[0] = ""
+    main(*sys.argv[1:4])
@@ -1,6 +1,7 @@
 import logging
 import asyncio
 
+from deephyper.evaluator import trace
 from deephyper.evaluator._evaluator import Evaluator
 
 from concurrent.futures import ThreadPoolExecutor
@@ -13,29 +14,57 @@ class ThreadPoolEvaluator(Evaluator):
 
     .. warning:: This evaluator is interesting with I/O intensive tasks, do not expect a speed-up with compute intensive tasks.
 
+    A single pool of ``num_workers`` threads is shared by all the jobs. It is created at the first submission and shut down by ``close()``. A thread cannot be interrupted: when a job is cancelled or timed out its thread completes the evaluation in the background and the result is discarded.
+
     Args:
         run_function (callable): functions to be executed by the ``Evaluator``.
         num_workers (int, optional): Number of concurrent threads used to compute the ``run_function``. Defaults to 1.
         callbacks (list, optional): A list of callbacks to trigger custom actions at the creation or completion of jobs. Defaults to None.
+        initializer (callable, optional): A function called once at the start of each worker thread. Defaults to None.
+        initargs (tuple, optional): Arguments passed to ``initializer``. Defaults to ``()``.
     """
 
-    def __init__(self, run_function, num_workers: int=1, callbacks=None):
+    def __init__(
+        self,
+        run_function,
+        num_workers: int = 1,
+        callbacks=None,
+        initializer=None,
+        initargs=(),
+    ):
         super().__init__(run_function, num_workers, callbacks)
         self.sem = asyncio.Semaphore(num_workers)
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor = None
         logger.info(
             f"ThreadPool Evaluator will execute {self.run_function.__name__}() from module {self.run_function.__module__}"
         )
 
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return self._executor
+
     async def execute(self, job):
         async with self.sem:
+            job.add_event(trace.DISPATCHED)
 
-            executor = ThreadPoolExecutor(max_workers=1)
-
-            sol = await self.loop.run_in_executor(executor, job.run_function, job.config)
+            sol = await asyncio.wait_for(
+                self.loop.run_in_executor(self.executor, *self._worker_args(job)),
+                timeout=self.job_timeout,
+            )
 
             job.result = sol
 
         return job
 
-
-
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,119 @@
+"""The cache module contains sub-classes of the ``Cache`` class used to memoize the results of the ``run_function``. When a configuration was already evaluated the ``Evaluator`` answers the job with the cached result without sending it to a worker. Caches can be used with any Evaluator implementation.
+
+An example usage can be:
+
+>>> evaluator = Evaluator.create(run, method="ray", method_kwargs={...}, cache=LRUCache(maxsize=10000))
+"""
+import collections
+import hashlib
+import json
+import pickle
+import sqlite3
+
+from deephyper.evaluator._encoder import Encoder
+
+#: Keys of a configuration which do not change the result of the ``run_function``.
+DEFAULT_EXCLUDED_KEYS = ("id", "log_dir", "seed", "verbose")
+
+
+class Cache:
+    """Interface of the storage used to memoize the results of the ``run_function``.
+
+    Args:
+        excluded_keys (tuple, optional): Keys of the configuration ignored when computing its hash. Defaults to ``("id", "log_dir", "seed", "verbose")``.
+    """
+
+    def __init__(self, excluded_keys=DEFAULT_EXCLUDED_KEYS):
+        self.excluded_keys = set(excluded_keys)
+
+    def key(self, config: dict) -> str:
+        """Compute the canonical hash of a configuration.
+
+        Args:
+            config (dict): The configuration of a job.
+
+        Returns:
+            str: The hexadecimal digest identifying the configuration.
+        """
+        cfg = {k: v for k, v in config.items() if k not in self.excluded_keys}
+        data = json.dumps(cfg, cls=Encoder, sort_keys=True)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Return the result stored for ``key``.
+
+        Raises:
+            KeyError: if no result is stored for ``key``.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value):
+        """Store the result ``value`` for ``key``."""
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+class LRUCache(Cache):
+    """In-memory cache which discards the least recently used results when it is full.
+
+    Args:
+        maxsize (int, optional): Maximum number of results to store. Defaults to ``None`` for an unbounded cache.
+        excluded_keys (tuple, optional): Keys of the configuration ignored when computing its hash. Defaults to ``("id", "log_dir", "seed", "verbose")``.
+    """
+
+    def __init__(self, maxsize: int = None, excluded_keys=DEFAULT_EXCLUDED_KEYS):
+        super().__init__(excluded_keys)
+        self.maxsize = maxsize
+        self._data = collections.OrderedDict()
+
+    def get(self, key: str):
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteCache(Cache):
+    """On-disk cache stored in a SQLite database. The same database can be shared by successive or concurrent searches.
+
+    Args:
+        path (str, optional): Path of the database file. Defaults to ``"cache.db"``.
+        excluded_keys (tuple, optional): Keys of the configuration ignored when computing its hash. Defaults to ``("id", "log_dir", "seed", "verbose")``.
+    """
+
+    def __init__(self, path: str = "cache.db", excluded_keys=DEFAULT_EXCLUDED_KEYS):
+        super().__init__(excluded_keys)
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=60)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str):
+        row = self._conn.execute(
+            "SELECT value FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+            (key, sqlite3.Binary(pickle.dumps(value))),
+        )
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
@@ -23,6 +23,22 @@ class Callback:
         """
         ...
 
+    def on_cache_hit(self, job):
+        """Called each time the result of a ``Job`` is found in the cache of the ``Evaluator``.
+
+        Args:
+            job (Job): The job answered from the cache.
+        """
+        ...
+
+    def on_cache_miss(self, job):
+        """Called each time the result of a ``Job`` is not found in the cache of the ``Evaluator``.
+
+        Args:
+            job (Job): The job sent to a worker.
+        """
+        ...
+
 
 class ProfilingCallback(Callback):
     """Collect profiling data. Each time a ``Job`` is completed by the ``Evaluator`` a timestamp and current number of running jobs is collected.
@@ -0,0 +1,69 @@
+"""The report module lets a ``run_function`` report the intermediate objectives of a job trained with an increasing budget (e.g., the validation accuracy after each training epoch). The reports are sent back with the result of the job and collected by the ``Evaluator`` in ``job.reports`` as a list of ``(budget, objective)``, they are used by the multi-fidelity schedulers of ``deephyper.search``:
+
+>>> from deephyper.evaluator.report import Reporter
+>>> def run(config):
+...     reporter = Reporter(config)
+...     for epoch in range(config["initial_budget"], config["budget"]):
+...         objective = train_one_epoch(...)
+...         if reporter.record(epoch + 1, objective):
+...             break
+...     return reporter.result(objective)
+
+When the evaluator is created with an ``EarlyDiscarding`` policy, ``record`` returns ``True`` once the job is not expected to finish among the best completed jobs, its training should then be stopped. The reports are not collected with the ``"subprocess"`` backend when ``persistent=False``, only the objective is received.
+"""
+from deephyper.evaluator._early_discarding import EARLY_DISCARDING, EarlyDiscarding
+
+
+class ReportedResult:
+    """Result of a ``run_function`` sent back to the ``Evaluator`` with its intermediate objectives.
+
+    :meta private:
+    """
+
+    def __init__(self, result, reports: list, discarded: bool = False):
+        self.result = result
+        self.reports = reports
+        self.discarded = discarded
+
+    def __str__(self):
+        # the non-persistent "subprocess" backend parses the printed result
+        return str(self.result)
+
+
+class Reporter:
+    """Collect the intermediate objectives of a job inside its ``run_function``.
+
+    Args:
+        config (dict, optional): the configuration of the job, it holds the rule of the ``EarlyDiscarding`` policy of the evaluator. Defaults to ``None``, the job is never discarded.
+    """
+
+    def __init__(self, config: dict = None):
+        self.reports = []
+        self.discarded = False
+        self._rule = None if config is None else config.get(EARLY_DISCARDING)
+
+    def record(self, budget, objective) -> bool:
+        """Record the objective of the job once ``budget`` was spent.
+
+        Args:
+            budget (int|float): the budget spent so far (e.g., the number of training epochs).
+            objective (float): the objective at this budget.
+
+        Returns:
+            bool: ``True`` if the job is discarded, its training should be stopped.
+        """
+        self.reports.append((budget, objective))
+        if self._rule is not None and not self.discarded:
+            self.discarded = EarlyDiscarding.discard(self._rule, self.reports)
+        return self.discarded
+
+    def result(self, objective) -> ReportedResult:
+        """Create the value returned by the ``run_function``.
+
+        Args:
+            objective (float): the final objective of the job.
+
+        Returns:
+            ReportedResult: the final objective with the recorded reports.
+        """
+        return ReportedResult(objective, list(self.reports), self.discarded)
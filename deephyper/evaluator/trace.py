@@ -0,0 +1,177 @@
+"""The trace module records the timestamped phases of the jobs executed by the ``Evaluator``. Each ``Job`` carries a list of ``(phase, timestamp)`` events in ``job.events``:
+
+* ``submitted``, ``dispatched`` (a worker is available), ``returned`` and ``gathered`` are recorded by the ``Evaluator`` for every backend.
+* ``started`` and the phases recorded with :func:`record` inside the ``run_function`` (e.g., ``data_loaded``, ``model_built`` and ``trained`` by the neural architecture search run-functions) are collected when the evaluator is created with ``tracing=True``. They are not available with the ``"subprocess"`` backend.
+
+The traces can be exported to the Chrome trace format (viewed in ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_) and summarized:
+
+>>> evaluator = Evaluator.create(run, method="ray", method_kwargs={...}, tracing=True)
+...
+>>> evaluator.save_trace("trace.json")
+>>> evaluator.get_trace_summary()
+
+Timestamps are given by the clock of the process recording the phase, phases recorded by workers running on other nodes can be shifted by the difference between the clocks.
+"""
+import collections
+import json
+import threading
+import time
+
+# Phases of a job, in their order of occurrence
+SUBMITTED = "submitted"
+DISPATCHED = "dispatched"
+STARTED = "started"
+DATA_LOADED = "data_loaded"
+MODEL_BUILT = "model_built"
+TRAINED = "trained"
+RETURNED = "returned"
+GATHERED = "gathered"
+
+_local = threading.local()
+
+
+def record(phase: str):
+    """Record the end of ``phase`` for the job executed by the current worker. It does nothing if the ``run_function`` is not traced, it can then be called unconditionally.
+
+    Args:
+        phase (str): name of the phase (e.g., ``"data_loaded"``).
+    """
+    events = getattr(_local, "events", None)
+    if events is not None:
+        events.append((phase, time.time()))
+
+
+class TracedResult:
+    """Result of a traced ``run_function`` sent back to the ``Evaluator`` with the phases recorded by the worker.
+
+    :meta private:
+    """
+
+    def __init__(self, result, events: list):
+        self.result = result
+        self.events = events
+
+
+def run_traced(run_function, config):
+    """Execute ``run_function(config)`` while collecting the phases given to :func:`record`.
+
+    :meta private:
+    """
+    _local.events = [(STARTED, time.time())]
+    try:
+        result = run_function(config)
+        return TracedResult(result, _local.events)
+    finally:
+        _local.events = None
+
+
+def _spans(job):
+    """Yield the ``(phase, start, end)`` intervals of ``job``, each interval is named after the phase which ends it."""
+    for (_, start), (phase, end) in zip(job.events[:-1], job.events[1:]):
+        yield phase, start, max(start, end)
+
+
+def to_chrome_trace(jobs: list, search_spans: list = ()) -> dict:
+    """Convert the phases of ``jobs`` to the Chrome trace format. Jobs are placed on the rows of a timeline so that concurrent jobs never share a row.
+
+    Args:
+        jobs (list(Job)): the traced jobs.
+        search_spans (list, optional): ``(name, start, end)`` intervals spent by the search (e.g., fitting its surrogate model). Defaults to ``()``.
+
+    Returns:
+        dict: the trace which can be saved as JSON.
+    """
+    trace_events = [
+        {"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "search"}},
+        {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "jobs"}},
+    ]
+
+    for name, start, end in search_spans:
+        trace_events.append(
+            {
+                "name": name,
+                "cat": "search",
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 0,
+                "tid": 0,
+            }
+        )
+
+    rows_end = []  # End timestamp of the last job placed on each row.
+    traced_jobs = [job for job in jobs if len(job.events) > 1]
+    for job in sorted(traced_jobs, key=lambda job: job.events[0][1]):
+        start, end = job.events[0][1], job.events[-1][1]
+        row = next((i for i, t in enumerate(rows_end) if t <= start), len(rows_end))
+        if row == len(rows_end):
+            rows_end.append(end)
+        else:
+            rows_end[row] = end
+
+        for phase, t_start, t_end in _spans(job):
+            trace_events.append(
+                {
+                    "name": phase,
+                    "cat": "job",
+                    "ph": "X",
+                    "ts": t_start * 1e6,
+                    "dur": (t_end - t_start) * 1e6,
+                    "pid": 1,
+                    "tid": row,
+                    "args": {"job_id": job.id},
+                }
+            )
+
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def save_chrome_trace(path: str, jobs: list, search_spans: list = ()):
+    """Save the phases of ``jobs`` as a Chrome trace JSON file, see :func:`to_chrome_trace`."""
+    with open(path, "w") as fp:
+        json.dump(to_chrome_trace(jobs, search_spans), fp)
+
+
+def summary(jobs: list, num_workers: int, search_spans: list = ()) -> dict:
+    """Summarize the traces of ``jobs``.
+
+    Args:
+        jobs (list(Job)): the traced jobs.
+        num_workers (int): number of workers of the evaluator.
+        search_spans (list, optional): ``(name, start, end)`` intervals spent by the search. Defaults to ``()``.
+
+    Returns:
+        dict: with keys ``"worker_utilization"`` the fraction of the time the workers were busy (from the first start of a job to the last return), ``"phase_durations"`` the mean duration of each phase and ``"search_overhead"`` the total time of the search intervals by name (all durations in seconds).
+    """
+    busy = 0
+    first_start, last_return = None, None
+    phase_durations = collections.defaultdict(list)
+    for job in jobs:
+        events = dict(job.events)
+        # a worker is busy from the start of the job, if it was recorded by the worker, or from its dispatch
+        start = events.get(STARTED, events.get(DISPATCHED))
+        if start is not None and RETURNED in events:
+            busy += events[RETURNED] - start
+            if first_start is None or start < first_start:
+                first_start = start
+            if last_return is None or events[RETURNED] > last_return:
+                last_return = events[RETURNED]
+        for phase, t_start, t_end in _spans(job):
+            phase_durations[phase].append(t_end - t_start)
+
+    utilization = None
+    if first_start is not None and last_return > first_start:
+        utilization = busy / (num_workers * (last_return - first_start))
+
+    search_overhead = collections.defaultdict(float)
+    for name, start, end in search_spans:
+        search_overhead[name] += end - start
+
+    return {
+        "worker_utilization": utilization,
+        "phase_durations": {
+            phase: sum(durations) / len(durations)
+            for phase, durations in phase_durations.items()
+        },
+        "search_overhead": dict(search_overhead),
+    }
@@ -1,4 +1,5 @@
 from ._nx_search_space import NxSearchSpace
 from ._keras_search_space import KSearchSpace
+from ._supernet import Supernet
 
-__all__ = ["NxSearchSpace", "KSearchSpace"]
\ No newline at end of file
+__all__ = ["NxSearchSpace", "KSearchSpace", "Supernet"]
\ No newline at end of file
@@ -0,0 +1,202 @@
+import copy
+
+import tensorflow as tf
+from deephyper.core.exceptions.nas.space import (
+    StructureHasACycle,
+    WrongSequenceToSetOperations,
+)
+from deephyper.nas.node import ConstantNode, MimeNode, MirrorNode, VariableNode
+from deephyper.nas.operation import Tensor
+
+# Nodes whose operations can be resolved from the choices without setting them
+COMPILED_NODE_TYPES = (ConstantNode, VariableNode, MirrorNode, MimeNode)
+
+
+class CompiledSearchSpace:
+    """Immutable representation of the graph of a search space used to create the tensors of its architectures without copying it. The nodes are indexed in the order of the graph with the indexes of their predecessors, and the connections created by the operations of the variable and mime nodes when they are set (e.g., ``Connect``) are recorded once for each operation.
+
+    The tensors of an architecture are created from the outputs in the same order as ``NxSearchSpace.create_tensor_aux``. Only the selected operations are copied (their Keras layers are created for each architecture), the search space, its nodes and the input tensors referenced by the operations are shared.
+
+    Args:
+        space (NxSearchSpace): the built search space.
+
+    Raises:
+        ValueError: if the search space has nodes or operations which cannot be compiled, it has to be copied to create an architecture.
+    """
+
+    def __init__(self, space):
+        graph = space.graph
+        nodes = list(graph.nodes)
+        unknown = [n for n in nodes if not type(n) in COMPILED_NODE_TYPES]
+        if len(unknown) > 0:
+            raise ValueError(f"The node {unknown[0]} of type {type(unknown[0])} cannot be compiled!")
+        index = {node: i for i, node in enumerate(nodes)}
+
+        self.nodes = tuple(nodes)
+        self.preds = tuple(tuple(index[p] for p in graph.predecessors(n)) for n in nodes)
+        self.variables = tuple(index[n] for n in space.variable_nodes)
+        self.mimes = tuple(index[n] for n in space.mime_nodes)
+        try:
+            self.sources = {
+                i: index[n._node] if type(n) is MirrorNode else index[n.node]
+                for i, n in enumerate(nodes)
+                if type(n) in (MirrorNode, MimeNode)
+            }
+        except KeyError:
+            raise ValueError("A mirror or mime node has a source out of the search space!")
+        if any(not self.sources[i] in self.variables for i in self.mimes):
+            raise ValueError("The source of a mime node is not a variable node!")
+
+        if space.output_node is None:
+            self.outputs = None  # Nodes without successors, which depend on the choices.
+        elif type(space.output_node) is list:
+            self.outputs = [index[n] for n in space.output_node]
+        else:
+            self.outputs = index[space.output_node]
+
+        self.op_edges = self._record_op_edges(space, index)
+
+        # objects shared by the architectures instead of being copied with the operations
+        self._memo = {id(space): space, id(graph): graph}
+        for node in nodes:
+            self._memo[id(node)] = node
+            if type(node) is ConstantNode and isinstance(node.op, Tensor):
+                self._memo[id(node.op)] = node.op
+
+    def _record_op_edges(self, space, index) -> dict:
+        """Set each operation of the variable and mime nodes with the connections of the search space recorded instead of being added to its graph."""
+        graph = space.graph
+        edges_before = set(graph.edges)
+        op_edges = {}
+        edges = []
+
+        def record(node1, node2):
+            if not (node1 in index and node2 in index):
+                raise ValueError("An operation connects a node out of the search space!")
+            edges.append((index[node1], index[node2]))
+
+        space.connect = record
+        try:
+            for i in self.variables + self.mimes:
+                for k, op in enumerate(self.nodes[i].ops):
+                    edges.clear()
+                    op.init(self.nodes[i])
+                    op_edges[(i, k)] = tuple(edges)
+        finally:
+            del space.connect
+
+        added = set(graph.edges) - edges_before
+        if len(added) > 0:
+            graph.remove_edges_from(added)
+            raise ValueError("An operation modifies the graph without 'connect'!")
+        return op_edges
+
+    def create_tensors(self, choice: list, layers: dict = None, ops: dict = None):
+        """Create the output tensors of an architecture.
+
+        Args:
+            choice (list): the index of the operation of each variable node.
+            layers (dict, optional): filled with the Keras layer of each operation created from a layer (e.g., ``operation(tf.keras.layers.Dense)``), indexed by ``(node_index, op_index)``. Defaults to None.
+            ops (dict, optional): the operations shared with the previous architectures (e.g., by a ``Supernet``), indexed by ``(node_index, op_index, input_shapes)``, the missing operations are copied and added. Defaults to None, the operations are copied for each architecture.
+
+        Raises:
+            WrongSequenceToSetOperations: if ``choice`` does not have one index for each variable node.
+            StructureHasACycle: if the connections of the selected operations create a cycle.
+
+        Returns:
+            tensor|list: the output tensor(s).
+        """
+        if len(choice) != len(self.variables):
+            raise WrongSequenceToSetOperations(
+                choice, [self.nodes[i] for i in self.variables]
+            )
+
+        # index of the selected operation of the variable and mime nodes
+        selected = {
+            i: self.nodes[i].op_index(c) for i, c in zip(self.variables, choice)
+        }
+        for i in self.mimes:
+            selected[i] = selected[self.sources[i]]
+
+        preds = [list(p) for p in self.preds]
+        for i in self.variables + self.mimes:
+            for src, dst in self.op_edges[(i, selected[i])]:
+                if not src in preds[dst]:
+                    preds[dst].append(src)
+
+        outputs = self.outputs
+        if outputs is None:
+            has_succ = [False] * len(self.nodes)
+            for p in preds:
+                for j in p:
+                    has_succ[j] = True
+            outputs = [i for i in range(len(self.nodes)) if not has_succ[i]]
+            if len(outputs) == 1:
+                outputs = outputs[0]
+
+        memo = dict(self._memo)
+        tensors = {}
+        for out in outputs if type(outputs) is list else [outputs]:
+            self._create_tensor(out, preds, selected, memo, tensors, layers, ops)
+
+        if type(outputs) is list:
+            return [tensors[i] for i in outputs]
+        return tensors[outputs]
+
+    def _op(self, i, selected):
+        node = self.nodes[i]
+        if type(node) is MirrorNode:
+            return self._op(self.sources[i], selected)
+        if type(node) is ConstantNode:
+            return node.op
+        return node.ops[selected[i]]
+
+    def _create_tensor(self, out, preds, selected, memo, tensors, layers, ops):
+        """Create the tensor of the node ``out`` after the tensors of its predecessors (depth-first, iteratively)."""
+        visiting = set()
+        stack = [(out, False)]
+        while len(stack) > 0:
+            i, expanded = stack.pop()
+            if i in tensors:
+                continue
+            if not expanded:
+                if i in visiting:
+                    raise StructureHasACycle(
+                        f"the node {self.nodes[i]} is in a cycle of the search_space's graph."
+                    )
+                visiting.add(i)
+                stack.append((i, True))
+                stack.extend((j, False) for j in reversed(preds[i]) if not j in tensors)
+                continue
+
+            visiting.discard(i)
+            inputs = []
+            for j in preds[i]:
+                if type(tensors[j]) is list:
+                    inputs.extend(tensors[j])
+                else:
+                    inputs.append(tensors[j])
+
+            if ops is None:
+                op = copy.deepcopy(self._op(i, selected), memo)
+            else:
+                # a mirror node shares the operation of its source
+                src = self.sources[i] if type(self.nodes[i]) is MirrorNode else i
+                key = (src, selected.get(src, 0), tuple(tuple(t.shape) for t in inputs))
+                if not key in ops:
+                    ops[key] = copy.deepcopy(self._op(i, selected), memo)
+                op = ops[key]
+
+            if len(preds[i]) == 0:
+                tensors[i] = op(train=None, seed=None)
+            else:
+                tensors[i] = op(inputs, train=None)
+
+            # the mirror nodes share the layer of their source
+            layer = getattr(op, "_layer", None)
+            if (
+                layers is not None
+                and type(self.nodes[i]) is not MirrorNode
+                and isinstance(layer, tf.keras.layers.Layer)
+            ):
+                layers[(i, selected.get(i, 0))] = layer
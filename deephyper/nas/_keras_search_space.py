@@ -9,9 +9,11 @@ from deephyper.core.exceptions.nas.space import (
     InputShapeOfWrongType,
     WrongSequenceToSetOperations,
 )
+from deephyper.nas._compiled_search_space import CompiledSearchSpace
 from deephyper.nas._nx_search_space import NxSearchSpace
 from deephyper.nas.node import ConstantNode
 from deephyper.nas.operation import Tensor
+from deephyper.nas._supernet import Supernet
 from tensorflow import keras
 from tensorflow.python.keras.utils.vis_utils import model_to_dot
 
@@ -97,6 +99,7 @@ class KSearchSpace(NxSearchSpace):
         self.output_node = None
 
         self._model = None
+        self._compiled = None  # (graph size, CompiledSearchSpace or None) of the last compilation.
 
     @property
     def input(self):
@@ -151,13 +154,21 @@ class KSearchSpace(NxSearchSpace):
         Returns:
             A keras.Model for the current search_space with the corresponding set of operations.
         """
-        #! the output layer does not have to be of the same shape as the data
-        #! this depends on the loss
         if type(self.output_node) is list:
             output_tensors = [
                 self.create_tensor_aux(self.graph, out) for out in self.output_node
             ]
+        else:
+            output_tensors = self.create_tensor_aux(self.graph, self.output_node)
+
+        input_tensors = [inode._tensor for inode in self.input_nodes]
+        self._model = self._create_keras_model(input_tensors, output_tensors)
+        return self._model
 
+    def _create_keras_model(self, input_tensors, output_tensors):
+        #! the output layer does not have to be of the same shape as the data
+        #! this depends on the loss
+        if type(output_tensors) is list:
             for out_T in output_tensors:
                 output_n = int(out_T.name.split("/")[0].split("_")[-1])
                 out_S = self.output_shape[output_n]
@@ -166,21 +177,46 @@ class KSearchSpace(NxSearchSpace):
                     if out_T_shape[1:] != out_S:
                         warnings.warn(f"The output tensor of shape {out_T_shape} doesn't match the expected shape {out_S}!", RuntimeWarning)
 
-            input_tensors = [inode._tensor for inode in self.input_nodes]
-
-            self._model = keras.Model(inputs=input_tensors, outputs=output_tensors)
+            return keras.Model(inputs=input_tensors, outputs=output_tensors)
         else:
-            output_tensors = self.create_tensor_aux(self.graph, self.output_node)
             if tf.keras.backend.is_keras_tensor(output_tensors):
                 output_tensors_shape = output_tensors.type_spec.shape
                 if output_tensors_shape[1:] != self.output_shape:
                     warnings.warn(f"The output tensor of shape {output_tensors_shape} doesn't match the expected shape {self.output_shape}!", RuntimeWarning)
 
-            input_tensors = [inode._tensor for inode in self.input_nodes]
+            return keras.Model(inputs=input_tensors, outputs=[output_tensors])
 
-            self._model = keras.Model(inputs=input_tensors, outputs=[output_tensors])
+    def compile(self):
+        """Compile the graph of the built search space in an immutable representation used by ``sample`` to create the models without copying the search space. It is called by ``sample`` and compiled again when nodes, connections or operations are added to the search space.
 
-        return self._model
+        Returns:
+            CompiledSearchSpace: the compiled graph, ``None`` if the search space cannot be compiled (e.g., it has custom nodes), ``sample`` then copies the search space.
+        """
+        key = (
+            self.graph.number_of_nodes(),
+            self.graph.number_of_edges(),
+            sum(n.num_ops for n in self.variable_nodes),
+            sum(n.num_ops for n in self.mime_nodes),
+        )
+        if self._compiled is None or self._compiled[0] != key:
+            try:
+                compiled = CompiledSearchSpace(self)
+            except ValueError as e:
+                logger.info(f"The search space is copied to create models: {e}")
+                compiled = None
+            self._compiled = (key, compiled)
+        return self._compiled[1]
+
+    def build_supernet(self, max_models: int = 1024) -> Supernet:
+        """Create the weight-sharing model of all the architectures of the built search space, it can be trained once to score the architectures without training them.
+
+        Args:
+            max_models (int, optional): Maximum number of models of architectures kept to be reused. Defaults to ``1024``.
+
+        Returns:
+            Supernet: the supernet of the search space.
+        """
+        return Supernet(self, max_models=max_models)
 
     def choices(self):
         """Gives the possible choices for each decision variable of the search space.
@@ -190,11 +226,12 @@ class KSearchSpace(NxSearchSpace):
         """
         return [(0, vnode.num_ops - 1) for vnode in self.variable_nodes]
 
-    def sample(self, choice=None):
+    def sample(self, choice=None, parent=None):
         """Sample a ``tf.keras.Model`` from the search space.
 
         Args:
             choice (list, optional): A list of decision for the operations of this search space. Defaults to None, will generate a random sample.
+            parent (tuple, optional): ``(parent_choice, weights_path)`` of a trained architecture, the layers of the operations selected by both ``choice`` and ``parent_choice`` are initialized with the weights of the parent when they have the same shapes (e.g., not the layers after a mutation changing the shape of their inputs). The weights are loaded with ``tf.keras.Model.load_weights``. Defaults to None, the weights are initialized randomly.
 
         Returns:
             tf.keras.Model: A Tensorflow Keras model.
@@ -203,8 +240,43 @@ class KSearchSpace(NxSearchSpace):
         if choice is None:
             choice = [self._random.randint(c[0], c[1]+1) for c in self.choices()]
 
-        self_copy = copy.deepcopy(self)
-        self_copy.set_ops(choice)
-        model = self_copy.create_model()
-
+        compiled = self.compile()
+        if compiled is None:
+            if parent is not None:
+                logger.info("The weights of the parent are not inherited by a copied search space.")
+            self_copy = copy.deepcopy(self)
+            self_copy.set_ops(choice)
+            return self_copy.create_model()
+
+        layers = None if parent is None else {}
+        output_tensors = compiled.create_tensors(choice, layers)
+        input_tensors = [inode.op.tensor for inode in self.input_nodes]
+        model = self._create_keras_model(input_tensors, output_tensors)
+
+        if parent is not None:
+            num_inherited = self._inherit_weights(layers, *parent)
+            logger.info(f"{num_inherited} layers inherited from the parent architecture.")
         return model
+
+    def _inherit_weights(self, layers: dict, parent_choice: list, weights_path: str) -> int:
+        """Set the weights of the ``layers`` of a model created from the compiled graph with the weights of the same layers in the trained parent model.
+
+        Returns:
+            int: the number of layers initialized from the parent.
+        """
+        parent_layers = {}
+        output_tensors = self.compile().create_tensors(parent_choice, parent_layers)
+        input_tensors = [inode.op.tensor for inode in self.input_nodes]
+        parent_model = self._create_keras_model(input_tensors, output_tensors)
+        parent_model.load_weights(weights_path)
+
+        num_inherited = 0
+        for key, layer in layers.items():
+            if not key in parent_layers:
+                continue
+            weights = parent_layers[key].get_weights()
+            shapes = [np.shape(w) for w in layer.get_weights()]
+            if len(weights) > 0 and [np.shape(w) for w in weights] == shapes:
+                layer.set_weights(weights)
+                num_inherited += 1
+        return num_inherited
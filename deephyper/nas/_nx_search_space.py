@@ -1,4 +1,5 @@
 import abc
+import contextlib
 import traceback
 from collections.abc import Iterable
 
@@ -17,6 +18,8 @@ class NxSearchSpace(abc.ABC):
         self.graph = nx.DiGraph()
         self.seed = seed
         self.output_node = None
+        self._order = {}  # Node -> position in a topological order of the graph maintained by "connect".
+        self._deferred = False  # If the cycles are checked at the end of "deferred_validation".
 
     def plot(self, path):
         with open(path, "w") as f:
@@ -69,23 +72,87 @@ class NxSearchSpace(abc.ABC):
 
         The edge created corresponds to : node1 -> node2.
 
+        A topological order of the graph is maintained incrementally (`Pearce-Kelly <https://doi.org/10.1145/1187436.1210590>`_ algorithm): the edge is checked in constant time when ``node1`` is already before ``node2``, otherwise only the nodes between them in the order are visited. The connections of the graph have to be created with this method.
+
         Args:
             node1 (Node)
             node2 (Node)
 
         Raise:
-            StructureHasACycle: if the new edge is creating a cycle.
+            StructureHasACycle: if the new edge is creating a cycle, the edge is not added.
         """
         assert isinstance(node1, Node)
         assert isinstance(node2, Node)
 
-        self.graph.add_edge(node1, node2)
-
-        if not (nx.is_directed_acyclic_graph(self.graph)):
+        if not self._deferred and (node1 is node2 or self._creates_cycle(node1, node2)):
             raise StructureHasACycle(
                 f"the connection between {node1} -> {node2} is creating a cycle in the search_space's graph."
             )
 
+        self.graph.add_edge(node1, node2)
+
+    def _position(self, node) -> int:
+        if not node in self._order:
+            # a node without connections is placed at the end of the order
+            self._order[node] = len(self._order)
+        return self._order[node]
+
+    def _creates_cycle(self, node1, node2) -> bool:
+        """Check if the edge ``node1 -> node2`` creates a cycle, if not the topological order is updated for the edge."""
+        lower, upper = self._position(node2), self._position(node1)
+        if upper < lower:
+            return False
+
+        # descendants of node2 placed before node1, a cycle if node1 is one of them
+        forward, stack = {node2}, [node2]
+        while len(stack) > 0:
+            for succ in self.graph.succ.get(stack.pop(), {}):
+                if succ is node1:
+                    return True
+                if self._order[succ] < upper and not succ in forward:
+                    forward.add(succ)
+                    stack.append(succ)
+
+        # ancestors of node1 placed after node2
+        backward, stack = {node1}, [node1]
+        while len(stack) > 0:
+            for pred in self.graph.pred.get(stack.pop(), {}):
+                if self._order[pred] > lower and not pred in backward:
+                    backward.add(pred)
+                    stack.append(pred)
+
+        # the ancestors take the first positions of the affected nodes
+        key = lambda n: self._order[n]
+        nodes = sorted(backward, key=key) + sorted(forward, key=key)
+        positions = sorted(self._order[n] for n in nodes)
+        for node, position in zip(nodes, positions):
+            self._order[node] = position
+        return False
+
+    @contextlib.contextmanager
+    def deferred_validation(self):
+        """Context manager in which ``connect`` does not check the cycles, the graph is checked once at the end (e.g., to build a large search space in ``build``).
+
+        >>> def build(self):
+        ...     with self.deferred_validation():
+        ...         ...
+        ...     return self
+
+        Raise:
+            StructureHasACycle: if the graph has a cycle at the end.
+        """
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+
+        if not (nx.is_directed_acyclic_graph(self.graph)):
+            raise StructureHasACycle("the search_space's graph has a cycle.")
+        self._order = {
+            node: i for i, node in enumerate(nx.topological_sort(self.graph))
+        }
+
     @property
     def size(self):
         """Size of the search space define by the search_space
@@ -0,0 +1,148 @@
+import collections
+import logging
+import threading
+
+import numpy as np
+import tensorflow as tf
+from deephyper.nas.losses import selectLoss
+from deephyper.nas.metrics import selectMetric
+from deephyper.nas.trainer._utils import selectOptimizer_keras
+
+logger = logging.getLogger(__name__)
+
+
+class Supernet:
+    """Weight-sharing (one-shot) model of a ``KSearchSpace``. The operations of the search space are materialized once for each shape of their inputs and shared by all the architectures: the model of an ``arch_seq`` is the path of the supernet selected by its choices. The supernet is trained by sampling one path uniformly for each batch (`single-path one-shot <https://arxiv.org/abs/1904.00420>`_), the architectures are then scored with the inherited weights without being trained, which can be used as a cheap proxy of their objective to screen candidates.
+
+    The layers of an operation are shared if they are created once by the operation (e.g., ``operation(tf.keras.layers.Dense)``), the layers created each time an operation is called (e.g., the projections of ``AddByProjecting``) are initialized for each architecture.
+
+    >>> supernet = space.build_supernet()
+    >>> supernet.fit(train_dataset, num_epochs=10, loss="mse")
+    >>> scores = supernet.score(arch_seqs, valid_dataset, metric="r2")
+
+    Args:
+        space (KSearchSpace): the built search space.
+        max_models (int, optional): Maximum number of models of architectures kept to be reused, the least recently used are discarded. Defaults to ``1024``.
+
+    Raises:
+        ValueError: if the search space cannot be compiled (see ``KSearchSpace.compile``).
+    """
+
+    def __init__(self, space, max_models: int = 1024):
+        compiled = space.compile()
+        if compiled is None:
+            raise ValueError("The search space cannot be compiled to create a supernet!")
+        self.space = space
+        self.max_models = max_models
+        self._compiled = compiled
+        self._ops = {}  # (node index, op index, input shapes) -> operation shared by the architectures.
+        self._models = collections.OrderedDict()  # Choices -> model of the architecture.
+        self._optimizer = None
+        self._lock = threading.Lock()
+
+    def model(self, arch_seq: list) -> tf.keras.Model:
+        """Return the model of an architecture sharing the weights of the supernet.
+
+        Args:
+            arch_seq (list): the choices of the architecture.
+
+        Returns:
+            tf.keras.Model: the model of the architecture.
+        """
+        key = tuple(int(c) for c in arch_seq)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+
+            output_tensors = self._compiled.create_tensors(list(key), ops=self._ops)
+            input_tensors = [inode.op.tensor for inode in self.space.input_nodes]
+            model = self.space._create_keras_model(input_tensors, output_tensors)
+
+            self._models[key] = model
+            if len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+        return model
+
+    def sample_arch(self, random_state: np.random.RandomState) -> list:
+        """Sample the choices of an architecture uniformly."""
+        return [random_state.randint(low, high + 1) for low, high in self.space.choices()]
+
+    def fit(
+        self,
+        dataset,
+        num_epochs: int = 1,
+        loss="mse",
+        optimizer: str = "adam",
+        learning_rate: float = 1e-3,
+        random_state=None,
+    ) -> dict:
+        """Train the supernet, the weights of one path sampled uniformly are updated for each batch.
+
+        Args:
+            dataset (tf.data.Dataset): the batches of training data, of the form ``(inputs, outputs)`` such as the datasets of ``BaseTrainer``.
+            num_epochs (int, optional): Number of passes on ``dataset``. Defaults to ``1``.
+            loss (str|callable, optional): the loss function, see ``deephyper.nas.losses``. Defaults to ``"mse"``.
+            optimizer (str, optional): the name of the optimizer, see ``deephyper.nas.trainer``. Defaults to ``"adam"``.
+            learning_rate (float, optional): the learning rate. Defaults to ``1e-3``.
+            random_state (int, optional): Random seed of the sampled paths. Defaults to None.
+
+        Returns:
+            dict: the history of the training with the mean ``"loss"`` of each epoch.
+        """
+        random_state = np.random.RandomState(random_state)
+        loss_fn = selectLoss(loss)
+        if self._optimizer is None:
+            # the variables of the paths are created during the training, the legacy optimizers
+            # create their slots for new variables
+            optimizer_cls = selectOptimizer_keras(optimizer)
+            optimizers = getattr(tf.keras.optimizers, "legacy", tf.keras.optimizers)
+            optimizer_cls = getattr(optimizers, optimizer_cls.__name__, optimizer_cls)
+            self._optimizer = optimizer_cls(learning_rate=learning_rate)
+
+        history = {"loss": []}
+        for epoch in range(num_epochs):
+            losses = []
+            for inputs, outputs in dataset:
+                model = self.model(self.sample_arch(random_state))
+                with tf.GradientTape() as tape:
+                    batch_loss = tf.reduce_mean(loss_fn(outputs, model(inputs, training=True)))
+                grads = tape.gradient(batch_loss, model.trainable_variables)
+                self._optimizer.apply_gradients(
+                    (g, v)
+                    for g, v in zip(grads, model.trainable_variables)
+                    if g is not None
+                )
+                losses.append(float(batch_loss))
+            history["loss"].append(float(np.mean(losses)))
+            logger.info(f"supernet epoch {epoch}: loss={history['loss'][-1]}")
+        return history
+
+    def score(self, arch_seqs: list, dataset, metric="mse", num_batches: int = None) -> list:
+        """Score architectures with the weights of the supernet.
+
+        Args:
+            arch_seqs (list(list)): the choices of the architectures.
+            dataset (tf.data.Dataset): the batches of validation data, of the form ``(inputs, outputs)``. The same batches are used for all the architectures.
+            metric (str|callable, optional): the metric, see ``deephyper.nas.metrics``. Defaults to ``"mse"``.
+            num_batches (int, optional): Number of batches of ``dataset`` used to score the architectures. Defaults to None, for all the batches.
+
+        Returns:
+            list(float): the mean of the metric on the batches for each architecture.
+        """
+        metric_fn = selectMetric(metric)
+        if type(metric_fn) is str:
+            metric_fn = tf.keras.metrics.get(metric_fn)
+        if num_batches is not None:
+            dataset = dataset.take(num_batches)
+        batches = list(dataset)
+
+        scores = []
+        for arch_seq in arch_seqs:
+            model = self.model(arch_seq)
+            values = [
+                float(tf.reduce_mean(metric_fn(outputs, model(inputs, training=False))))
+                for inputs, outputs in batches
+            ]
+            scores.append(float(np.mean(values)))
+        return scores
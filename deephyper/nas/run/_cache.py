@@ -0,0 +1,124 @@
+"""In-process cache of the objects shared by the evaluations of a neural architecture search executed by the same worker. With a persistent worker (e.g., the ``"thread"``, ``"process"`` or ``"ray"`` evaluators) successive calls of :func:`deephyper.nas.run.run_base_trainer` only differ by their ``arch_seq`` and hyperparameters: the loaded data, the fitted preprocessor, the built search space and the base ``tf.data`` datasets are then reused instead of being created again for each job.
+
+The maximum size of the cache in megabytes is set with the ``DEEPHYPER_WORKER_CACHE_MB`` environment variable (``0`` disables the cache).
+"""
+import collections
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+
+import numpy as np
+from deephyper.evaluator._encoder import Encoder
+
+logger = logging.getLogger(__name__)
+
+#: Default maximum size of the worker cache in megabytes.
+DEFAULT_MAX_MB = 2048
+
+
+def nbytes(obj) -> int:
+    """Estimate the memory footprint of an object from the numpy arrays it contains.
+
+    Args:
+        obj (any): an array, or a list, tuple or dict of arrays.
+
+    Returns:
+        int: the number of bytes.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    elif isinstance(obj, (list, tuple)):
+        return sum(nbytes(o) for o in obj)
+    elif isinstance(obj, dict):
+        return sum(nbytes(o) for o in obj.values())
+    else:
+        return sys.getsizeof(obj)
+
+
+class WorkerCache:
+    """Cache which discards the least recently used objects when their total memory footprint exceeds ``max_bytes``. The objects are identified by a tuple of parts such as the ``load_data`` function and its keyword arguments, it is hashed with the JSON encoding of the configurations (functions and classes are encoded by their full name). The cached objects are shared and should not be modified.
+
+    Args:
+        max_bytes (int): maximum memory footprint of the cached objects, the objects are not cached if it is ``0``.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()  # Key -> (object, footprint).
+        self._nbytes = 0
+        self._lock = threading.Lock()  # The jobs of a thread evaluator share the cache.
+
+    def key(self, parts: tuple) -> str:
+        """Compute the hash identifying an object.
+
+        Raises:
+            TypeError: if a part cannot be encoded in JSON.
+        """
+        data = json.dumps(parts, cls=Encoder, sort_keys=True)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get_or_create(self, parts: tuple, create, footprint=None):
+        """Return the object identified by ``parts``, it is created with ``create()`` if it is not cached.
+
+        Args:
+            parts (tuple): the parts identifying the object.
+            create (callable): function creating the object.
+            footprint (any, optional): the arrays held by the object to estimate its memory footprint (e.g., the arrays of a dataset). Defaults to ``None`` for the object itself.
+
+        Returns:
+            any: the cached or created object.
+        """
+        if self.max_bytes <= 0:
+            return create()
+
+        try:
+            key = self.key(parts)
+        except TypeError:
+            logger.info(f"The object identified by {parts} cannot be cached.")
+            return create()
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+
+        obj = create()
+        size = nbytes(obj if footprint is None else footprint)
+        if size > self.max_bytes:
+            return obj
+
+        with self._lock:
+            if not key in self._data:
+                self._data[key] = (obj, size)
+                self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._nbytes -= evicted
+        return obj
+
+    def clear(self):
+        """Discard the cached objects."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Memory footprint of the cached objects."""
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._data)
+
+
+#: Cache of the worker used by ``run_base_trainer`` and ``run_horovod``.
+worker_cache = WorkerCache(
+    int(float(os.environ.get("DEEPHYPER_WORKER_CACHE_MB", DEFAULT_MAX_MB)) * 2 ** 20)
+)
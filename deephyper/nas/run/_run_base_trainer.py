@@ -1,4 +1,4 @@
-"""The :func:`deephyper.nas.run.alpha.run` function is used to evaluate a deep neural network by loading the data, building the model, training the model and returning a scalar value corresponding to the objective defined in the used :class:`deephyper.problem.NaProblem`.
+"""The :func:`deephyper.nas.run.alpha.run` function is used to evaluate a deep neural network by loading the data, building the model, training the model and returning a scalar value corresponding to the objective defined in the used :class:`deephyper.problem.NaProblem`. The loaded data, the built search space and the preprocessed datasets are kept in a cache of the worker (see :mod:`deephyper.nas.run._cache`) and reused by the next evaluations.
 """
 import os
 import traceback
@@ -7,6 +7,9 @@ import logging
 import numpy as np
 import tensorflow as tf
 from deephyper.contrib.callbacks import import_callback
+from deephyper.evaluator import trace
+from deephyper.evaluator.report import Reporter
+from deephyper.nas.run._cache import worker_cache
 from deephyper.nas.run._util import (
     compute_objective,
     load_config,
@@ -15,6 +18,7 @@ from deephyper.nas.run._util import (
     get_search_space,
     default_callbacks_config,
     HistorySaver,
+    ReportObjective,
 )
 from deephyper.nas.trainer import BaseTrainer
 
@@ -63,14 +67,35 @@ def run_base_trainer(config):
 
     load_config(config)
 
-    input_shape, output_shape = setup_data(config)
+    # multi-fidelity scheduler: the trial is trained from the budget (epochs) of its previous rung
+    reporter = Reporter(config)
+    budget = config.get("budget")
+    initial_budget = config.get("initial_budget", 0)
+    if budget is not None:
+        config["hyperparameters"]["num_epochs"] = budget - initial_budget
 
-    search_space = get_search_space(config, input_shape, output_shape, seed=seed)
+    input_shape, output_shape = setup_data(config, cache=worker_cache)
+    trace.record(trace.DATA_LOADED)
+
+    search_space = get_search_space(
+        config, input_shape, output_shape, seed=seed, cache=worker_cache
+    )
 
     model_created = False
     try:
-        model = search_space.sample(config["arch_seq"])
+        # a child of the evolution is initialized with the trained weights of its parent
+        parent = None
+        parent_arch_seq = config.get("parent_arch_seq")
+        if parent_arch_seq is not None and initial_budget == 0:
+            parent_weights_path = saver.arch_weights_path(parent_arch_seq)
+            if os.path.exists(parent_weights_path):
+                parent = (parent_arch_seq, parent_weights_path)
+
+        model = search_space.sample(config["arch_seq"], parent=parent)
+        if budget is not None and initial_budget > 0:
+            model.load_weights(saver.trial_weights_path(config["trial_id"]))
         model_created = True
+        trace.record(trace.MODEL_BUILT)
     except:
         logger.info("Error: Model creation failed...")
         logger.info(traceback.format_exc())
@@ -105,13 +130,23 @@ def run_base_trainer(config):
                 else:
                     logger.error(f"'{cb_name}' is not an accepted callback!")
 
-        trainer = BaseTrainer(config=config, model=model)
+        trainer = BaseTrainer(config=config, model=model, cache=worker_cache)
         trainer.callbacks.extend(callbacks)
+        trainer.callbacks.append(
+            ReportObjective(reporter, config["objective"], initial_budget)
+        )
 
         last_only, with_pred = preproc_trainer(config)
         last_only = last_only and not cb_requires_valid
 
         history = trainer.train(with_pred=with_pred, last_only=last_only)
+        trace.record(trace.TRAINED)
+
+        if budget is not None:
+            saver.write_trial_weights(model, config["trial_id"])
+
+        if config.get("inherit_weights"):
+            saver.write_arch_weights(model, config["arch_seq"])
 
         # save history
         saver.write_history(history)
@@ -126,4 +161,4 @@ def run_base_trainer(config):
         logger.info("Computed objective is NaN returning -Inf instead!")
         result = -float("inf")
 
-    return result
+    return reporter.result(result)
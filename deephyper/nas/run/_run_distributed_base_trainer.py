@@ -33,6 +33,7 @@ import numpy as np
 import tensorflow as tf
 from deephyper.contrib.callbacks import import_callback
 from deephyper.contrib.callbacks import LearningRateWarmupCallback
+from deephyper.evaluator import trace
 from deephyper.nas.run._util import (
     compute_objective,
     load_config,
@@ -88,6 +89,7 @@ def run_distributed_base_trainer(config):
     config[a.hyperparameters][a.learning_rate] = learning_rate
 
     input_shape, output_shape = setup_data(config)
+    trace.record(trace.DATA_LOADED)
 
     search_space = get_search_space(config, input_shape, output_shape, seed=seed)
 
@@ -96,6 +98,7 @@ def run_distributed_base_trainer(config):
         try:
             model = search_space.sample(config["arch_seq"])
             model_created = True
+            trace.record(trace.MODEL_BUILT)
         except:
             logger.info("Error: Model creation failed...")
             logger.info(traceback.format_exc())
@@ -152,6 +155,7 @@ def run_distributed_base_trainer(config):
 
     if model_created:
         history = trainer.train(with_pred=with_pred, last_only=last_only)
+        trace.record(trace.TRAINED)
 
         # save history
         save_history(config.get("log_dir", None), history, config)
@@ -7,11 +7,13 @@ import logging
 import numpy as np
 import tensorflow as tf
 from deephyper.contrib.callbacks import import_callback
+from deephyper.evaluator import trace
 
 import horovod.tensorflow.keras as hvd
 
 import deephyper.nas.trainer._arch as a
 from deephyper.nas.trainer import HorovodTrainer
+from deephyper.nas.run._cache import worker_cache
 from deephyper.nas.run._util import (
     compute_objective,
     load_config,
@@ -89,9 +91,12 @@ def run_horovod(config: dict) -> float:
     config[a.hyperparameters][a.batch_size] = batch_size
     config[a.hyperparameters][a.learning_rate] = learning_rate
 
-    input_shape, output_shape = setup_data(config)
+    input_shape, output_shape = setup_data(config, cache=worker_cache)
+    trace.record(trace.DATA_LOADED)
 
-    search_space = get_search_space(config, input_shape, output_shape, seed=seed)
+    search_space = get_search_space(
+        config, input_shape, output_shape, seed=seed, cache=worker_cache
+    )
 
     # Initialize Horovod
 
@@ -99,6 +104,7 @@ def run_horovod(config: dict) -> float:
     try:
         model = search_space.sample(config["arch_seq"])
         model_created = True
+        trace.record(trace.MODEL_BUILT)
     except:
         logger.info("Error: Model creation failed...")
         logger.info(traceback.format_exc())
@@ -143,7 +149,7 @@ def run_horovod(config: dict) -> float:
                 else:
                     logger.error(f"'{cb_name}' is not an accepted callback!")
 
-        trainer = HorovodTrainer(config=config, model=model)
+        trainer = HorovodTrainer(config=config, model=model, cache=worker_cache)
 
         trainer.callbacks.extend(callbacks)
 
@@ -151,6 +157,7 @@ def run_horovod(config: dict) -> float:
         last_only = last_only and not cb_requires_valid
 
         history = trainer.train(with_pred=with_pred, last_only=last_only)
+        trace.record(trace.TRAINED)
 
         # save history
         if hvd.rank() == 0:
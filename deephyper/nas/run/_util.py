@@ -2,9 +2,11 @@
 """
 import logging
 import copy
+import hashlib
 import json
 import os
 import pathlib
+import shutil
 import uuid
 from datetime import datetime
 
@@ -83,7 +85,7 @@ def load_config(config: dict) -> None:
         config["objective"] = util.load_attr(config["objective"])
 
 
-def setup_data(config: dict, add_to_config: bool = True) -> tuple:
+def setup_data(config: dict, add_to_config: bool = True, cache=None) -> tuple:
     """Load the data defined by the ``"load_data"`` key in the ``config`` dictionnary. The ``load_data`` function has to return numpy arrays of the form `(X_train, y_train), (X_valid, y_valid)`` or a dictionnary defining generators such as:
 
     .. code-block:: python
@@ -114,6 +116,7 @@ def setup_data(config: dict, add_to_config: bool = True) -> tuple:
     Args:
         config (dict): The JSON encoded configuration generated by DeepHyper.
         add_to_config (bool, optional): If the loaded should be added as a ``"data"`` of the ``config`` dictionnary. Defaults to True.
+        cache (WorkerCache, optional): Cache of the loaded data, keyed by the ``load_data`` function and its keyword arguments. Defaults to None.
 
     Raises:
         RuntimeError: ...
@@ -124,7 +127,11 @@ def setup_data(config: dict, add_to_config: bool = True) -> tuple:
     # Loading data
     load_data = config["load_data"]["func"]
     kwargs = config["load_data"].get("kwargs")
-    data = load_data() if kwargs is None else load_data(**kwargs)
+    create = lambda: load_data() if kwargs is None else load_data(**kwargs)
+    if cache is None:
+        data = create()
+    else:
+        data = cache.get_or_create(("load_data", load_data, kwargs), create)
     logging.info(f"Data loaded with kwargs: {kwargs}")
 
     # Set data shape
@@ -209,17 +216,27 @@ def setup_data(config: dict, add_to_config: bool = True) -> tuple:
         return input_shape, output_shape, data
 
 
-def get_search_space(config, input_shape, output_shape, seed):
+def get_search_space(config, input_shape, output_shape, seed, cache=None):
     space_class = config["search_space"]["class"]
     cs_kwargs = config["search_space"].get("kwargs")
-    if cs_kwargs is None:
-        search_space = space_class(input_shape, output_shape, seed=seed)
-    else:
-        search_space = space_class(
-            input_shape, output_shape, seed=seed, **cs_kwargs
-        )
-    search_space.build()
-    return search_space
+
+    def create():
+        if cs_kwargs is None:
+            search_space = space_class(input_shape, output_shape, seed=seed)
+        else:
+            search_space = space_class(
+                input_shape, output_shape, seed=seed, **cs_kwargs
+            )
+        search_space.build()
+        return search_space
+
+    if cache is None:
+        return create()
+    # the built search space is not modified by "sample(arch_seq)"
+    return cache.get_or_create(
+        ("search_space", space_class, cs_kwargs, input_shape, output_shape, seed),
+        create,
+    )
 
 
 def compute_objective(objective, history: dict) -> float:
@@ -294,6 +311,7 @@ class HistorySaver:
         history_dir="history",
         model_dir="model",
         config_dir="config",
+        weights_dir="weights",
     ):
         self.id = config.get("id", uuid.uuid1())
         self.date = HistorySaver.get_date()
@@ -302,6 +320,7 @@ class HistorySaver:
         self.history_dir = os.path.join(self.save_dir, history_dir)
         self.model_dir = os.path.join(self.save_dir, model_dir)
         self.config_dir = os.path.join(self.save_dir, config_dir)
+        self.weights_dir = os.path.join(self.save_dir, weights_dir)
 
     @property
     def name(self) -> str:
@@ -319,6 +338,16 @@ class HistorySaver:
     def config_path(self) -> str:
         return os.path.join(self.config_dir, f"{self.name}.json")
 
+    def trial_weights_path(self, trial_id) -> str:
+        """Path of the weights of a trial of a multi-fidelity scheduler, they are saved at the end of each job of the trial and loaded by the next one."""
+        return os.path.join(self.weights_dir, f"trial_{trial_id}.h5")
+
+    def arch_weights_path(self, arch_seq: list) -> str:
+        """Path of the trained weights of an architecture, they are saved at the end of the jobs evaluating it and loaded by the jobs of its children (see the ``inherit_weights`` argument of ``RegularizedEvolution``)."""
+        data = json.dumps(list(arch_seq), cls=Encoder)
+        key = hashlib.sha1(data.encode("utf-8")).hexdigest()
+        return os.path.join(self.weights_dir, f"arch_{key}.h5")
+
     @staticmethod
     def get_date() -> str:
         date = datetime.now()
@@ -345,6 +374,61 @@ class HistorySaver:
         if not (os.path.exists(self.model_dir)):
             pathlib.Path(self.model_dir).mkdir(parents=True, exist_ok=True)
 
+    def write_trial_weights(self, model, trial_id):
+        if not (os.path.exists(self.weights_dir)):
+            pathlib.Path(self.weights_dir).mkdir(parents=True, exist_ok=True)
+
+        model.save_weights(self.trial_weights_path(trial_id))
+
+    def write_arch_weights(self, model, arch_seq: list):
+        """Save the weights of a trained architecture, the best model saved at ``model_path`` by the ``ModelCheckpoint`` callback is used if it exists."""
+        if not (os.path.exists(self.weights_dir)):
+            pathlib.Path(self.weights_dir).mkdir(parents=True, exist_ok=True)
+
+        # the same architecture can be saved by concurrent jobs
+        path = self.arch_weights_path(arch_seq)
+        tmp_path = f"{path[:-3]}.{uuid.uuid4()}.h5"
+        if os.path.exists(self.model_path):
+            shutil.copyfile(self.model_path, tmp_path)
+        else:
+            model.save_weights(tmp_path)
+        os.replace(tmp_path, path)
+
+
+class ReportObjective(tf.keras.callbacks.Callback):
+    """Keras callback recording the objective after each training epoch in a ``deephyper.evaluator.report.Reporter``. The objective is computed from the history of the epochs trained so far with ``compute_objective``, the epochs without the required metrics (e.g., without validation) are not reported. The training is stopped when the reporter discards the job (see ``deephyper.evaluator.EarlyDiscarding``).
+
+    Args:
+        reporter (Reporter): the reporter of the job.
+        objective (str|callable): the objective of the problem.
+        initial_budget (int, optional): number of epochs trained before (e.g., by the previous rung of a multi-fidelity scheduler). Defaults to ``0``.
+    """
+
+    def __init__(self, reporter, objective, initial_budget: int = 0):
+        super().__init__()
+        self.reporter = reporter
+        self.objective = objective
+        self.initial_budget = initial_budget
+        self.history = {}
+        self.num_epochs = 0  # the trainer can call "fit" several times, epochs are counted across calls
+
+    def on_train_begin(self, logs=None):
+        # the trainer can call "fit" again after the job was discarded
+        if self.reporter.discarded:
+            self.model.stop_training = True
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.num_epochs += 1
+        for k, v in (logs or {}).items():
+            self.history.setdefault(k, []).append(v)
+        try:
+            objective = compute_objective(self.objective, self.history)
+        except Exception:
+            # e.g., the metrics of the objective are only computed after the last epoch
+            return
+        if self.reporter.record(self.initial_budget + self.num_epochs, float(objective)):
+            self.model.stop_training = True
+
 
 def save_history(log_dir: str, history: dict, config: dict):
     if not (log_dir is None):
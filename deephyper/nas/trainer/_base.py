@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 
 class BaseTrainer:
-    def __init__(self, config, model):
+    def __init__(self, config, model, cache=None):
         self.cname = self.__class__.__name__
 
         self.config = config
@@ -23,6 +23,9 @@ class BaseTrainer:
         self.model = model
         self.callbacks = []
 
+        # the preprocessed data and the base datasets are shared with the other trainings of the worker
+        self.cache = cache
+
         self.data = self.config[a.data]
 
         self.config_hp = self.config[a.hyperparameters]
@@ -245,47 +248,102 @@ class BaseTrainer:
         if self.preprocessing_func:
             logger.debug(f"preprocess_data with: {str(self.preprocessing_func)}")
 
-            if len(np.shape(self.train_Y)) == 2:
-                data_train = np.concatenate((*self.train_X, self.train_Y), axis=1)
-                data_valid = np.concatenate((*self.valid_X, self.valid_Y), axis=1)
-                self.preprocessor = self.preprocessing_func()
-
-                tX_shp = [np.shape(x) for x in self.train_X]
-
-                preproc_data_train = self.preprocessor.fit_transform(data_train)
-                preproc_data_valid = self.preprocessor.transform(data_valid)
+            if self.cache is None:
+                preproc = self._preprocess_data()
+            else:
+                preproc = self.cache.get_or_create(
+                    (
+                        "preprocessing",
+                        self.cname,
+                        self.config["load_data"],
+                        self.config["preprocessing"],
+                    ),
+                    self._preprocess_data,
+                )
+            (
+                self.preprocessor,
+                self.train_X,
+                self.train_Y,
+                self.valid_X,
+                self.valid_Y,
+            ) = preproc
+        else:
+            logger.info("no preprocessing function")
 
-                acc, self.train_X = 0, list()
-                for shp in tX_shp:
-                    self.train_X.append(preproc_data_train[:, acc : acc + shp[1]])
-                    acc += shp[1]
-                self.train_Y = preproc_data_train[:, acc:]
+    def _preprocess_data(self) -> tuple:
+        """Fit the preprocessor on the training data.
 
-                acc, self.valid_X = 0, list()
-                for shp in tX_shp:
-                    self.valid_X.append(preproc_data_valid[:, acc : acc + shp[1]])
-                    acc += shp[1]
-                self.valid_Y = preproc_data_valid[:, acc:]
+        Returns:
+            tuple: ``(preprocessor, train_X, train_Y, valid_X, valid_Y)``.
+        """
+        if len(np.shape(self.train_Y)) != 2:
+            return None, self.train_X, self.train_Y, self.valid_X, self.valid_Y
+
+        data_train = np.concatenate((*self.train_X, self.train_Y), axis=1)
+        data_valid = np.concatenate((*self.valid_X, self.valid_Y), axis=1)
+        preprocessor = self.preprocessing_func()
+
+        tX_shp = [np.shape(x) for x in self.train_X]
+
+        preproc_data_train = preprocessor.fit_transform(data_train)
+        preproc_data_valid = preprocessor.transform(data_valid)
+
+        acc, train_X = 0, list()
+        for shp in tX_shp:
+            train_X.append(preproc_data_train[:, acc : acc + shp[1]])
+            acc += shp[1]
+        train_Y = preproc_data_train[:, acc:]
+
+        acc, valid_X = 0, list()
+        for shp in tX_shp:
+            valid_X.append(preproc_data_valid[:, acc : acc + shp[1]])
+            acc += shp[1]
+        valid_Y = preproc_data_valid[:, acc:]
+        return preprocessor, train_X, train_Y, valid_X, valid_Y
+
+    def _create_dataset(self, name: str, create):
+        """Create a dataset before it is shuffled and batched, it is reused by the next trainings of the worker if the trainer has a cache."""
+        if self.cache is None:
+            return create()
+        if self.data_config_type == "ndarray":
+            footprint = (self.train_X, self.train_Y) if name == "train" else (self.valid_X, self.valid_Y)
         else:
-            logger.info("no preprocessing function")
+            footprint = None
+        return self.cache.get_or_create(
+            (
+                "dataset",
+                self.cname,
+                name,
+                self.config["load_data"],
+                self.config.get("preprocessing"),
+                self.cache_data,
+                self.batch,
+            ),
+            create,
+            footprint=footprint,
+        )
 
     def set_dataset_train(self):
-        if self.data_config_type == "ndarray":
-            if type(self.train_Y) is list:
-                output_mapping = {f"output_{i}": tY for i, tY in enumerate(self.train_Y)}
-            else:
-                output_mapping = self.train_Y
-            self.dataset_train = tf.data.Dataset.from_tensor_slices(
-                ({f"input_{i}": tX for i, tX in enumerate(self.train_X)}, output_mapping)
-            )
-        else:  # self.data_config_type == "gen"
-            self.dataset_train = tf.data.Dataset.from_generator(
-                self.train_gen,
-                output_signature=self._get_output_signatures(),
-            )
+        def create():
+            if self.data_config_type == "ndarray":
+                if type(self.train_Y) is list:
+                    output_mapping = {f"output_{i}": tY for i, tY in enumerate(self.train_Y)}
+                else:
+                    output_mapping = self.train_Y
+                dataset = tf.data.Dataset.from_tensor_slices(
+                    ({f"input_{i}": tX for i, tX in enumerate(self.train_X)}, output_mapping)
+                )
+            else:  # self.data_config_type == "gen"
+                dataset = tf.data.Dataset.from_generator(
+                    self.train_gen,
+                    output_signature=self._get_output_signatures(),
+                )
+
+            if self.cache_data:
+                dataset = dataset.cache()
+            return dataset
 
-        if self.cache_data:
-            self.dataset_train = self.dataset_train.cache()
+        self.dataset_train = self._create_dataset("train", create)
         if self.shuffle_data:
             self.dataset_train = self.dataset_train.shuffle(
                 self.train_size, reshuffle_each_iteration=True
@@ -298,21 +356,23 @@ class BaseTrainer:
         )
 
     def set_dataset_valid(self):
-        if self.data_config_type == "ndarray":
-            if type(self.valid_Y) is list:
-                output_mapping = {f"output_{i}": vY for i, vY in enumerate(self.valid_Y)}
+        def create():
+            if self.data_config_type == "ndarray":
+                if type(self.valid_Y) is list:
+                    output_mapping = {f"output_{i}": vY for i, vY in enumerate(self.valid_Y)}
+                else:
+                    output_mapping = self.valid_Y
+                dataset = tf.data.Dataset.from_tensor_slices(
+                    ({f"input_{i}": vX for i, vX in enumerate(self.valid_X)}, output_mapping)
+                )
             else:
-                output_mapping = self.valid_Y
-            self.dataset_valid = tf.data.Dataset.from_tensor_slices(
-                ({f"input_{i}": vX for i, vX in enumerate(self.valid_X)}, output_mapping)
-            )
-        else:
-            self.dataset_valid = tf.data.Dataset.from_generator(
-                self.valid_gen,
-                output_signature=self._get_output_signatures(valid=True),
-            )
+                dataset = tf.data.Dataset.from_generator(
+                    self.valid_gen,
+                    output_signature=self._get_output_signatures(valid=True),
+                )
+            return dataset.cache()
 
-        self.dataset_valid = self.dataset_valid.cache()
+        self.dataset_valid = self._create_dataset("valid", create)
         self.dataset_valid = self.dataset_valid.batch(self.batch_size)
         self.dataset_valid = self.dataset_valid.prefetch(tf.data.AUTOTUNE).repeat(
             self.num_epochs
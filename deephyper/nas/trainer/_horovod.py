@@ -17,7 +17,7 @@ AUTOTUNE = tf.data.experimental.AUTOTUNE
 
 
 class HorovodTrainer:
-    def __init__(self, config, model):
+    def __init__(self, config, model, cache=None):
         self.cname = self.__class__.__name__
 
         self.config = config
@@ -25,6 +25,9 @@ class HorovodTrainer:
         self.model = model
         self.callbacks = []
 
+        # the preprocessed data and the base datasets are shared with the other trainings of the worker
+        self.cache = cache
+
         self.data = self.config[a.data]
 
         # hyperparameters
@@ -244,52 +247,106 @@ class HorovodTrainer:
         if self.preprocessing_func:
             logger.debug(f"preprocess_data with: {str(self.preprocessing_func)}")
 
-            if len(np.shape(self.train_Y)) == 2:
-                data_train = np.concatenate((*self.train_X, self.train_Y), axis=1)
-                data_valid = np.concatenate((*self.valid_X, self.valid_Y), axis=1)
-                data = np.concatenate((data_train, data_valid), axis=0)
-                self.preprocessor = self.preprocessing_func()
+            if self.cache is None:
+                preproc = self._preprocess_data()
+            else:
+                preproc = self.cache.get_or_create(
+                    (
+                        "preprocessing",
+                        self.cname,
+                        self.config["load_data"],
+                        self.config["preprocessing"],
+                    ),
+                    self._preprocess_data,
+                )
+            (
+                self.preprocessor,
+                self.train_X,
+                self.train_Y,
+                self.valid_X,
+                self.valid_Y,
+            ) = preproc
+        else:
+            logger.info("no preprocessing function")
+
+    def _preprocess_data(self) -> tuple:
+        """Fit the preprocessor on the training and validation data.
 
-                dt_shp = np.shape(data_train)
-                tX_shp = [np.shape(x) for x in self.train_X]
+        Returns:
+            tuple: ``(preprocessor, train_X, train_Y, valid_X, valid_Y)``.
+        """
+        if len(np.shape(self.train_Y)) != 2:
+            return None, self.train_X, self.train_Y, self.valid_X, self.valid_Y
 
-                preproc_data = self.preprocessor.fit_transform(data)
+        data_train = np.concatenate((*self.train_X, self.train_Y), axis=1)
+        data_valid = np.concatenate((*self.valid_X, self.valid_Y), axis=1)
+        data = np.concatenate((data_train, data_valid), axis=0)
+        preprocessor = self.preprocessing_func()
 
-                acc, self.train_X = 0, list()
-                for shp in tX_shp:
-                    self.train_X.append(preproc_data[: dt_shp[0], acc : acc + shp[1]])
-                    acc += shp[1]
-                self.train_Y = preproc_data[: dt_shp[0], acc:]
+        dt_shp = np.shape(data_train)
+        tX_shp = [np.shape(x) for x in self.train_X]
 
-                acc, self.valid_X = 0, list()
-                for shp in tX_shp:
-                    self.valid_X.append(preproc_data[dt_shp[0] :, acc : acc + shp[1]])
-                    acc += shp[1]
-                self.valid_Y = preproc_data[dt_shp[0] :, acc:]
+        preproc_data = preprocessor.fit_transform(data)
+
+        acc, train_X = 0, list()
+        for shp in tX_shp:
+            train_X.append(preproc_data[: dt_shp[0], acc : acc + shp[1]])
+            acc += shp[1]
+        train_Y = preproc_data[: dt_shp[0], acc:]
+
+        acc, valid_X = 0, list()
+        for shp in tX_shp:
+            valid_X.append(preproc_data[dt_shp[0] :, acc : acc + shp[1]])
+            acc += shp[1]
+        valid_Y = preproc_data[dt_shp[0] :, acc:]
+        return preprocessor, train_X, train_Y, valid_X, valid_Y
+
+    def _create_dataset(self, name: str):
+        """Create the dataset ``name`` (``"train"`` or ``"valid"``) before it is sharded, shuffled and batched, it is reused by the next trainings of the worker if the trainer has a cache."""
+
+        def create():
+            if self.data_config_type == "ndarray":
+                X, Y = (self.train_X, self.train_Y) if name == "train" else (self.valid_X, self.valid_Y)
+                if type(Y) is list:
+                    output_mapping = {f"output_{i}": y for i, y in enumerate(Y)}
+                else:
+                    output_mapping = Y
+                return tf.data.Dataset.from_tensor_slices(
+                    ({f"input_{i}": x for i, x in enumerate(X)}, output_mapping)
+                )
+            else:  # self.data_config_type == "gen"
+                return tf.data.Dataset.from_generator(
+                    self.train_gen if name == "train" else self.valid_gen,
+                    output_types=self.data_types,
+                    output_shapes=(
+                        {
+                            f"input_{i}": tf.TensorShape([*self.data_shapes[0][f"input_{i}"]])
+                            for i in range(len(self.data_shapes[0]))
+                        },
+                        tf.TensorShape([*self.data_shapes[1]]),
+                    ),
+                )
+
+        if self.cache is None:
+            return create()
+        if self.data_config_type == "ndarray":
+            footprint = (self.train_X, self.train_Y) if name == "train" else (self.valid_X, self.valid_Y)
         else:
-            logger.info("no preprocessing function")
+            footprint = None
+        return self.cache.get_or_create(
+            (
+                "dataset",
+                self.cname,
+                name,
+                self.config["load_data"],
+                self.config.get("preprocessing"),
+            ),
+            create,
+            footprint=footprint,
+        )
 
     def set_dataset_train(self):
-        if self.data_config_type == "ndarray":
-            if type(self.train_Y) is list:
-                output_mapping = {f"output_{i}": tY for i, tY in enumerate(self.train_Y)}
-            else:
-                output_mapping = self.train_Y
-            self.dataset_train = tf.data.Dataset.from_tensor_slices(
-                ({f"input_{i}": tX for i, tX in enumerate(self.train_X)}, output_mapping)
-            )
-        else:  # self.data_config_type == "gen"
-            self.dataset_train = tf.data.Dataset.from_generator(
-                self.train_gen,
-                output_types=self.data_types,
-                output_shapes=(
-                    {
-                        f"input_{i}": tf.TensorShape([*self.data_shapes[0][f"input_{i}"]])
-                        for i in range(len(self.data_shapes[0]))
-                    },
-                    tf.TensorShape([*self.data_shapes[1]]),
-                ),
-            )
+        self.dataset_train = self._create_dataset("train")
 
         self.dataset_train = self.dataset_train.shard(
             num_shards=hvd.size(), index=hvd.rank()
@@ -311,26 +368,7 @@ class HorovodTrainer:
         # self.dataset_train = self.dataset_train.repeat()
 
     def set_dataset_valid(self):
-        if self.data_config_type == "ndarray":
-            if type(self.valid_Y) is list:
-                output_mapping = {f"output_{i}": vY for i, vY in enumerate(self.valid_Y)}
-            else:
-                output_mapping = self.valid_Y
-            self.dataset_valid = tf.data.Dataset.from_tensor_slices(
-                ({f"input_{i}": vX for i, vX in enumerate(self.valid_X)}, output_mapping)
-            )
-        else:
-            self.dataset_valid = tf.data.Dataset.from_generator(
-                self.valid_gen,
-                output_types=self.data_types,
-                output_shapes=(
-                    {
-                        f"input_{i}": tf.TensorShape([*self.data_shapes[0][f"input_{i}"]])
-                        for i in range(len(self.data_shapes[0]))
-                    },
-                    tf.TensorShape([*self.data_shapes[1]]),
-                ),
-            )
+        self.dataset_valid = self._create_dataset("valid")
         self.dataset_valid = self.dataset_valid.batch(self.batch_size).repeat()
 
     def model_compile(self):
@@ -4,9 +4,14 @@ The ``Search`` class is abstract and has different subclasses such as: ``deephyp
 """
 
 from deephyper.search._search import Search
+from deephyper.search._multi_search import MultiSearch
+from deephyper.search._scheduler import Hyperband, SuccessiveHalving
 
 __all__ = [
+    "Hyperband",
+    "MultiSearch",
     "Search",
+    "SuccessiveHalving",
     "nas",
     "hps"
     ]
@@ -0,0 +1,243 @@
+import collections
+import copy
+import threading
+import time
+import warnings
+
+from deephyper.core.exceptions import DeephyperRuntimeError, SearchTerminationError
+from deephyper.evaluator import Evaluator
+
+
+class _SearchEvaluator(Evaluator):
+    """Evaluator given to a search run by ``MultiSearch``. The configurations submitted by the search are queued until the driver dispatches them to the shared evaluator, the evaluations of the search are dumped in its own ``log_dir``.
+
+    :meta private:
+    """
+
+    def __init__(self, driver, num_workers: int):
+        super().__init__(driver._evaluator.run_function, num_workers)
+        self._driver = driver
+        self._queue = collections.deque()  # Configurations waiting for a free worker.
+        self._received = collections.deque()  # Completed jobs not gathered yet by the search.
+        self._num_running = 0  # Jobs dispatched to the shared evaluator and not received yet.
+        self._num_dispatched = 0
+        self._closed = False  # If the search ended, its remaining jobs are then cancelled.
+        self._cancelled = False
+
+    def submit(self, configs):
+        with self._driver._cond:
+            self._driver._check_deadline()
+            self._queue.extend(configs)
+            self._driver._cond.notify_all()
+
+    def gather(self, type, size=1, timeout=None):
+        assert type in ["ALL", "BATCH"], f"Unsupported gather operation: {type}."
+
+        cond = self._driver._cond
+        with cond:
+            num_jobs = len(self._queue) + self._num_running + len(self._received)
+            if type == "ALL":
+                size = num_jobs
+            elif size > num_jobs:
+                warnings.warn(
+                    f"Requested a batch size ({size}) larger than currently running tasks ({num_jobs}). Batch size has been set to the count of currently running tasks."
+                )
+                size = num_jobs
+
+            end = None if timeout is None else time.time() + timeout
+            while len(self._received) < size:
+                # the search is stopped as by the SIGALARM of "Search.search"
+                self._driver._check_deadline()
+                wait = self._driver.poll_interval
+                if end is not None:
+                    if time.time() >= end:
+                        break
+                    wait = min(wait, end - time.time())
+                cond.wait(wait)
+
+            results = list(self._received)
+            self._received.clear()
+
+        self.jobs_done.extend(results)
+        return results
+
+    def close(self):
+        with self._driver._cond:
+            self._closed = True
+            self._queue.clear()
+
+    def get_state(self) -> dict:
+        state = super().get_state()
+        with self._driver._cond:
+            state["pending"].extend(copy.deepcopy(list(self._queue)))
+        return state
+
+
+class MultiSearch:
+    """Driver running several searches concurrently in the same process with a shared ``Evaluator``. It avoids the startup cost of one process per search (e.g., importing TensorFlow and starting the workers) and the over-subscription of the workers when several small searches are launched at the same time (e.g., to compare random seeds or surrogate models).
+
+    Each search is created with an evaluator returned by ``create_evaluator`` and a different ``log_dir`` where its ``"results.csv"`` file is written. The loop of each search runs in its own thread while the driver executes all the evaluations on the asyncio loop of the shared evaluator: at most ``num_workers`` jobs run at the same time and a free worker is given to the search with the fewest running jobs (fair share), the searches take turns when they have as many.
+
+    Args:
+        evaluator (Evaluator): the evaluator executing the jobs of all the searches.
+        poll_interval (float, optional): maximum number of seconds between two dispatches of the submitted configurations. Defaults to ``0.01``.
+
+    An example usage can be:
+
+    >>> evaluator = Evaluator.create(run, method="ray", method_kwargs={"num_workers": 8})
+    >>> driver = MultiSearch(evaluator)
+    >>> searches = [
+    ...     AMBS(problem, driver.create_evaluator(num_workers=2), random_state=seed, log_dir=f"ambs-{seed}")
+    ...     for seed in range(4)
+    ... ]
+    >>> results = driver.search(searches, max_evals=100, timeout=3600)
+    """
+
+    def __init__(self, evaluator: Evaluator, poll_interval: float = 0.01):
+        self._evaluator = evaluator
+        self.poll_interval = poll_interval
+        self._evaluators = []  # Evaluators of the searches.
+        self._job_evaluators = {}  # Job id -> evaluator of the search which submitted the job.
+        self._num_running = 0
+        self._deadline = None
+        self._cond = threading.Condition()  # Guards the queues and counters of the evaluators.
+
+    def create_evaluator(self, num_workers: int = None) -> Evaluator:
+        """Create the evaluator of a new search.
+
+        Args:
+            num_workers (int, optional): number of workers seen by the search (e.g., the size of its initial batch and of the batches it keeps submitted). Defaults to ``None`` for the number of workers of the shared evaluator, the searches then always have configurations waiting to be dispatched.
+
+        Returns:
+            Evaluator: the evaluator to create the search with.
+        """
+        if num_workers is None:
+            num_workers = self._evaluator.num_workers
+        evaluator = _SearchEvaluator(self, num_workers)
+        self._evaluators.append(evaluator)
+        return evaluator
+
+    def _check_deadline(self):
+        if self._deadline is not None and time.time() >= self._deadline:
+            raise SearchTerminationError
+
+    def search(
+        self,
+        searches: list,
+        max_evals: int = -1,
+        timeout: int = None,
+        checkpoint_interval: float = None,
+    ) -> list:
+        """Execute the searches concurrently until all of them are completed.
+
+        Args:
+            searches (list(Search)): the searches, created with evaluators returned by ``create_evaluator``.
+            max_evals (int, optional): The maximum number of evaluations of each search. Defaults to -1, will run indefinitely.
+            timeout (int, optional): The time budget shared by the searches before stopping. Defaults to None, will not impose a time budget.
+            checkpoint_interval (float, optional): Minimum number of seconds between two checkpoints of each search, see ``Search.search``. Defaults to None, no checkpoint is saved.
+
+        Raises:
+            DeephyperRuntimeError: if a search was not created with an evaluator of this driver.
+
+        Returns:
+            list(DataFrame): the evaluations performed by each search.
+        """
+        for search in searches:
+            if getattr(search._evaluator, "_driver", None) is not self:
+                raise DeephyperRuntimeError(
+                    "The searches run by a MultiSearch should be created with an evaluator returned by its 'create_evaluator' method!"
+                )
+
+        self._deadline = None if timeout is None else time.time() + timeout
+        results = [None] * len(searches)
+        errors = []
+
+        def run(i, search):
+            try:
+                results[i] = search.search(
+                    max_evals, checkpoint_interval=checkpoint_interval
+                )
+            except BaseException as e:
+                errors.append(e)
+                # the other searches are stopped
+                with self._cond:
+                    self._deadline = time.time()
+            finally:
+                search._evaluator.close()
+
+        threads = [
+            threading.Thread(target=run, args=(i, search), daemon=True)
+            for i, search in enumerate(searches)
+        ]
+        for thread in threads:
+            thread.start()
+
+        while any(thread.is_alive() for thread in threads):
+            self._dispatch()
+            if self._num_running > 0:
+                jobs = self._evaluator.gather(
+                    "BATCH", size=1, timeout=self.poll_interval
+                )
+                self._receive(jobs)
+            else:
+                with self._cond:
+                    self._cond.wait(self.poll_interval)
+
+        for thread in threads:
+            thread.join()
+        self._dispatch()
+
+        if len(errors) > 0:
+            raise errors[0]
+        return results
+
+    def _dispatch(self):
+        """Submit the queued configurations of the searches to the free workers and cancel the jobs of the ended searches."""
+        dispatched = []
+        cancelled = []
+        with self._cond:
+            free = self._evaluator.num_workers - self._num_running
+            while free > 0:
+                waiting = [ev for ev in self._evaluators if len(ev._queue) > 0]
+                if len(waiting) == 0:
+                    break
+                evaluator = min(
+                    waiting, key=lambda ev: (ev._num_running, ev._num_dispatched)
+                )
+                dispatched.append((evaluator, evaluator._queue.popleft()))
+                evaluator._num_running += 1
+                evaluator._num_dispatched += 1
+                self._num_running += 1
+                free -= 1
+
+            for evaluator in self._evaluators:
+                if evaluator._closed and not evaluator._cancelled:
+                    evaluator._cancelled = True
+                    cancelled.extend(
+                        job.id for job in evaluator.jobs if job.status == job.RUNNING
+                    )
+
+        if len(cancelled) > 0:
+            self._evaluator.cancel(cancelled)
+
+        if len(dispatched) > 0:
+            self._evaluator.submit([config for _, config in dispatched])
+            jobs = self._evaluator.jobs[-len(dispatched) :]
+            with self._cond:
+                for (evaluator, _), job in zip(dispatched, jobs):
+                    evaluator.jobs.append(job)
+                    self._job_evaluators[job.id] = evaluator
+
+    def _receive(self, jobs: list):
+        """Give the jobs gathered from the shared evaluator to the searches which submitted them."""
+        with self._cond:
+            for job in jobs:
+                evaluator = self._job_evaluators.pop(job.id)
+                evaluator._num_running -= 1
+                self._num_running -= 1
+                if not evaluator._closed:
+                    evaluator._received.append(job)
+            self._cond.notify_all()
+
+        # the evaluations are dumped by the evaluators of the searches
+        self._evaluator.jobs_done = []
@@ -0,0 +1,224 @@
+import collections
+import copy
+import heapq
+import math
+
+import numpy as np
+
+# Keys added by the schedulers to the configurations given to the run-function
+TRIAL_ID = "trial_id"
+BUDGET = "budget"
+INITIAL_BUDGET = "initial_budget"
+
+
+class SuccessiveHalving:
+    """Asynchronous `successive halving <https://arxiv.org/abs/1810.05934>`_ (ASHA) multi-fidelity scheduler. A configuration generated by the search is a trial evaluated with an increasing budget (e.g., a number of training epochs) on a sequence of rungs. Each job evaluates a trial up to the budget of its rung and a trial is promoted to the next rung when its objective is in the top ``1 / reduction_factor`` of the objectives received on its rung. The trials which are not promoted yet are paused, they can be promoted later when more trials are received on their rung, and the trials which are never promoted are stopped.
+
+    Each time a job is completed the promoted trials are submitted in priority and the search generates new trials for the remaining workers. The scheduler adds the following keys to the configurations received by the ``run_function``:
+
+    * ``"trial_id"``: the identifier of the trial, which can be used to save and load the state of the trained model (e.g., its weights).
+    * ``"budget"``: the budget of the rung to reach.
+    * ``"initial_budget"``: the budget already spent by the trial on the previous rung, the evaluation of a promoted trial resumes from it (``0`` for a new trial).
+
+    The intermediate objectives reported by the ``run_function`` with ``deephyper.evaluator.report`` are recorded on the rungs passed by the job. The search learns from the objective of each trial at the budget of the first rung (``budgets[0]``), so that all the objectives it receives are comparable. With ``Hyperband`` a trial starting from a higher rung is given with the objective it reported at this budget, it is not given to the search if it did not report it.
+
+    Args:
+        min_budget (int|float, optional): budget of the first rung. Defaults to ``1``.
+        max_budget (int|float, optional): budget of the last rung. Defaults to ``27``.
+        reduction_factor (int, optional): factor between the budgets of two consecutive rungs, it is also the inverse of the fraction of trials promoted from a rung. Defaults to ``3``.
+
+    An example usage can be:
+
+    >>> search = AMBS(problem, evaluator, scheduler=SuccessiveHalving(min_budget=1, max_budget=81))
+    """
+
+    def __init__(
+        self,
+        min_budget: float = 1,
+        max_budget: float = 27,
+        reduction_factor: int = 3,
+    ):
+        if not (0 < min_budget <= max_budget):
+            raise ValueError(
+                "Parameter 'min_budget' should be positive and lower than 'max_budget'!"
+            )
+        if not (reduction_factor > 1):
+            raise ValueError("Parameter 'reduction_factor' should be greater than 1!")
+
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.reduction_factor = reduction_factor
+
+        # the budgets of the rungs are spaced geometrically from "max_budget"
+        num_rungs = (
+            int(math.floor(math.log(max_budget / min_budget, reduction_factor) + 1e-9))
+            + 1
+        )
+        self.budgets = [
+            max_budget / reduction_factor ** (num_rungs - 1 - k) for k in range(num_rungs)
+        ]
+        if isinstance(min_budget, int) and isinstance(max_budget, int):
+            self.budgets = [max(int(round(b)), 1) for b in self.budgets]
+
+        self._trials = {}  # Trial id -> configuration generated by the search.
+        self._brackets = {}  # Trial id -> index of the first rung of the trial.
+        self._rungs = collections.defaultdict(dict)  # (bracket, rung) -> {trial id: objective}
+        self._promoted = collections.defaultdict(set)  # (bracket, rung) -> trial ids promoted from the rung.
+
+    @property
+    def num_trials(self) -> int:
+        """Number of trials created."""
+        return len(self._trials)
+
+    def _sample_bracket(self) -> int:
+        return 0
+
+    def new_trial(self, config: dict) -> dict:
+        """Create a trial for a new configuration generated by the search.
+
+        Args:
+            config (dict): the configuration.
+
+        Returns:
+            dict: the configuration with the keys of the scheduler to be submitted to the evaluator.
+        """
+        trial_id = len(self._trials)
+        bracket = self._sample_bracket()
+        self._trials[trial_id] = copy.deepcopy(config)
+        self._brackets[trial_id] = bracket
+        return {
+            **config,
+            TRIAL_ID: trial_id,
+            BUDGET: self.budgets[bracket],
+            INITIAL_BUDGET: 0,
+        }
+
+    def update(self, jobs: list) -> tuple:
+        """Record the objectives of completed jobs and promote the trials for the workers they freed.
+
+        Args:
+            jobs (list(Job)): the jobs gathered from the evaluator.
+
+        Returns:
+            tuple: ``(results, promotions)`` where ``results`` is the list of ``(config, objective)`` of the new trials with their objective at the budget of the first rung and ``promotions`` is the list of configurations of the promoted trials to be submitted (at most ``len(jobs)``).
+        """
+        results = []
+        for job in jobs:
+            trial_id = job.config[TRIAL_ID]
+            bracket = self._brackets[trial_id]
+            rung = self.budgets.index(job.config[BUDGET])
+
+            # intermediate objectives reported at the budget of a previous rung
+            for budget, objective in job.reports:
+                if budget in self.budgets:
+                    j = self.budgets.index(budget)
+                    if bracket <= j < rung:
+                        self._rungs[(bracket, j)].setdefault(trial_id, objective)
+            self._rungs[(bracket, rung)][trial_id] = job.result
+
+            if job.config[INITIAL_BUDGET] == 0:
+                objective = self._first_objective(job, rung)
+                if objective is not None:
+                    results.append((copy.deepcopy(self._trials[trial_id]), objective))
+
+        return results, self.promote(len(jobs))
+
+    def _first_objective(self, job, rung: int):
+        """Objective of a new trial at the budget of the first rung, ``None`` if it was not reported."""
+        if rung == 0:
+            return job.result
+        for budget, objective in job.reports:
+            if budget == self.budgets[0]:
+                return objective
+        return None
+
+    def promote(self, n: int) -> list:
+        """Promote at most ``n`` trials, starting from the highest rungs.
+
+        Args:
+            n (int): maximum number of trials to promote.
+
+        Returns:
+            list: the configurations of the promoted trials.
+        """
+        promotions = []
+        brackets = sorted(set(self._brackets.values()))
+        for rung in reversed(range(len(self.budgets) - 1)):
+            for bracket in brackets:
+                if len(promotions) >= n:
+                    return promotions
+                if bracket > rung:
+                    continue
+                objectives = self._rungs[(bracket, rung)]
+                num_top = len(objectives) // self.reduction_factor
+                if num_top == 0:
+                    continue
+                promoted = self._promoted[(bracket, rung)]
+                top = heapq.nlargest(num_top, objectives, key=objectives.get)
+                for trial_id in top:
+                    if len(promotions) >= n:
+                        break
+                    if trial_id in promoted:
+                        continue
+                    promoted.add(trial_id)
+                    promotions.append(
+                        {
+                            **self._trials[trial_id],
+                            TRIAL_ID: trial_id,
+                            BUDGET: self.budgets[rung + 1],
+                            INITIAL_BUDGET: self.budgets[rung],
+                        }
+                    )
+        return promotions
+
+    def strip(self, config: dict) -> dict:
+        """Remove the keys added by the scheduler from a configuration.
+
+        Args:
+            config (dict): a configuration submitted with the keys of the scheduler.
+
+        Returns:
+            dict: a copy of the configuration without the keys of the scheduler.
+        """
+        return {
+            k: v
+            for k, v in config.items()
+            if k not in [TRIAL_ID, BUDGET, INITIAL_BUDGET]
+        }
+
+
+class Hyperband(SuccessiveHalving):
+    """Asynchronous `Hyperband <https://arxiv.org/abs/1603.06560>`_ multi-fidelity scheduler. It runs asynchronous successive halving in several brackets which start from the different rungs, each new trial is assigned to a random bracket. The brackets starting from the first rungs evaluate more trials with a small budget, the brackets starting from the last rungs fewer trials with a large budget which is more robust when the objectives at small budgets are not predictive of the final objectives. See ``SuccessiveHalving`` for the keys added to the configurations.
+
+    Args:
+        min_budget (int|float, optional): budget of the first rung. Defaults to ``1``.
+        max_budget (int|float, optional): budget of the last rung. Defaults to ``27``.
+        reduction_factor (int, optional): factor between the budgets of two consecutive rungs. Defaults to ``3``.
+        random_state (int, optional): random seed used to assign the trials to the brackets. Defaults to ``None``.
+    """
+
+    def __init__(
+        self,
+        min_budget: float = 1,
+        max_budget: float = 27,
+        reduction_factor: int = 3,
+        random_state: int = None,
+    ):
+        super().__init__(min_budget, max_budget, reduction_factor)
+        self._random_state = np.random.RandomState(random_state)
+
+        # number of trials of each bracket in the synchronous Hyperband
+        s_max = len(self.budgets) - 1
+        num_trials = np.array(
+            [
+                math.ceil((s_max + 1) / (s + 1) * reduction_factor ** s)
+                for s in reversed(range(s_max + 1))
+            ],
+            dtype=float,
+        )
+        self._bracket_probs = num_trials / num_trials.sum()
+
+    def _sample_bracket(self) -> int:
+        return int(
+            self._random_state.choice(len(self._bracket_probs), p=self._bracket_probs)
+        )
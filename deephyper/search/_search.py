@@ -3,11 +3,15 @@ import copy
 import logging
 import os
 import pathlib
+import pickle
 import signal
+import time
 
 import numpy as np
-import pandas as pd
-from deephyper.core.exceptions import SearchTerminationError
+from deephyper.core.exceptions import DeephyperRuntimeError, SearchTerminationError
+
+# Default name of the checkpoint file in the log directory of the search
+CHECKPOINT_FILE = "checkpoint.pkl"
 
 
 class Search(abc.ABC):
@@ -20,6 +24,10 @@ class Search(abc.ABC):
         log_dir (str, optional): [description]. Defaults to ".".
         verbose (int, optional): [description]. Defaults to 0.
     """
+
+    # Attributes of the search saved by ``save_checkpoint`` in addition to its random state.
+    _checkpoint_attributes = []
+
     def __init__(
         self, problem, evaluator, random_state=None, log_dir=".", verbose=0, **kwargs
     ):
@@ -42,6 +50,11 @@ class Search(abc.ABC):
 
         self._verbose = verbose
 
+        self._pending_configs = []  # Configurations of the jobs running when the loaded checkpoint was saved.
+        self._checkpoint_interval = None
+        self._last_checkpoint = None
+        self._scheduler = None  # Multi-fidelity scheduler of the jobs (e.g., SuccessiveHalving).
+
     def terminate(self):
         """Terminate the search.
 
@@ -55,36 +68,127 @@ class Search(abc.ABC):
         def handler(signum, frame):
             self.terminate()
 
-        signal.signal(signal.SIGALRM, handler)
-
+        # the handler can only be set from the main thread, the searches run by a MultiSearch have no timeout
         if np.isscalar(timeout) and timeout > 0:
+            signal.signal(signal.SIGALRM, handler)
             signal.alarm(timeout)
 
-    def search(self, max_evals: int=-1, timeout: int=None):
+    def search(self, max_evals: int=-1, timeout: int=None, checkpoint_interval: float=None):
         """Execute the search algorithm.
 
         Args:
             max_evals (int, optional): The maximum number of evaluations of the run function to perform before stopping the search. Defaults to -1, will run indefinitely.
             timeout (int, optional): The time budget of the search before stopping.Defaults to None, will not impose a time budget.
+            checkpoint_interval (float, optional): Minimum number of seconds between two checkpoints of the search saved in the ``"checkpoint.pkl"`` file of the log directory, see ``save_checkpoint``. A checkpoint is also saved at the end of the search. Defaults to None, no checkpoint is saved.
 
         Returns:
             DataFrame: a pandas DataFrame containing the evaluations performed.
         """
 
         self._set_timeout(timeout)
+        self._checkpoint_interval = checkpoint_interval
+        self._last_checkpoint = time.time()
 
         try:
             self._search(max_evals, timeout)
+            if self._checkpoint_interval is not None:
+                self.save_checkpoint()
         except SearchTerminationError:
-            if "saved_keys" in dir(self):
-                self._evaluator.dump_evals(saved_keys=self.saved_keys)
-            else:
-                self._evaluator.dump_evals()
-
-        path_results = os.path.join(self._log_dir, "results.csv")
-        df_results = pd.read_csv(path_results)
+            self._evaluator.dump_evals(
+                saved_keys=getattr(self, "_saved_keys", None), log_dir=self._log_dir
+            )
+            # release the workers still busy with jobs which will not be gathered
+            self._evaluator.close()
+        finally:
+            # cancel the pending alarm when the search ended before the timeout
+            if np.isscalar(timeout) and timeout > 0:
+                signal.alarm(0)
+
+        self._evaluator.flush_evals()
+        df_results = self._evaluator.get_evals()
         return df_results
 
+    def save_checkpoint(self, path: str = None):
+        """Save the state of the search in a binary (pickle) file: the random state, the state of the search algorithm (e.g., its optimizer or population), the evaluations done so far and the configurations of the jobs still running. The search can then be resumed with ``load_checkpoint`` without replaying the evaluations. It is called between two iterations of the search when ``checkpoint_interval`` is given to ``search``.
+
+        Args:
+            path (str, optional): path of the checkpoint file. Defaults to None for ``"checkpoint.pkl"`` in the log directory.
+        """
+        if path is None:
+            path = os.path.join(self._log_dir, CHECKPOINT_FILE)
+
+        state = {
+            "search": type(self).__name__,
+            "random_state": self._random_state,
+            "attributes": {
+                name: getattr(self, name) for name in self._checkpoint_attributes
+            },
+            "evaluator": self._evaluator.get_state(),
+        }
+
+        # the previous checkpoint is replaced only once the new one is complete
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._last_checkpoint = time.time()
+
+    def load_checkpoint(self, path: str = None):
+        """Restore the state of the search from a file saved by ``save_checkpoint``. The search must be created with the same problem, the jobs which were running when the checkpoint was saved are submitted again by the next call to ``search``.
+
+        Args:
+            path (str, optional): path of the checkpoint file. Defaults to None for ``"checkpoint.pkl"`` in the log directory.
+
+        Raises:
+            DeephyperRuntimeError: if the checkpoint was saved by another search algorithm.
+        """
+        if path is None:
+            path = os.path.join(self._log_dir, CHECKPOINT_FILE)
+
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+
+        if state["search"] != type(self).__name__:
+            raise DeephyperRuntimeError(
+                f"The checkpoint '{path}' was saved by a {state['search']} search and cannot be loaded by a {type(self).__name__} search!"
+            )
+
+        self._random_state = state["random_state"]
+        for name, value in state["attributes"].items():
+            setattr(self, name, value)
+        self._pending_configs = self._evaluator.set_state(state["evaluator"])
+
+    def _checkpoint(self):
+        """Save a checkpoint if ``checkpoint_interval`` seconds passed since the last one. Called by the search algorithms at the end of an iteration."""
+        if (
+            self._checkpoint_interval is not None
+            and time.time() - self._last_checkpoint >= self._checkpoint_interval
+        ):
+            self.save_checkpoint()
+
+    def _submit_initial_batch(self, create_batch, size: int):
+        """Submit the first batch of the search, created with ``create_batch(size=...)``. The jobs running when the loaded checkpoint was saved are submitted first."""
+        batch, self._pending_configs = self._pending_configs, []
+        if len(batch) < size:
+            batch.extend(self._new_trials(create_batch(size=size - len(batch))))
+        self._evaluator.submit(batch)
+
+    def _new_trials(self, configs: list) -> list:
+        """Create the trials of the multi-fidelity scheduler for new configurations generated by the search. The configurations are returned unchanged without scheduler."""
+        if self._scheduler is None:
+            return configs
+        return [self._scheduler.new_trial(config) for config in configs]
+
+    def _schedule(self, jobs: list) -> tuple:
+        """Give the completed ``jobs`` to the multi-fidelity scheduler.
+
+        Returns:
+            tuple: ``(results, promotions)`` the ``(config, objective)`` results the search learns from and the configurations of the promoted trials to submit before the new configurations. Without scheduler the results are the ``jobs`` and there is no promotion.
+        """
+        if self._scheduler is None:
+            return jobs, []
+        return self._scheduler.update(jobs)
+
     @abc.abstractmethod
     def _search(self, max_evals, timeout):
         """Search algorithm to be implemented.
@@ -1,5 +1,9 @@
+import collections
 import logging
 import math
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import ConfigSpace as CS
 import ConfigSpace.hyperparameters as csh
@@ -7,6 +11,10 @@ import numpy as np
 import pandas as pd
 import skopt
 from deephyper.search._search import Search
+from deephyper.search.hps._candidates import CandidateGenerator
+from deephyper.search.hps._sparse_gp import SparseGaussianProcessRegressor
+from sklearn.base import clone
+from skopt.acquisition import _gaussian_acquisition
 
 # Adapt minimization -> maximization with DeepHyper
 MAP_liar_strategy = {
@@ -27,16 +35,33 @@ class AMBS(Search):
         random_state (int, optional): Random seed. Defaults to ``None``.
         log_dir (str, optional): Log directory where search's results are saved. Defaults to ``"."``.
         verbose (int, optional): Indicate the verbosity level of the search. Defaults to ``0``.
-        surrogate_model (str, optional): Surrogate model used by the Bayesian optimization. Can be a value in ``["RF", "ET", "GBRT", "DUMMY"]``. Defaults to ``"RF"``.
+        surrogate_model (str, optional): Surrogate model used by the Bayesian optimization. Can be a value in ``["RF", "ET", "GBRT", "GP", "DUMMY"]``. ``"GP"`` is a Gaussian process with a sparse approximation on a subset of the observations, its cost grows linearly with the number of observations and it is updated incrementally between the fits of its hyperparameters when ``acq_optimizer="vectorized"`` or with the ``"qUCB"`` and ``"qTS"`` strategies. Defaults to ``"RF"``.
         acq_func (str, optional): Acquisition function used by the Bayesian optimization. Can be a value in ``["UCB", "EI", "PI", "gp_hedge"]``. Defaults to ``"UCB"``.
         kappa (float, optional): Manage the exploration/exploitation tradeoff for the "UCB" acquisition function. Defaults to ``1.96`` which corresponds to 95% of the confidence interval.
         xi (float, optional): Manage the exploration/exploitation tradeoff of ``"EI"`` and ``"PI"`` acquisition function. Defaults to ``0.001``.
         n_points (int, optional): The number of configurations sampled from the search space to infer each batch of new evaluated configurations.
+        acq_optimizer (str, optional): Method used to optimize the acquisition function. Can be a value in ``["sampling", "vectorized"]``. ``"sampling"`` ranks ``n_points`` configurations sampled from the search space at each fit of the surrogate model. ``"vectorized"`` samples and encodes the configurations by batches of NumPy arrays and keeps a pool of ``n_points`` candidates between two asks, a fraction of the pool is renewed at each ask with random configurations and perturbations of the best configuration found so far. Defaults to ``"sampling"``.
         filter_duplicated (bool, optional): Force the optimizer to sample unique points until the search space is "exhausted" in the sens that no new unique points can be found given the sampling size ``n_points``. Defaults to ``True``.
-        liar_strategy (str, optional): Definition of the constant value use for the Liar strategy. Can be a value in ``["cl_min", "cl_mean", "cl_max"]`` . Defaults to ``"cl_max"``.
+        liar_strategy (str, optional): Strategy used to select a batch of several configurations. Can be a value in ``["cl_min", "cl_mean", "cl_max", "qUCB", "qTS"]``. The ``"cl_*"`` values define the constant value used by the Liar strategy, which fits the surrogate model again for each configuration of the batch. The ``"qUCB"`` and ``"qTS"`` strategies fit the surrogate model once and select the whole batch from the same predictions of the sampled configurations: ``"qUCB"`` uses the UCB acquisition function with a different ``kappa`` for each configuration of the batch (drawn from an exponential distribution of mean ``kappa``), ``"qTS"`` (Thompson sampling) uses the predictions of a random tree of the surrogate model for each configuration of the batch (a random sample of the predictive distribution if the surrogate model is not a forest). These two strategies replace the acquisition function ``acq_func``. Defaults to ``"cl_max"``.
         n_jobs (int, optional): Number of parallel processes used to fit the surrogate model of the Bayesian optimization. A value of ``-1`` will use all available cores. Defaults to ``1``.
+        refit_interval (int, optional): Minimum number of new results received between two fits of the surrogate model. In between, the results are recorded without fitting and new configurations are selected with the acquisition function of the last fitted model. Defaults to ``1``, the surrogate model is fitted each time new results are received.
+        refit_budget (float, optional): Maximum fraction of the search time spent fitting the surrogate model, fits are postponed while it is exceeded. Defaults to ``None``, no limit.
+        async_fit (bool, optional): If ``True`` the surrogate model is fitted in a background thread which pre-computes a queue of ``num_workers`` configurations with the Liar strategy. The search loop does not wait for the fit: new configurations are taken from the last computed queue (random configurations are used if it is empty) and the queue is replaced as soon as a new fit is completed. Defaults to ``False``.
+        scheduler (SuccessiveHalving, optional): Multi-fidelity scheduler from ``deephyper.search`` (e.g., ``SuccessiveHalving`` or ``Hyperband``) evaluating each configuration with an increasing budget, the surrogate model learns from the objectives of the configurations at the budget of the first rung. Defaults to ``None``, each configuration is evaluated once.
     """
 
+    _checkpoint_attributes = [
+        "_opt",
+        "_opt_kwargs",
+        "_fitted",
+        "_num_unfitted",
+        "_candidates",
+        "_ask_queue",
+        "_generator",
+        "_pool_values",
+        "_scheduler",
+    ]
+
     def __init__(
         self,
         problem,
@@ -49,16 +74,21 @@ class AMBS(Search):
         kappa: float = 1.96,
         xi: float = 0.001,
         n_points: int = 10000,
+        acq_optimizer: str = "sampling",
         filter_duplicated: bool = True,
         liar_strategy: str = "cl_max",
         n_jobs: int = 1,  # 32 is good for Theta
+        refit_interval: int = 1,
+        refit_budget: float = None,
+        async_fit: bool = False,
+        scheduler=None,
         **kwargs,
     ):
 
         super().__init__(problem, evaluator, random_state, log_dir, verbose)
 
         # check input parameters
-        surrogate_model_allowed = ["RF", "ET", "GBRT", "DUMMY"]
+        surrogate_model_allowed = ["RF", "ET", "GBRT", "GP", "DUMMY"]
         if not (surrogate_model in surrogate_model_allowed):
             raise ValueError(
                 f"Parameter 'surrogate_model={surrogate_model}' should have a value in {surrogate_model_allowed}!"
@@ -79,10 +109,16 @@ class AMBS(Search):
         if not (type(n_points) is int):
             raise ValueError("Parameter 'n_points' shoud be an integer value!")
 
+        acq_optimizer_allowed = ["sampling", "vectorized"]
+        if not (acq_optimizer in acq_optimizer_allowed):
+            raise ValueError(
+                f"Parameter 'acq_optimizer={acq_optimizer}' should have a value in {acq_optimizer_allowed}!"
+            )
+
         if not (type(filter_duplicated) is bool):
             raise ValueError("Parameter 'filter_duplicated' should be a boolean value!")
 
-        liar_strategy_allowed = ["cl_min", "cl_mean", "cl_max"]
+        liar_strategy_allowed = ["cl_min", "cl_mean", "cl_max", "qUCB", "qTS"]
         if not (liar_strategy in liar_strategy_allowed):
             raise ValueError(
                 f"Parameter 'liar_strategy={liar_strategy}' should have a value in {liar_strategy_allowed}!"
@@ -91,9 +127,35 @@ class AMBS(Search):
         if not (type(n_jobs) is int):
             raise ValueError(f"Parameter 'n_jobs' should be an integer value!")
 
+        if not (type(refit_interval) is int and refit_interval >= 1):
+            raise ValueError(
+                "Parameter 'refit_interval' should be an integer value greater than 0!"
+            )
+
+        if not (refit_budget is None or 0 < refit_budget <= 1):
+            raise ValueError("Parameter 'refit_budget' should be a value in (0, 1]!")
+
+        if not (type(async_fit) is bool):
+            raise ValueError("Parameter 'async_fit' should be a boolean value!")
+
         self._n_initial_points = self._evaluator.num_workers
         self._liar_strategy = MAP_liar_strategy.get(liar_strategy, liar_strategy)
+        self._batch_strategy = liar_strategy in ["qUCB", "qTS"]
         self._fitted = False
+        self._refit_interval = refit_interval
+        self._refit_budget = refit_budget
+        self._num_unfitted = 0  # Results received since the last fit of the surrogate model.
+        self._fit_time = 0  # Time spent fitting the surrogate model.
+        self._search_start = None
+        self._candidates = None  # (model, candidates, ranking) used between two fits.
+        self._async_fit = async_fit
+        self._fit_executor = None  # Thread fitting the surrogate model when "async_fit=True".
+        self._fit_future = None  # Future of the ask-queue computed by the background fit.
+        self._ask_queue = collections.deque()  # Configurations pre-computed by the last background fit.
+        self._vectorized = acq_optimizer == "vectorized"
+        self._generator = None  # Pool of candidates when "acq_optimizer='vectorized'".
+        self._pool_values = None  # (model, acquisition values of the pool) used between two fits.
+        self._scheduler = scheduler
 
         self._opt = None
         self._opt_kwargs = dict(
@@ -115,23 +177,51 @@ class AMBS(Search):
             },
             n_initial_points=self._n_initial_points,
             random_state=self._random_state,
+            # only the last fitted model is used
+            model_queue_size=1,
         )
 
     def _setup_optimizer(self):
         if self._fitted:
             self._opt_kwargs["n_initial_points"] = 0
         self._opt = skopt.Optimizer(**self._opt_kwargs)
+        if self._vectorized:
+            self._generator = self._create_generator(self._opt)
+
+    def _create_generator(self, opt):
+        return CandidateGenerator(
+            opt.space,
+            pool_size=opt.n_points,
+            filter_duplicated=opt.filter_duplicated,
+            random_state=opt.rng,
+        )
 
     def _search(self, max_evals, timeout):
 
         if self._opt is None:
             self._setup_optimizer()
 
+        if self._search_start is None:
+            self._search_start = time.time()
+
+        if self._async_fit and self._fit_executor is None:
+            self._fit_executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            self._search_loop(max_evals)
+        finally:
+            if self._fit_executor is not None:
+                self._fit_executor.shutdown(wait=False)
+                self._fit_executor = None
+                self._fit_future = None
+
+    def _search_loop(self, max_evals):
+
         num_evals_done = 0
 
         # Filling available nodes at start
         logging.info(f"Generating {self._evaluator.num_workers} initial points...")
-        self._evaluator.submit(self.get_random_batch(size=self._n_initial_points))
+        self._submit_initial_batch(self.get_random_batch, self._n_initial_points)
 
         # Main loop
         while max_evals < 0 or num_evals_done < max_evals:
@@ -145,26 +235,348 @@ class AMBS(Search):
                 num_received = len(new_results)
                 num_evals_done += num_received
 
+                # promoted trials of the scheduler are submitted before new configurations
+                results, new_batch = self._schedule(new_results)
+
                 # Transform configurations to list to fit optimizer
                 opt_X = []
                 opt_y = []
-                for cfg, obj in new_results:
+                for cfg, obj in results:
                     x = replace_nan(cfg.values())
                     opt_X.append(x)
                     opt_y.append(-obj)  #! maximizing
-                self._opt.tell(opt_X, opt_y)  #! fit: costly
-                new_X = self._opt.ask(
-                    n_points=len(new_results), strategy=self._liar_strategy
+                new_X = self._tell_and_ask(
+                    opt_X, opt_y, n_points=num_received - len(new_batch)
                 )
 
-                new_batch = []
-                for x in new_X:
-                    new_cfg = self.to_dict(x)
-                    new_batch.append(new_cfg)
+                new_batch.extend(self._new_trials([self.to_dict(x) for x in new_X]))
 
                 # submit_childs
-                if len(new_results) > 0:
-                    self._evaluator.submit(new_batch)
+                self._evaluator.submit(new_batch)
+
+                self._checkpoint()
+
+    def _should_refit(self) -> bool:
+        if not self._opt.models:
+            return True
+        if self._num_unfitted < self._refit_interval:
+            return False
+        if self._refit_budget is not None:
+            elapsed = time.time() - self._search_start
+            return self._fit_time <= self._refit_budget * elapsed
+        return True
+
+    def _tell_and_ask(self, opt_X, opt_y, n_points=None):
+        """Give new results to the optimizer and return ``n_points`` new points to evaluate (as many as the results by default). The surrogate model is fitted according to ``refit_interval`` and ``refit_budget``."""
+        if n_points is None:
+            n_points = len(opt_y)
+
+        if self._async_fit:
+            return self._tell_and_ask_async(opt_X, opt_y, n_points)
+
+        self._num_unfitted += len(opt_y)
+
+        if len(opt_y) == 0 or n_points == 0:
+            # nothing to fit or to ask (e.g., all the workers received promoted trials)
+            t_start = time.time()
+            if len(opt_y) > 0:
+                self._opt.tell(opt_X, opt_y, fit=False)
+            t_tell = time.time()
+            if n_points == 0:
+                new_X = []
+            elif self._vectorized:
+                new_X = self._ask_vectorized(
+                    self._opt, self._generator, n_points, fit=False
+                )
+            else:
+                new_X = self._ask_from_last_model(n_points)
+            t_ask = time.time()
+        elif self._vectorized:
+            fit = self._should_refit()
+            t_start = time.time()
+            self._opt.tell(opt_X, opt_y, fit=False)
+            t_tell = time.time()
+            new_X = self._ask_vectorized(self._opt, self._generator, n_points, fit=fit)
+            t_ask = time.time()
+            if fit:
+                self._fit_time += t_ask - t_start
+                self._num_unfitted = 0
+        elif self._should_refit() and self._batch_strategy:
+            t_start = time.time()
+            self._opt.tell(opt_X, opt_y, fit=False)
+            t_tell = time.time()
+            new_X = self._ask_batch(self._opt, n_points)
+            t_ask = time.time()
+            self._fit_time += t_ask - t_start
+            self._num_unfitted = 0
+        elif self._should_refit():
+            t_start = time.time()
+            self._opt.tell(opt_X, opt_y)  #! fit: costly
+            t_tell = time.time()
+            if n_points == 1:
+                # the point was already selected by the fit of "tell"
+                new_X = [self._opt.ask()]
+            else:
+                new_X = self._opt.ask(n_points=n_points, strategy=self._liar_strategy)
+            t_ask = time.time()
+            self._fit_time += t_ask - t_start
+            self._num_unfitted = 0
+        else:
+            t_start = time.time()
+            self._opt.tell(opt_X, opt_y, fit=False)
+            t_tell = time.time()
+            new_X = self._ask_from_last_model(n_points)
+            t_ask = time.time()
+
+        self._evaluator.add_search_span("tell", t_start, t_tell)
+        self._evaluator.add_search_span("ask", t_tell, t_ask)
+        return new_X
+
+    def _fit_model(self, opt, X, y):
+        """Fit a new surrogate model on the encoded configurations ``X`` and objectives ``y``."""
+        last_model = opt.models[-1] if opt.models else None
+        if isinstance(last_model, SparseGaussianProcessRegressor):
+            # updated incrementally when X, y extend the observations of the last model
+            return last_model.refit(X, y)
+
+        model = clone(opt.base_estimator_)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            model.fit(X, y)
+        return model
+
+    def _acquisition(self, opt, model, X, y_opt):
+        return _gaussian_acquisition(
+            X=X,
+            model=model,
+            y_opt=y_opt,
+            acq_func=opt.cand_acq_funcs_[0],
+            acq_func_kwargs=opt.acq_func_kwargs,
+        )
+
+    def _select_batch(self, opt, model, X, n_points, available):
+        """Select the indexes of ``n_points`` candidates of ``X`` with the "qUCB" or "qTS" strategy, the surrogate model ``model`` is evaluated once for all the candidates.
+
+        Args:
+            available (np.ndarray): boolean mask of the candidates which can be selected, it is updated with the selected candidates.
+        """
+        if self._liar_strategy == "qTS" and hasattr(model, "estimators_"):
+            # predictions of each tree of the forest
+            samples = np.array([tree.predict(X) for tree in model.estimators_])
+            mu, std = None, None
+        else:
+            mu, std = model.predict(X, return_std=True)
+
+        kappa = opt.acq_func_kwargs.get("kappa", 1.96)
+        selected = []
+        while len(selected) < n_points and available.any():
+            if self._liar_strategy == "qUCB":
+                values = mu - opt.rng.exponential(kappa) * std
+            elif mu is None:
+                values = samples[opt.rng.randint(len(samples))]
+            else:
+                values = mu + std * opt.rng.normal(size=len(mu))
+            i = int(np.argmin(np.where(available, values, np.inf)))
+            available[i] = False
+            selected.append(i)
+        return selected
+
+    def _ask_batch(self, opt, n_points):
+        """Fit the surrogate model of ``opt`` and select ``n_points`` among ``opt.n_points`` sampled configurations with the "qUCB" or "qTS" strategy."""
+        if opt._n_initial_points > 0 or opt.base_estimator_ is None:
+            return opt.ask(n_points=n_points)
+
+        space = opt.space
+        model = self._fit_model(
+            opt, space.imp_const.fit_transform(space.transform(opt.Xi)), opt.yi
+        )
+        opt.models = [model]
+
+        X_s = space.rvs(n_samples=opt.n_points, random_state=opt.rng)
+        X_s = opt._filter_duplicated(X_s)
+        X = space.imp_const.fit_transform(space.transform(X_s))
+        selected = self._select_batch(
+            opt, model, X, n_points, np.ones(len(X), dtype=bool)
+        )
+
+        new_X = [X_s[i] for i in selected]
+        if len(new_X) < n_points:
+            new_X.extend(
+                space.rvs(n_samples=n_points - len(new_X), random_state=opt.rng)
+            )
+        opt.sampled.extend(new_X)
+        return new_X
+
+    def _rank_candidates(self, generator, values, selected):
+        """Iterate over the candidates of the pool from the best to the worst acquisition value, skipping the ``selected`` and already seen ones."""
+        seen = generator.seen
+        for i in np.argsort(values):
+            if i not in selected and not seen[i]:
+                yield i
+
+    def _ask_vectorized(self, opt, generator, n_points, fit=True, cache=True):
+        """Select ``n_points`` configurations from the pool of candidates of ``generator``. If ``fit`` is ``True`` a new surrogate model is fitted (once per lie of the Liar strategy), otherwise the acquisition values of the last fitted model are used and only the renewed candidates are scored."""
+        if opt._n_initial_points > 0 or opt.base_estimator_ is None:
+            new_X = generator.sample(n_points)
+            opt.sampled.extend(new_X)
+            return new_X
+
+        refreshed = generator.refresh(incumbent=opt.Xi[int(np.argmin(opt.yi))])
+        y_opt = np.min(opt.yi)
+        if fit or not cache or self._pool_values is None:
+            X, y = generator.encode(opt.Xi), list(opt.yi)
+            model = self._fit_model(opt, X, y)
+            opt.models = [model]
+            values = self._acquisition(opt, model, generator.X, y_opt)
+        else:
+            model, values = self._pool_values
+            if len(refreshed) > 0:
+                values[refreshed] = self._acquisition(
+                    opt, model, generator.X[refreshed], y_opt
+                )
+
+        selected = []
+        if fit and self._batch_strategy:
+            available = ~generator.seen
+            selected = self._select_batch(opt, model, generator.X, n_points, available)
+        ranking = self._rank_candidates(generator, values, selected)
+        while len(selected) < n_points:
+            i = next(ranking, None)
+            if i is None:
+                break
+            selected.append(i)
+            if fit and not self._batch_strategy and len(selected) < n_points:
+                # Liar strategy: the model is fitted again with a lie for the selected point
+                if self._liar_strategy == "cl_min":
+                    y_lie = np.min(y)
+                elif self._liar_strategy == "cl_mean":
+                    y_lie = np.mean(y)
+                else:
+                    y_lie = np.max(y)
+                X = np.vstack([X, generator.X[i]])
+                y.append(y_lie)
+                lie_model = self._fit_model(opt, X, y)
+                lie_values = self._acquisition(opt, lie_model, generator.X, np.min(y))
+                ranking = self._rank_candidates(generator, lie_values, selected)
+
+        new_X = [generator.point(i) for i in selected]
+        generator.mark_seen(generator.X[selected])
+        generator.remove(selected)
+        if cache:
+            self._pool_values = (model, values)
+        if len(new_X) < n_points:
+            new_X.extend(generator.sample(n_points - len(new_X)))
+        opt.sampled.extend(new_X)
+        return new_X
+
+    def _tell_and_ask_async(self, opt_X, opt_y, n_points):
+        """Same as ``_tell_and_ask`` but the surrogate model is fitted by a background thread, the new points are taken from the last ask-queue it computed."""
+        self._num_unfitted += len(opt_y)
+
+        t_start = time.time()
+        if len(opt_y) > 0:
+            self._opt.tell(opt_X, opt_y, fit=False)
+        t_tell = time.time()
+
+        # swap the ask-queue when a background fit is completed
+        if self._fit_future is not None and self._fit_future.done():
+            self._ask_queue = collections.deque(self._fit_future.result())
+            self._fit_future = None
+
+        if self._fit_future is None and self._should_refit_async():
+            # the background thread works on a snapshot of the observations
+            self._fit_future = self._fit_executor.submit(
+                self._fit_ask_queue,
+                self._opt.Xi[:],
+                self._opt.yi[:],
+                self._opt.sampled[:],
+                self._random_state.randint(0, np.iinfo(np.int32).max),
+            )
+            self._num_unfitted = 0
+
+        new_X = []
+        while len(self._ask_queue) > 0 and len(new_X) < n_points:
+            new_X.append(self._ask_queue.popleft())
+        if len(new_X) < n_points:
+            new_X.extend(
+                self._opt.space.rvs(
+                    n_samples=n_points - len(new_X), random_state=self._opt.rng
+                )
+            )
+        self._opt.sampled.extend(new_X)
+
+        self._evaluator.add_search_span("tell", t_start, t_tell)
+        self._evaluator.add_search_span("ask", t_tell, time.time())
+        return new_X
+
+    def _should_refit_async(self) -> bool:
+        if self._num_unfitted < self._refit_interval:
+            return False
+        if self._refit_budget is not None:
+            elapsed = time.time() - self._search_start
+            return self._fit_time <= self._refit_budget * elapsed
+        return True
+
+    def _fit_ask_queue(self, Xi, yi, sampled, random_state):
+        """Fit the surrogate model on the given observations and compute the next ``num_workers`` points to evaluate with the Liar strategy. Executed by the background thread."""
+        t_start = time.time()
+        opt = skopt.Optimizer(**{**self._opt_kwargs, "random_state": random_state})
+        if self._vectorized:
+            opt.tell(Xi, yi, fit=False)
+            generator = self._create_generator(opt)
+            if len(sampled) > 0:
+                generator.mark_seen(generator.encode(sampled))
+            ask_queue = self._ask_vectorized(
+                opt, generator, self._evaluator.num_workers, cache=False
+            )
+        elif self._batch_strategy:
+            opt.tell(Xi, yi, fit=False)
+            opt.sampled = sampled
+            ask_queue = self._ask_batch(opt, self._evaluator.num_workers)
+        else:
+            opt.tell(Xi, yi, fit=False)
+            opt.sampled = sampled
+            ask_queue = opt.ask(
+                n_points=self._evaluator.num_workers, strategy=self._liar_strategy
+            )
+        t_end = time.time()
+        self._fit_time += t_end - t_start
+        self._evaluator.add_search_span("background_fit", t_start, t_end)
+        return ask_queue
+
+    def _ask_from_last_model(self, n_points):
+        """Select the ``n_points`` best configurations for the acquisition function of the last fitted surrogate model. The random candidates are sampled and ranked once per fitted model, the next best candidates are returned by the following calls."""
+        opt = self._opt
+        if not opt.models:
+            new_X = opt.space.rvs(n_samples=n_points, random_state=opt.rng)
+            opt.sampled.extend(new_X)
+            return new_X
+
+        model = opt.models[-1]
+        if self._candidates is None or self._candidates[0] is not model:
+            X_s = opt.space.rvs(n_samples=opt.n_points, random_state=opt.rng)
+            X_s = opt._filter_duplicated(X_s)
+            X = opt.space.imp_const.fit_transform(opt.space.transform(X_s))
+            values = _gaussian_acquisition(
+                X=X,
+                model=model,
+                y_opt=np.min(opt.yi),
+                acq_func=opt.cand_acq_funcs_[0],
+                acq_func_kwargs=opt.acq_func_kwargs,
+            )
+            # the best candidate is at the end of the ranking
+            self._candidates = (model, X_s, np.argsort(values)[::-1].tolist())
+
+        _, X_s, ranking = self._candidates
+        new_X = []
+        while len(ranking) > 0 and len(new_X) < n_points:
+            new_X.append(X_s[ranking.pop()])
+        if len(new_X) < n_points:
+            new_X.extend(
+                opt.space.rvs(n_samples=n_points - len(new_X), random_state=opt.rng)
+            )
+        opt.sampled.extend(new_X)
+        return new_X
 
     def _get_surrogate_model(
         self, name: str, n_jobs: int = None, random_state: int = None
@@ -178,7 +590,7 @@ class AMBS(Search):
         Raises:
             ValueError: when the name of the surrogate model is unknown.
         """
-        accepted_names = ["RF", "ET", "GBRT", "DUMMY"]
+        accepted_names = ["RF", "ET", "GBRT", "GP", "DUMMY"]
         if not (name in accepted_names):
             raise ValueError(
                 f"Unknown surrogate model {name}, please choose among {accepted_names}."
@@ -196,7 +608,9 @@ class AMBS(Search):
             surrogate = skopt.learning.GradientBoostingQuantileRegressor(
                 n_jobs=n_jobs, random_state=random_state
             )
-        else:  # for DUMMY and GP
+        elif name == "GP":
+            surrogate = SparseGaussianProcessRegressor(random_state=random_state)
+        else:  # for DUMMY
             surrogate = name
 
         return surrogate
@@ -419,7 +833,10 @@ class AMBS(Search):
         # Add more starting points
         n_points = max(0, size - len(batch))
         if n_points > 0:
-            points = self._opt.ask(n_points=n_points)
+            if self._vectorized:
+                points = self._ask_vectorized(self._opt, self._generator, n_points)
+            else:
+                points = self._opt.ask(n_points=n_points)
             for point in points:
                 point_as_dict = self.to_dict(point)
                 batch.append(point_as_dict)
@@ -0,0 +1,402 @@
+import ConfigSpace.hyperparameters as csh
+import numpy as np
+from ConfigSpace.conditions import (
+    AbstractConjunction,
+    AndConjunction,
+    EqualsCondition,
+    GreaterThanCondition,
+    InCondition,
+    LessThanCondition,
+    NotEqualsCondition,
+    OrConjunction,
+)
+from ConfigSpace.forbidden import (
+    ForbiddenAndConjunction,
+    ForbiddenEqualsClause,
+    ForbiddenEqualsRelation,
+    ForbiddenGreaterThanRelation,
+    ForbiddenInClause,
+    ForbiddenLessThanRelation,
+)
+from sklearn.utils import check_random_state
+from skopt.space import Categorical, Integer
+
+# Value given to inactive hyperparameters in the encoded candidates (same as "Space.imp_const")
+INACTIVE_VALUE = -1000
+
+
+def _rows(X):
+    """View each row of a 2-D float array as a single bytes value."""
+    X = np.ascontiguousarray(X, dtype=float)
+    return X.view(np.dtype((np.void, X.dtype.itemsize * X.shape[1]))).ravel()
+
+
+class CandidateGenerator:
+    """Generator of the candidate configurations ranked by the acquisition function of ``AMBS``.
+
+    The candidates are sampled and encoded by whole batches: each hyperparameter is sampled as a NumPy array, conditions and forbidden clauses of the ``ConfigurationSpace`` are applied with vectorized masks and the encoding of the surrogate model is computed column by column. A pool of encoded candidates is kept between two calls of :meth:`refresh`, only a fraction of it is replaced by new random candidates and by local perturbations of the incumbent configuration.
+
+    Args:
+        space (skopt.space.Space): the search space of the optimizer.
+        pool_size (int, optional): number of candidates in the pool. Defaults to ``10000``.
+        refresh_rate (float, optional): fraction of the pool replaced by new random candidates at each refresh. Defaults to ``0.1``.
+        local_rate (float, optional): fraction of the pool replaced by perturbations of the incumbent at each refresh. Defaults to ``0.1``.
+        local_scale (float, optional): standard deviation of the perturbations of numerical hyperparameters (relative to their range) and probability of changing the value of categorical hyperparameters. Defaults to ``0.1``.
+        filter_duplicated (bool, optional): exclude the candidates already given to :meth:`mark_seen`. Defaults to ``True``.
+        random_state (int|RandomState, optional): random seed. Defaults to ``None``.
+
+    Raises:
+        ValueError: if the ``ConfigurationSpace`` has a condition or forbidden clause which cannot be vectorized.
+    """
+
+    def __init__(
+        self,
+        space,
+        pool_size: int = 10000,
+        refresh_rate: float = 0.1,
+        local_rate: float = 0.1,
+        local_scale: float = 0.1,
+        filter_duplicated: bool = True,
+        random_state=None,
+    ):
+        self.space = space
+        self.pool_size = pool_size
+        self.refresh_rate = refresh_rate
+        self.local_rate = local_rate
+        self.local_scale = local_scale
+        self.filter_duplicated = filter_duplicated
+        self.rng = check_random_state(random_state)
+
+        self._dims = space.dimensions
+        self._index = {dim.name: j for j, dim in enumerate(self._dims)}
+        self._categorical = [isinstance(dim, Categorical) for dim in self._dims]
+        self._integer = [isinstance(dim, Integer) for dim in self._dims]
+        self._choices = [None] * len(self._dims)  # (values, probabilities) of categorical hyperparameters
+        self._conditions = [None] * len(self._dims)  # condition activating each hyperparameter
+        self._forbiddens = []
+
+        if getattr(space, "is_config_space", False):
+            config_space = space.config_space
+            for hp in config_space.get_hyperparameters():
+                j = self._index[hp.name]
+                if isinstance(hp, csh.CategoricalHyperparameter):
+                    self._choices[j] = (list(hp.choices), hp.probabilities)
+                elif isinstance(hp, csh.OrdinalHyperparameter):
+                    self._choices[j] = (list(hp.sequence), None)
+            for cond in config_space.get_conditions():
+                self._check_condition(cond)
+                self._conditions[self._index[cond.get_children()[0].name]] = cond
+            for clause in config_space.get_forbiddens():
+                self._check_forbidden(clause)
+                self._forbiddens.append(clause)
+        for j, dim in enumerate(self._dims):
+            if self._categorical[j] and self._choices[j] is None:
+                self._choices[j] = (list(dim.categories), None)
+
+        self._seen = set()  # Encoded candidates already selected.
+        self._pool = None  # Columns of the candidates in the original space.
+        self._pool_X = None  # Encoded candidates.
+        self._pool_seen = None  # Mask of the candidates already seen.
+        self._stale = set()  # Candidates replaced since the last refresh.
+
+    def _check_condition(self, cond):
+        if isinstance(cond, (AndConjunction, OrConjunction)):
+            for component in cond.components:
+                self._check_condition(component)
+        elif not isinstance(
+            cond,
+            (
+                EqualsCondition,
+                NotEqualsCondition,
+                LessThanCondition,
+                GreaterThanCondition,
+                InCondition,
+            ),
+        ):
+            raise ValueError(f"Condition {type(cond)} is not supported!")
+
+    def _check_forbidden(self, clause):
+        if isinstance(clause, ForbiddenAndConjunction):
+            for component in clause.components:
+                self._check_forbidden(component)
+        elif not isinstance(
+            clause,
+            (
+                ForbiddenEqualsClause,
+                ForbiddenInClause,
+                ForbiddenEqualsRelation,
+                ForbiddenLessThanRelation,
+                ForbiddenGreaterThanRelation,
+            ),
+        ):
+            raise ValueError(f"Forbidden {type(clause)} is not supported!")
+
+    def _sample_columns(self, size: int) -> list:
+        """Sample each hyperparameter independently, conditions and forbidden clauses are not applied."""
+        columns = []
+        for j, dim in enumerate(self._dims):
+            if self._categorical[j]:
+                values, p = self._choices[j]
+                choices = np.empty(len(values), dtype=object)
+                choices[:] = values
+                columns.append(choices[self.rng.choice(len(values), size=size, p=p)])
+            else:
+                columns.append(
+                    np.asarray(dim.rvs(n_samples=size, random_state=self.rng), dtype=float)
+                )
+        return columns
+
+    def _comparable(self, j: int, values):
+        """Values of the hyperparameter ``j`` which can be compared with ``<`` and ``>``."""
+        if self._categorical[j]:
+            position = {v: i for i, v in enumerate(self._choices[j][0])}
+            return np.array([position.get(v, np.nan) for v in values], dtype=float)
+        return values
+
+    def _condition_mask(self, cond, columns: list, active: list):
+        if isinstance(cond, AbstractConjunction):
+            masks = [self._condition_mask(c, columns, active) for c in cond.components]
+            if isinstance(cond, AndConjunction):
+                return np.logical_and.reduce(masks)
+            return np.logical_or.reduce(masks)
+
+        j = self._index[cond.parent.name]
+        values = columns[j]
+        if isinstance(cond, EqualsCondition):
+            mask = values == cond.value
+        elif isinstance(cond, NotEqualsCondition):
+            mask = values != cond.value
+        elif isinstance(cond, InCondition):
+            mask = np.isin(values, list(cond.values))
+        else:
+            values = self._comparable(j, values)
+            value = self._comparable(j, [cond.value])[0]
+            if isinstance(cond, LessThanCondition):
+                mask = values < value
+            else:
+                mask = values > value
+        return np.asarray(mask, dtype=bool) & active[j]
+
+    def _forbidden_mask(self, clause, columns: list, active: list):
+        if isinstance(clause, ForbiddenAndConjunction):
+            return np.logical_and.reduce(
+                [self._forbidden_mask(c, columns, active) for c in clause.components]
+            )
+
+        if isinstance(clause, (ForbiddenEqualsClause, ForbiddenInClause)):
+            j = self._index[clause.hyperparameter.name]
+            if isinstance(clause, ForbiddenEqualsClause):
+                mask = columns[j] == clause.value
+            else:
+                mask = np.isin(columns[j], list(clause.values))
+            return np.asarray(mask, dtype=bool) & active[j]
+
+        i, j = self._index[clause.left.name], self._index[clause.right.name]
+        left, right = self._comparable(i, columns[i]), self._comparable(j, columns[j])
+        if isinstance(clause, ForbiddenEqualsRelation):
+            mask = left == right
+        elif isinstance(clause, ForbiddenLessThanRelation):
+            mask = left < right
+        else:
+            mask = left > right
+        return np.asarray(mask, dtype=bool) & active[i] & active[j]
+
+    def _apply_constraints(self, columns: list) -> list:
+        """Deactivate the hyperparameters whose condition is false and remove the forbidden candidates."""
+        size = len(columns[0])
+        active = []
+        # the hyperparameters of the space are sorted such that parents come before their children
+        for j, cond in enumerate(self._conditions):
+            if cond is None:
+                active.append(np.ones(size, dtype=bool))
+                continue
+            mask = self._condition_mask(cond, columns, active)
+            active.append(mask)
+            if self._categorical[j]:
+                columns[j][~mask] = "NA"
+            else:
+                columns[j][~mask] = np.nan
+
+        if len(self._forbiddens) > 0:
+            forbidden = np.logical_or.reduce(
+                [self._forbidden_mask(c, columns, active) for c in self._forbiddens]
+            )
+            columns = [column[~forbidden] for column in columns]
+        return columns
+
+    def _sample(self, size: int) -> list:
+        columns = self._apply_constraints(self._sample_columns(size))
+        # forbidden candidates are sampled again a few times
+        for _ in range(10):
+            missing = size - len(columns[0])
+            if missing <= 0:
+                break
+            new_columns = self._apply_constraints(self._sample_columns(missing))
+            columns = [np.concatenate(c) for c in zip(columns, new_columns)]
+        return columns
+
+    def _perturb(self, point: list, size: int) -> list:
+        """Sample candidates close to ``point``. Hyperparameters which are inactive in ``point`` are sampled at random."""
+        columns = self._sample_columns(size)
+        for j, dim in enumerate(self._dims):
+            value = point[j]
+            if self._categorical[j]:
+                if value == "NA":
+                    continue
+                keep = self.rng.uniform(size=size) >= self.local_scale
+                columns[j][keep] = value
+            else:
+                if value is None or np.isnan(value):
+                    continue
+                low, high = dim.low, dim.high
+                f, f_inv = (np.log, np.exp) if dim.prior == "log-uniform" else (None, None)
+                if f is not None:
+                    low, high, value = f(low), f(high), f(value)
+                t = (value - low) / (high - low) + self.rng.normal(
+                    0, self.local_scale, size=size
+                )
+                values = low + np.clip(t, 0, 1) * (high - low)
+                if f_inv is not None:
+                    values = f_inv(values)
+                if self._integer[j]:
+                    values = np.round(values)
+                columns[j] = np.clip(values, dim.low, dim.high)
+        return self._apply_constraints(columns)
+
+    def _encode_columns(self, columns: list):
+        size = len(columns[0])
+        X = np.hstack(
+            [
+                np.asarray(dim.transform(column), dtype=float).reshape((size, -1))
+                for dim, column in zip(self._dims, columns)
+            ]
+        )
+        X[np.isnan(X)] = INACTIVE_VALUE
+        return X
+
+    def encode(self, points: list):
+        """Encode configurations of the original space as the surrogate model inputs.
+
+        Args:
+            points (list): list of configurations, each one is a list of hyperparameter values.
+
+        Returns:
+            np.ndarray: the encoded configurations.
+        """
+        columns = [np.array(column, dtype=object) for column in zip(*points)]
+        for j in range(len(columns)):
+            if not self._categorical[j]:
+                columns[j] = columns[j].astype(float)
+        return self._encode_columns(columns)
+
+    def _point(self, columns: list, i: int) -> list:
+        point = []
+        for j, column in enumerate(columns):
+            value = column[i]
+            if not self._categorical[j]:
+                if np.isnan(value):
+                    value = np.nan
+                elif self._integer[j]:
+                    value = int(value)
+                else:
+                    value = float(value)
+            point.append(value)
+        return point
+
+    def mark_seen(self, X):
+        """Record encoded candidates which must not be proposed again when ``filter_duplicated=True``."""
+        X = np.ascontiguousarray(X, dtype=float)
+        self._seen.update(row.tobytes() for row in X)
+        if self.filter_duplicated and self._pool_X is not None and len(X) > 0:
+            # the copies of the candidates in the pool are found with a vectorized lookup of their bytes
+            self._pool_seen |= np.isin(_rows(self._pool_X), _rows(X))
+
+    def is_seen(self, x) -> bool:
+        return self.filter_duplicated and np.asarray(x, dtype=float).tobytes() in self._seen
+
+    def sample(self, size: int) -> list:
+        """Sample random configurations which were not seen before.
+
+        Args:
+            size (int): number of configurations.
+
+        Returns:
+            list: the configurations, each one is a list of hyperparameter values.
+        """
+        columns = self._sample(size)
+        X = self._encode_columns(columns)
+        points = []
+        for i in range(len(X)):
+            if not self.is_seen(X[i]):
+                points.append(self._point(columns, i))
+                self.mark_seen(X[i : i + 1])
+            if len(points) == size:
+                break
+        # the unseen configurations are exhausted
+        for i in range(len(X)):
+            if len(points) == size:
+                break
+            points.append(self._point(columns, i))
+        return points
+
+    def _replace(self, indices, columns: list):
+        indices = np.asarray(indices)[: len(columns[0])]
+        X = self._encode_columns(columns)
+        n = len(indices)
+        for j in range(len(self._pool)):
+            self._pool[j][indices] = columns[j][:n]
+        self._pool_X[indices] = X[:n]
+        self._pool_seen[indices] = [self.is_seen(x) for x in X[:n]]
+        self._stale.update(indices.tolist())
+
+    def refresh(self, incumbent: list = None):
+        """Partially renew the pool of candidates: a fraction is replaced by new random candidates and by perturbations of ``incumbent``, the candidates given to :meth:`remove` are replaced as well.
+
+        Args:
+            incumbent (list, optional): the best configuration found so far. Defaults to ``None``.
+
+        Returns:
+            np.ndarray: the indexes of the candidates changed since the last refresh, all of them when the pool is created.
+        """
+        if self._pool is None:
+            self._pool = self._sample(self.pool_size)
+            self._pool_X = self._encode_columns(self._pool)
+            self._pool_seen = np.zeros(len(self._pool_X), dtype=bool)
+            if self.filter_duplicated and len(self._seen) > 0:
+                self._pool_seen = np.array([self.is_seen(x) for x in self._pool_X])
+            self._stale.clear()
+            return np.arange(len(self._pool_X))
+
+        size = len(self._pool_X)
+        num_local = int(self.local_rate * size) if incumbent is not None else 0
+        num_random = int(self.refresh_rate * size)
+        if num_local > 0:
+            self._replace(np.arange(num_local), self._perturb(incumbent, num_local))
+        if num_random > 0:
+            indices = self.rng.choice(
+                np.arange(num_local, size), size=min(num_random, size - num_local), replace=False
+            )
+            self._replace(indices, self._sample(len(indices)))
+
+        stale = np.array(sorted(self._stale), dtype=int)
+        self._stale.clear()
+        return stale
+
+    def remove(self, indices):
+        """Replace the candidates at ``indices`` (e.g., because they were selected) by new random candidates."""
+        if len(indices) > 0:
+            self._replace(indices, self._sample(len(indices)))
+
+    @property
+    def X(self):
+        """The encoded candidates of the pool."""
+        return self._pool_X
+
+    @property
+    def seen(self):
+        """Boolean mask of the candidates of the pool already seen, updated by :meth:`mark_seen` and when candidates are replaced."""
+        return self._pool_seen
+
+    def point(self, i: int) -> list:
+        """The candidate ``i`` of the pool as a list of hyperparameter values."""
+        return self._point(self._pool, i)
@@ -0,0 +1,201 @@
+import copy
+
+import numpy as np
+from scipy.linalg import cho_solve, solve_triangular
+from sklearn.base import BaseEstimator, RegressorMixin
+
+# Grids of the hyperparameters selected by maximizing the marginal likelihood
+LENGTH_SCALES = [0.05, 0.1, 0.2, 0.4, 0.8]
+NOISE_LEVELS = [1e-4, 1e-2, 1e-1]
+JITTER = 1e-8
+
+
+def matern52(X1, X2, length_scale):
+    """Matern 5/2 kernel between the rows of ``X1`` and ``X2``."""
+    d2 = (
+        np.sum(X1 ** 2, axis=1)[:, None]
+        + np.sum(X2 ** 2, axis=1)[None, :]
+        - 2 * X1 @ X2.T
+    )
+    r = np.sqrt(5 * np.maximum(d2, 0)) / length_scale
+    return (1 + r + r ** 2 / 3) * np.exp(-r)
+
+
+def cholesky_update(L, x):
+    """Rank-1 update in place of the lower Cholesky factor ``L`` of ``A`` to the factor of ``A + x x^T``."""
+    x = x.copy()
+    for k in range(len(x)):
+        r = np.hypot(L[k, k], x[k])
+        c, s = r / L[k, k], x[k] / L[k, k]
+        L[k, k] = r
+        L[k + 1 :, k] = (L[k + 1 :, k] + s * x[k + 1 :]) / c
+        x[k + 1 :] = c * x[k + 1 :] - s * L[k + 1 :, k]
+
+
+class SparseGaussianProcessRegressor(RegressorMixin, BaseEstimator):
+    """Gaussian process regressor with the sparse Deterministic Training Conditional (DTC) approximation. The posterior depends on the observations only through ``num_inducing`` inducing points selected among them, the cost of a fit is ``O(n m^2)`` for ``n`` observations and ``m`` inducing points instead of ``O(n^3)``.
+
+    The inputs are scaled to the unit hypercube and the outputs standardized. The Matern 5/2 kernel has an isotropic length scale which is selected with the noise level by maximizing the marginal likelihood on a grid (estimated on at most ``max_samples_hyperparameters`` observations).
+
+    When ``fit`` receives the observations of the previous fit followed by new ones, the inducing points and hyperparameters are kept and the Cholesky factor of the model is updated with the new observations in ``O(m^2)`` each. The model is fitted again from scratch when the number of observations is multiplied by ``refit_factor``. A copy of the fitted model is used by ``refit`` to update it without modifying it (e.g., for the Liar strategy of ``AMBS``).
+
+    Args:
+        num_inducing (int, optional): maximum number of inducing points. Defaults to ``256``.
+        refit_factor (float, optional): growth factor of the number of observations triggering a full fit. Defaults to ``2.0``.
+        max_samples_hyperparameters (int, optional): maximum number of observations used to select the hyperparameters. Defaults to ``1000``.
+        random_state (int, optional): random seed used to select the inducing points. Defaults to ``None``.
+    """
+
+    def __init__(
+        self,
+        num_inducing: int = 256,
+        refit_factor: float = 2.0,
+        max_samples_hyperparameters: int = 1000,
+        random_state: int = None,
+    ):
+        self.num_inducing = num_inducing
+        self.refit_factor = refit_factor
+        self.max_samples_hyperparameters = max_samples_hyperparameters
+        self.random_state = random_state
+
+    def _scale(self, X):
+        return (np.asarray(X, dtype=float) - self.X_min_) / self.X_range_
+
+    def _statistics(self, Z, X, y, length_scale, noise):
+        """Cholesky factors of ``K_mm`` and ``A = noise * K_mm + K_mn K_nm`` and the projections ``K_mn y``, ``K_mn 1``."""
+        K_mm = matern52(Z, Z, length_scale) + JITTER * np.eye(len(Z))
+        K_mn = matern52(Z, X, length_scale)
+        L_mm = np.linalg.cholesky(K_mm)
+        L_A = np.linalg.cholesky(noise * K_mm + K_mn @ K_mn.T)
+        return L_mm, L_A, K_mn @ y, K_mn.sum(axis=1)
+
+    def _log_marginal_likelihood(self, Z, X, y, length_scale, noise):
+        n, m = len(X), len(Z)
+        try:
+            L_mm, L_A, b, _ = self._statistics(Z, X, y, length_scale, noise)
+        except np.linalg.LinAlgError:
+            return -np.inf
+        c = solve_triangular(L_A, b, lower=True)
+        # Woodbury identity and matrix determinant lemma for (Q_nn + noise I)
+        quad = (y @ y - c @ c) / noise
+        logdet = (
+            (n - m) * np.log(noise)
+            + 2 * np.sum(np.log(np.diag(L_A)))
+            - 2 * np.sum(np.log(np.diag(L_mm)))
+        )
+        return -0.5 * (quad + logdet + n * np.log(2 * np.pi))
+
+    def fit(self, X, y):
+        """Fit the model, incrementally if ``X, y`` extend the observations of the previous fit.
+
+        Args:
+            X (array): the observations, of shape ``(n_samples, n_features)``.
+            y (array): the targets, of shape ``(n_samples,)``.
+
+        Returns:
+            SparseGaussianProcessRegressor: the fitted model.
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if self._can_update(X, y):
+            self._update(X[self.n_samples_ :], y[self.n_samples_ :])
+            return self
+
+        rng = np.random.RandomState(self.random_state)
+        n = len(X)
+        self.X_min_ = X.min(axis=0)
+        X_range = X.max(axis=0) - self.X_min_
+        self.X_range_ = np.where(X_range > 0, X_range, 1)
+        X_scaled = self._scale(X)
+        y_norm = (y - y.mean()) / (y.std() if y.std() > 0 else 1.0)
+
+        inducing = np.arange(n)
+        if n > self.num_inducing:
+            inducing = np.sort(rng.choice(n, self.num_inducing, replace=False))
+        self.Z_ = X_scaled[inducing]
+
+        # hyperparameters selected on a subset of the observations
+        subset = np.arange(n)
+        if n > self.max_samples_hyperparameters:
+            subset = rng.choice(n, self.max_samples_hyperparameters, replace=False)
+        self.length_scale_, self.noise_ = max(
+            ((l, s) for l in LENGTH_SCALES for s in NOISE_LEVELS),
+            key=lambda p: self._log_marginal_likelihood(
+                self.Z_, X_scaled[subset], y_norm[subset], *p
+            ),
+        )
+
+        self.L_mm_, self.L_A_, self.Ky_, self.K1_ = self._statistics(
+            self.Z_, X_scaled, y, self.length_scale_, self.noise_
+        )
+        self.X_train_, self.y_train_ = X, y
+        self.n_samples_fit_ = n
+        self.n_samples_ = n
+        self._y_sum, self._y_sum2 = y.sum(), np.sum(y ** 2)
+        return self
+
+    def _can_update(self, X, y) -> bool:
+        if not hasattr(self, "n_samples_"):
+            return False
+        n = self.n_samples_
+        return (
+            len(X) > n
+            and len(X) < self.refit_factor * self.n_samples_fit_
+            # the inducing points are only kept once their maximum number is reached
+            and self.n_samples_fit_ >= self.num_inducing
+            and X.shape[1] == self.X_train_.shape[1]
+            and np.array_equal(X[:n], self.X_train_)
+            and np.array_equal(y[:n], self.y_train_)
+        )
+
+    def _update(self, X, y):
+        """Add observations with rank-1 updates of the Cholesky factor of ``A``."""
+        K_mk = matern52(self.Z_, self._scale(X), self.length_scale_)
+        self.L_A_ = self.L_A_.copy()
+        for k in range(len(X)):
+            cholesky_update(self.L_A_, K_mk[:, k])
+        self.Ky_ = self.Ky_ + K_mk @ y
+        self.K1_ = self.K1_ + K_mk.sum(axis=1)
+        self.X_train_ = np.vstack([self.X_train_, X])
+        self.y_train_ = np.concatenate([self.y_train_, y])
+        self.n_samples_ += len(X)
+        self._y_sum += y.sum()
+        self._y_sum2 += np.sum(y ** 2)
+
+    def refit(self, X, y):
+        """Return a copy of the model fitted on ``X, y``, the model itself is not modified.
+
+        Returns:
+            SparseGaussianProcessRegressor: the new model.
+        """
+        model = copy.copy(self)
+        return model.fit(X, y)
+
+    def predict(self, X, return_std=False):
+        """Predict the mean (and standard deviation) of the posterior at ``X``.
+
+        Args:
+            X (array): the inputs, of shape ``(n_samples, n_features)``.
+            return_std (bool, optional): if the standard deviation is returned. Defaults to ``False``.
+
+        Returns:
+            array|tuple: the mean, and the standard deviation if ``return_std``.
+        """
+        # the targets are standardized with the statistics of all the observations
+        n = self.n_samples_
+        y_mean = self._y_sum / n
+        y_std = np.sqrt(max(self._y_sum2 / n - y_mean ** 2, 0)) or 1.0
+        b = (self.Ky_ - y_mean * self.K1_) / y_std
+
+        K_sm = matern52(self._scale(X), self.Z_, self.length_scale_)
+        mean = K_sm @ cho_solve((self.L_A_, True), b)
+        mean = y_mean + y_std * mean
+        if not return_std:
+            return mean
+
+        # DTC variance: k_** - Q_** + noise * K_*m A^-1 K_m*
+        V_mm = solve_triangular(self.L_mm_, K_sm.T, lower=True)
+        V_A = solve_triangular(self.L_A_, K_sm.T, lower=True)
+        var = 1 - np.sum(V_mm ** 2, axis=0) + self.noise_ * np.sum(V_A ** 2, axis=0)
+        return mean, y_std * np.sqrt(np.maximum(var, 1e-12))
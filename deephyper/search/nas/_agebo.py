@@ -37,6 +37,8 @@ class AgEBO(RegularizedEvolution):
         mode (str, optional): Define if the search should be asynchronous or batch synchronous. Choice in ["sync", "async"]. Defaults to "async".
     """
 
+    _checkpoint_attributes = ["_population", "_hp_opt"]
+
     def __init__(
         self,
         problem,
@@ -151,10 +153,10 @@ class AgEBO(RegularizedEvolution):
             self._setup_hp_optimizer()
 
         num_evals_done = 0
-        population = collections.deque(maxlen=self._population_size)
+        population = self._population
 
         # Filling available nodes at start
-        self._evaluator.submit(self._gen_random_batch(size=self._n_initial_points))
+        self._submit_initial_batch(self._gen_random_batch, self._n_initial_points)
 
         # Main loop
         while max_evals < 0 or num_evals_done < max_evals:
@@ -241,6 +243,8 @@ class AgEBO(RegularizedEvolution):
 
                     self._evaluator.submit(new_batch)
 
+                self._checkpoint()
+
     def _gen_random_batch(self, size: int, hps: list = None) -> list:
         batch = []
         if hps is None:
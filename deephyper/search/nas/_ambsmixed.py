@@ -32,6 +32,8 @@ class AMBSMixed(NeuralArchitectureSearch):
         liar_strategy (str, optional): Definition of the constant value use for the Liar strategy. Can be a value in ``["cl_min", "cl_mean", "cl_max"]`` . Defaults to ``"cl_max"``.
         n_jobs (int, optional): Number of parallel processes used to fit the surrogate model of the Bayesian optimization. A value of ``-1`` will use all available cores. Defaults to ``1``.
     """
+    _checkpoint_attributes = ["_opt", "_space"]
+
     def __init__(
         self,
         problem,
@@ -144,7 +146,7 @@ class AMBSMixed(NeuralArchitectureSearch):
 
         # Filling available nodes at start
         logging.info(f"Generating {self._evaluator.num_workers} initial points...")
-        self._evaluator.submit(self._get_random_batch(size=self._n_initial_points))
+        self._submit_initial_batch(self._get_random_batch, self._n_initial_points)
 
         # Main loop
         while max_evals < 0 or num_evals_done < max_evals:
@@ -189,6 +191,8 @@ class AMBSMixed(NeuralArchitectureSearch):
                 if len(new_results) > 0:
                     self._evaluator.submit(new_batch)
 
+                self._checkpoint()
+
     def _get_surrogate_model(
         self, name: str, n_jobs: int = None, random_state: int = None
     ):
@@ -0,0 +1,41 @@
+import hashlib
+
+#: Number of bytes of the hashes of the packed architectures of large search spaces.
+HASH_SIZE = 8
+
+
+class ArchIndex:
+    """Set of the architectures generated by a neural architecture search. An ``arch_seq`` is packed in a single integer with a mixed-radix encoding, the radix of each variable node being its number of operations, the index then holds one small integer per architecture. When the search space has more than ``2^64`` architectures the packed integers are replaced by a 64-bit ``blake2b`` hash to keep them small, two architectures can then collide with a negligible probability (a new architecture is seen as a duplicate).
+
+    Args:
+        space_list (list): the ``(low, high)`` choices of each variable node returned by ``KSearchSpace.choices()``.
+    """
+
+    def __init__(self, space_list: list):
+        self._radixes = [high + 1 for _, high in space_list]
+        self._num_archs = 1
+        for radix in self._radixes:
+            self._num_archs *= radix
+        self._keys = set()
+
+    def key(self, arch_seq: list) -> int:
+        """Pack an architecture in an integer."""
+        key = 0
+        for value, radix in zip(arch_seq, self._radixes):
+            key = key * radix + int(value)
+        if self._num_archs > 2 ** (8 * HASH_SIZE):
+            data = key.to_bytes((key.bit_length() + 7) // 8, "little")
+            key = int.from_bytes(
+                hashlib.blake2b(data, digest_size=HASH_SIZE).digest(), "little"
+            )
+        return key
+
+    def add(self, arch_seq: list):
+        """Record an architecture."""
+        self._keys.add(self.key(arch_seq))
+
+    def __contains__(self, arch_seq: list) -> bool:
+        return self.key(arch_seq) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
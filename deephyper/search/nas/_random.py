@@ -44,8 +44,7 @@ class Random(NeuralArchitectureSearch):
         num_evals_done = 0
 
         # Filling available nodes at start
-        batch = self._gen_random_batch(size=self._evaluator.num_workers)
-        self._evaluator.submit(batch)
+        self._submit_initial_batch(self._gen_random_batch, self._evaluator.num_workers)
 
         # Main loop
         while max_evals < 0 or num_evals_done < max_evals:
@@ -64,6 +63,8 @@ class Random(NeuralArchitectureSearch):
                 if num_evals_done < max_evals:
                     self._evaluator.submit(self._gen_random_batch(size=num_received))
 
+                self._checkpoint()
+
     def _gen_random_batch(self, size: int) -> list:
         batch = []
 
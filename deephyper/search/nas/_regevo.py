@@ -1,5 +1,9 @@
 import collections
+import json
+import os
 
+import pandas as pd
+from deephyper.search.nas._arch_index import ArchIndex
 from deephyper.search.nas._base import NeuralArchitectureSearch
 
 
@@ -14,8 +18,14 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         verbose (int, optional): Indicate the verbosity level of the search. Defaults to 0.
         population_size (int, optional): the number of individuals to keep in the population. Defaults to 100.
         sample_size (int, optional): the number of individuals that should participate in each tournament. Defaults to 10.
+        scheduler (SuccessiveHalving, optional): Multi-fidelity scheduler from ``deephyper.search`` (e.g., ``SuccessiveHalving`` or ``Hyperband``) training each architecture with an increasing budget of epochs, the population is made of the objectives of the architectures at the budget of the first rung. Defaults to ``None``, each architecture is evaluated once.
+        filter_duplicated (bool, optional): Force the search to generate architectures which were not generated before (e.g., a mutation giving an architecture already evaluated), a duplicated architecture is sampled again at most ``max_retries`` times. The generated architectures are recorded in an index which is rebuilt from the ``arch_seq`` column of the ``results.csv`` file of ``log_dir`` when a checkpoint is loaded. Defaults to ``False``.
+        max_retries (int, optional): Maximum number of architectures sampled again to replace a duplicated one, the last one is kept (e.g., when the search space is exhausted). Defaults to ``10``.
+        inherit_weights (bool, optional): Initialize each child with the trained weights of its parent: the weights of the evaluated architectures are saved in the ``save/weights`` directory of ``log_dir`` and the layers of the operations unchanged by the mutation are loaded before the training of the child (see ``KSearchSpace.sample``). It requires a run function supporting it such as ``run_base_trainer``. Defaults to ``False``.
     """
 
+    _checkpoint_attributes = ["_population", "_scheduler"]
+
     def __init__(
         self,
         problem,
@@ -25,6 +35,10 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         verbose: int = 0,
         population_size: int = 100,
         sample_size: int = 10,
+        scheduler=None,
+        filter_duplicated: bool = False,
+        max_retries: int = 10,
+        inherit_weights: bool = False,
         **kwargs
     ):
 
@@ -41,9 +55,35 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         self._population_size = int(population_size)
         self._sample_size = int(sample_size)
         self._population = collections.deque(maxlen=self._population_size)
+        self._scheduler = scheduler
+        self._arch_index = ArchIndex(self.space_list) if filter_duplicated else None
+        self._max_retries = int(max_retries)
+        self._inherit_weights = inherit_weights
+        if inherit_weights:
+            self.pb_dict["inherit_weights"] = True
+
+    def load_checkpoint(self, path: str = None):
+        super().load_checkpoint(path)
+        if self._arch_index is not None:
+            self._load_arch_index()
+
+    def _load_arch_index(self):
+        """Rebuild the index of the generated architectures from the results of the search (the ``results.csv`` file of the log directory, which can hold evaluations done after the checkpoint) and the architectures still running."""
+        self._arch_index = ArchIndex(self.space_list)
+        arch_seqs = list(self._evaluator.get_evals().get("arch_seq", []))
+        path = os.path.join(self._log_dir, "results.csv")
+        if os.path.exists(path):
+            arch_seqs.extend(pd.read_csv(path)["arch_seq"])
+        for arch_seq in arch_seqs:
+            self._arch_index.add(json.loads(arch_seq))
+        for config in self._pending_configs:
+            self._arch_index.add(config["arch_seq"])
 
     def _saved_keys(self, job):
         res = {"arch_seq": str(job.config["arch_seq"])}
+        if self._scheduler is not None:
+            for key in ["trial_id", "budget", "initial_budget"]:
+                res[key] = job.config[key]
         return res
 
     def _search(self, max_evals, timeout):
@@ -54,8 +94,7 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         num_evals_done = 0
 
         # Filling available nodes at start
-        batch = self._gen_random_batch(size=self._evaluator.num_workers)
-        self._evaluator.submit(batch)
+        self._submit_initial_batch(self._gen_random_batch, self._evaluator.num_workers)
 
         # Main loop
         while max_evals < 0 or num_evals_done < max_evals:
@@ -65,7 +104,9 @@ class RegularizedEvolution(NeuralArchitectureSearch):
             num_received = len(new_results)
 
             if num_received > 0:
-                self._population.extend(new_results)
+                # promoted trials of the scheduler are submitted before new architectures
+                results, promotions = self._schedule(new_results)
+                self._population.extend(results)
                 self._evaluator.dump_evals(
                     saved_keys=self._saved_keys, log_dir=self._log_dir
                 )
@@ -74,13 +115,17 @@ class RegularizedEvolution(NeuralArchitectureSearch):
                 if num_evals_done >= max_evals:
                     break
 
+                if len(promotions) > 0:
+                    self._evaluator.submit(promotions)
+                num_new = num_received - len(promotions)
+
                 # If the population is big enough evolve the population
                 if len(self._population) == self._population_size:
 
                     children_batch = []
 
                     # For each new parent/result we create a child from it
-                    for _ in range(num_received):
+                    for _ in range(num_new):
                         # select_sample
                         indexes = self._random_state.choice(
                             self._population_size, self._sample_size, replace=False
@@ -94,10 +139,14 @@ class RegularizedEvolution(NeuralArchitectureSearch):
                         children_batch.append(child)
 
                     # submit_childs
-                    self._evaluator.submit(children_batch)
+                    self._evaluator.submit(self._new_trials(children_batch))
 
                 else:  # If the population is too small keep increasing it
-                    self._evaluator.submit(self._gen_random_batch(size=num_received))
+                    self._evaluator.submit(
+                        self._new_trials(self._gen_random_batch(size=num_new))
+                    )
+
+                self._checkpoint()
 
     def _select_parent(self, sample: list) -> list:
         cfg, _ = max(sample, key=lambda x: x[1])
@@ -107,10 +156,23 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         batch = []
         for _ in range(size):
             cfg = self.pb_dict.copy()
-            cfg["arch_seq"] = self._random_search_space()
+            cfg["arch_seq"] = self._new_arch(self._random_search_space)
             batch.append(cfg)
         return batch
 
+    def _new_arch(self, sample_arch) -> list:
+        """Sample an architecture with ``sample_arch()`` until it was not generated before (at most ``max_retries`` more times) and record it in the index of the generated architectures."""
+        arch_seq = sample_arch()
+        if self._arch_index is None:
+            return arch_seq
+
+        for _ in range(self._max_retries):
+            if not arch_seq in self._arch_index:
+                break
+            arch_seq = sample_arch()
+        self._arch_index.add(arch_seq)
+        return arch_seq
+
     def _random_search_space(self) -> list:
         return [self._random_state.choice(b + 1) for (_, b) in self.space_list]
 
@@ -122,6 +184,13 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         Returns:
             dict: [description]
         """
+        cfg = self.pb_dict.copy()
+        cfg["arch_seq"] = self._new_arch(lambda: self._mutate_arch(parent_arch))
+        if self._inherit_weights:
+            cfg["parent_arch_seq"] = parent_arch
+        return cfg
+
+    def _mutate_arch(self, parent_arch: list) -> list:
         i = self._random_state.choice(len(parent_arch))
         child_arch = parent_arch[:]
 
@@ -132,6 +201,4 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         sample = self._random_state.choice(elements, 1)[0]
 
         child_arch[i] = sample
-        cfg = self.pb_dict.copy()
-        cfg["arch_seq"] = child_arch
-        return cfg
\ No newline at end of file
+        return child_arch
\ No newline at end of file
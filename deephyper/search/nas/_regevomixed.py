@@ -16,6 +16,8 @@ class RegularizedEvolutionMixed(RegularizedEvolution):
         sample_size (int, optional): the number of individuals that should participate in each tournament. Defaults to 10.
     """
 
+    _checkpoint_attributes = ["_population", "_space"]
+
     def __init__(
         self,
         problem,
@@ -74,7 +76,7 @@ class RegularizedEvolutionMixed(RegularizedEvolution):
         num_evals_done = 0
 
         # Filling available nodes at start
-        self._evaluator.submit(self._gen_random_batch(size=self._evaluator.num_workers))
+        self._submit_initial_batch(self._gen_random_batch, self._evaluator.num_workers)
 
         # Main loop
         while max_evals < 0 or num_evals_done < max_evals:
@@ -124,6 +126,8 @@ class RegularizedEvolutionMixed(RegularizedEvolution):
 
                     self._evaluator.submit(new_batch)
 
+                self._checkpoint()
+
     def _select_parent(self, sample: list) -> dict:
         cfg, _ = max(sample, key=lambda x: x[1])
         return cfg
@@ -6,6 +6,32 @@ def run(config):
     return config["x"]
 
 
+def run_phases(config):
+    from deephyper.evaluator import trace
+
+    trace.record(trace.DATA_LOADED)
+    trace.record(trace.TRAINED)
+    return config["x"]
+
+
+def run_curve(config):
+    from deephyper.evaluator.report import Reporter
+
+    reporter = Reporter(config)
+    for epoch in range(10):
+        objective = config["x"] * (1 - 1 / (epoch + 2))
+        if reporter.record(epoch + 1, objective):
+            break
+    return reporter.result(objective)
+
+
+def run_sleep(config):
+    import time
+
+    time.sleep(config["t"])
+    return config["x"]
+
+
 @pytest.mark.incremental
 class TestEvaluator:
     def test_import(self):
@@ -46,6 +72,376 @@ class TestEvaluator:
             jobs = evaluator.gather("BATCH", size=1)
             assert 1 <= len(jobs) and len(jobs) <= len(configs)
 
+            evaluator.close()
+
+    def test_gather_timeout(self):
+        import time
+        from deephyper.evaluator import Evaluator
+
+        def run_slow(config):
+            time.sleep(0.5)
+            return config["x"]
+
+        evaluator = Evaluator.create(
+            run_slow,
+            method="thread",
+            method_kwargs={
+                "num_workers": 2,
+            },
+        )
+
+        evaluator.submit([{"x": i} for i in range(2)])
+        jobs = evaluator.gather("BATCH", size=1, timeout=0.01)
+        assert len(jobs) == 0
+
+        jobs = evaluator.gather("ALL")
+        assert len(jobs) == 2
+        assert len(evaluator._tasks_running) == 0
+
+    def test_dump_evals(self, tmp_path):
+        import pandas as pd
+        from deephyper.evaluator import Evaluator
+
+        evaluator = Evaluator.create(
+            run,
+            method="thread",
+            method_kwargs={
+                "num_workers": 2,
+            },
+        )
+
+        for _ in range(2):
+            evaluator.submit([{"x": i} for i in range(5)])
+            evaluator.gather("ALL")
+            evaluator.dump_evals(log_dir=tmp_path)
+            assert len(evaluator.jobs_done) == 0
+
+        evaluator.flush_evals()
+        df_memory = evaluator.get_evals()
+        df_file = pd.read_csv(tmp_path / "results.csv")
+        assert len(df_memory) == 10
+        assert list(df_memory.columns) == list(df_file.columns)
+        assert df_memory["objective"].tolist() == df_file["objective"].tolist()
+
+        # keys appearing in later rows are added as new columns
+        evaluator.submit([{"x": 10, "y": 1}])
+        evaluator.gather("ALL")
+        evaluator.dump_evals(log_dir=tmp_path)
+        evaluator.flush_evals()
+        df_memory = evaluator.get_evals()
+        df_file = pd.read_csv(tmp_path / "results.csv")
+        assert list(df_memory.columns) == list(df_file.columns)
+        assert df_file["y"].isna().sum() == 10 and df_file["y"].iloc[-1] == 1
+        assert not (tmp_path / "results.csv.tmp").exists()
+        assert df_memory["objective"].tolist() == df_file["objective"].tolist()
+
+        # the evaluations of another log directory are written in a new file
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        evaluator.submit([{"x": 11}])
+        evaluator.gather("ALL")
+        evaluator.dump_evals(log_dir=other_dir)
+        evaluator.flush_evals()
+        df_file = pd.read_csv(other_dir / "results.csv")
+        assert evaluator.get_evals()["objective"].tolist() == df_file["objective"].tolist() == [11]
+
+    def test_cache(self, tmp_path):
+        from deephyper.evaluator import Evaluator
+        from deephyper.evaluator.callback import Callback
+        from deephyper.evaluator.cache import LRUCache, SQLiteCache
+
+        class CacheCounter(Callback):
+            def __init__(self):
+                self.hits = 0
+                self.misses = 0
+
+            def on_cache_hit(self, job):
+                self.hits += 1
+
+            def on_cache_miss(self, job):
+                self.misses += 1
+
+        for cache in [LRUCache(maxsize=100), SQLiteCache(tmp_path / "cache.db")]:
+            counter = CacheCounter()
+            evaluator = Evaluator.create(
+                run,
+                method="thread",
+                method_kwargs={"num_workers": 1, "callbacks": [counter]},
+                cache=cache,
+            )
+
+            configs = [{"x": i, "seed": i} for i in range(5)]
+            evaluator.submit(configs)
+            evaluator.gather("ALL")
+            assert counter.misses == 5 and len(cache) == 5
+
+            # same configurations with different seeds are answered from the cache
+            evaluator.submit([{"x": i, "seed": 42} for i in range(5)])
+            jobs = evaluator.gather("ALL")
+            assert counter.hits == 5
+            assert sorted(job.result for job in jobs) == list(range(5))
+
+    def test_vectorized(self):
+        from deephyper.evaluator import Evaluator
+
+        calls = []
+
+        def run_vectorized(configs):
+            calls.append(len(configs))
+            return [config["x"] for config in configs]
+
+        evaluator = Evaluator.create(
+            run_vectorized,
+            method="thread",
+            method_kwargs={"num_workers": 2},
+            vectorized=True,
+            batch_size=4,
+        )
+
+        configs = [{"x": i} for i in range(10)]
+        evaluator.submit(configs)
+        jobs = evaluator.gather("ALL")
+        assert sorted(calls) == [2, 4, 4]
+        assert sorted(job.result for job in jobs) == list(range(10))
+
+    def test_job_timeout(self):
+        import time
+        from deephyper.evaluator import Evaluator, Job
+
+        for method in ["thread", "process", "subprocess"]:
+            evaluator = Evaluator.create(
+                run_sleep,
+                method=method,
+                method_kwargs={"num_workers": 2},
+                job_timeout=1,
+            )
+
+            evaluator.submit([{"x": 0, "t": 0}, {"x": 1, "t": 4}])
+            t_start = time.time()
+            jobs = evaluator.gather("ALL")
+            assert time.time() - t_start < 3
+            jobs.sort(key=lambda j: j.config["x"])
+            assert [job.status for job in jobs] == [Job.DONE, Job.TIMEOUT]
+            assert jobs[0].result == 0
+            assert jobs[1].result == Evaluator.FAIL_RETURN_VALUE
+            evaluator.close()
+
+    def test_job_timeout_queued(self):
+        from deephyper.evaluator import Evaluator, Job
+
+        # the time waiting for the busy worker is not counted in the timeout
+        for method in ["thread", "process"]:
+            evaluator = Evaluator.create(
+                run_sleep,
+                method=method,
+                method_kwargs={"num_workers": 1},
+                job_timeout=0.6,
+            )
+
+            evaluator.submit([{"x": i, "t": 0.4} for i in range(3)])
+            jobs = evaluator.gather("ALL")
+            jobs.sort(key=lambda j: j.config["x"])
+            assert [job.status for job in jobs] == [Job.DONE] * 3
+            assert [job.result for job in jobs] == [0, 1, 2]
+            evaluator.close()
+
+    def test_cancel(self):
+        from deephyper.evaluator import Evaluator, Job
+
+        evaluator = Evaluator.create(
+            run_sleep,
+            method="subprocess",
+            method_kwargs={"num_workers": 2, "persistent": True},
+        )
+
+        evaluator.submit([{"x": 0, "t": 0}, {"x": 1, "t": 30}])
+        evaluator.cancel([job.id for job in evaluator.jobs if job.config["x"] == 1])
+        jobs = evaluator.gather("ALL")
+        jobs.sort(key=lambda j: j.config["x"])
+        assert [job.status for job in jobs] == [Job.DONE, Job.CANCELLED]
+        # the worker executing the cancelled job was killed
+        assert len(evaluator._workers) == 1
+        evaluator.close()
+
+    def test_straggler_policy(self):
+        import time
+        from deephyper.evaluator import Evaluator, Job, StragglerPolicy
+
+        attempts = []
+
+        def run_straggler(config):
+            attempts.append(config["x"])
+            # only the first execution of the last job is slow
+            if config["x"] == 4 and attempts.count(4) == 1:
+                time.sleep(3)
+            else:
+                time.sleep(0.1)
+            return config["x"]
+
+        for action in ["drop", "relaunch"]:
+            attempts.clear()
+            evaluator = Evaluator.create(
+                run_straggler,
+                method="thread",
+                method_kwargs={"num_workers": 6},
+                straggler_policy=StragglerPolicy(
+                    min_completed=4, factor=2, action=action, check_interval=0.1
+                ),
+            )
+
+            evaluator.submit([{"x": i} for i in range(5)])
+            t_start = time.time()
+            jobs = evaluator.gather("ALL")
+            assert time.time() - t_start < 2
+            jobs.sort(key=lambda j: j.config["x"])
+            if action == "drop":
+                assert jobs[-1].status == Job.TIMEOUT
+            else:
+                assert jobs[-1].status == Job.DONE and jobs[-1].result == 4
+                assert attempts.count(4) == 2
+
+    def test_straggler_policy_queued(self):
+        from deephyper.evaluator import Evaluator, Job, StragglerPolicy
+
+        # the jobs waiting for a free worker are not stragglers
+        evaluator = Evaluator.create(
+            run_sleep,
+            method="thread",
+            method_kwargs={"num_workers": 2},
+            straggler_policy=StragglerPolicy(
+                quantile=0.1, min_completed=2, factor=2, action="drop", check_interval=0.05
+            ),
+        )
+
+        evaluator.submit([{"x": i, "t": 0.2} for i in range(12)])
+        jobs = evaluator.gather("ALL")
+        assert [job.status for job in jobs] == [Job.DONE] * 12
+        assert sorted(job.result for job in jobs) == list(range(12))
+        evaluator.close()
+
+    def test_tracing(self, tmp_path):
+        import json
+        from deephyper.evaluator import Evaluator
+
+        for method in ["thread", "process"]:
+            evaluator = Evaluator.create(
+                run_phases,
+                method=method,
+                method_kwargs={"num_workers": 2},
+                tracing=True,
+            )
+
+            evaluator.submit([{"x": i} for i in range(4)])
+            jobs = evaluator.gather("ALL")
+            for job in jobs:
+                assert [phase for phase, _ in job.events] == [
+                    "submitted",
+                    "dispatched",
+                    "started",
+                    "data_loaded",
+                    "trained",
+                    "returned",
+                    "gathered",
+                ]
+            assert sorted(job.result for job in jobs) == list(range(4))
+
+            evaluator.add_search_span("tell", 0, 1)
+            summary = evaluator.get_trace_summary()
+            assert 0 < summary["worker_utilization"] <= 1
+            assert summary["search_overhead"] == {"tell": 1}
+
+            evaluator.save_trace(tmp_path / "trace.json")
+            with open(tmp_path / "trace.json") as f:
+                chrome_trace = json.load(f)
+            phases = [e for e in chrome_trace["traceEvents"] if e.get("cat") == "job"]
+            assert len(phases) == 4 * 6
+            evaluator.close()
+
+    def test_early_discarding(self):
+        from deephyper.evaluator import EarlyDiscarding, Evaluator, Job
+
+        for method in ["rank", "curve"]:
+            evaluator = Evaluator.create(
+                run_curve,
+                method="thread",
+                method_kwargs={"num_workers": 1},
+                early_discarding=EarlyDiscarding(
+                    method=method, top_k=2, min_completed=3, min_budget=2
+                ),
+            )
+
+            # the learning curves of the first jobs are completed
+            evaluator.submit([{"x": x} for x in [10, 9, 8]])
+            jobs = evaluator.gather("ALL")
+            assert all(job.status == Job.DONE for job in jobs)
+            assert all(len(job.reports) == 10 for job in jobs)
+
+            evaluator.submit([{"x": 1}])
+            (job,) = evaluator.gather("ALL")
+            assert job.status == Job.DISCARDED
+            assert len(job.reports) < 10 and job.result == job.reports[-1][1]
+
+            evaluator.submit([{"x": 20}])
+            (job,) = evaluator.gather("ALL")
+            assert job.status == Job.DONE and len(job.reports) == 10
+
+    def test_subprocess_persistent(self):
+        from deephyper.evaluator import Evaluator
+
+        evaluator = Evaluator.create(
+            run,
+            method="subprocess",
+            method_kwargs={
+                "num_workers": 2,
+                "persistent": True,
+                "max_jobs_per_worker": 3,
+            },
+        )
+
+        configs = [{"x": i} for i in range(10)]
+        evaluator.submit(configs)
+        jobs = evaluator.gather("ALL")
+        jobs.sort(key=lambda j: j.config["x"])
+        for config, job in zip(configs, jobs):
+            assert config["x"] == job.result
+
+        assert len(evaluator._workers) <= 2
+        evaluator.close()
+        assert len(evaluator._workers) == 0
+
+    def test_mpicomm(self):
+        from deephyper.evaluator import Evaluator
+
+        # executed without mpirun the jobs are evaluated by the rank 0
+        with Evaluator.create(run, method="mpicomm") as evaluator:
+            assert evaluator is not None
+
+            configs = [{"x": i} for i in range(10)]
+            evaluator.submit(configs)
+            jobs = evaluator.gather("ALL")
+            assert sorted(job.result for job in jobs) == list(range(10))
+
+    def test_mpicomm_lazy_import(self):
+        import subprocess
+        import sys
+
+        # importing the evaluators does not initialize MPI in every process
+        code = "import sys, deephyper.evaluator; assert not 'mpi4py.MPI' in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_mpicomm_without_mpi4py(self, monkeypatch):
+        from deephyper.core.cli._mpi4py_mock import MPI
+        from deephyper.evaluator import Evaluator, _mpi_comm
+
+        # the mock of MPI used when mpi4py is not installed
+        monkeypatch.setattr(_mpi_comm, "MPI", MPI)
+        with Evaluator.create(run, method="mpicomm") as evaluator:
+            assert evaluator is not None and evaluator.size == 1
+
+            evaluator.submit([{"x": i} for i in range(3)])
+            jobs = evaluator.gather("ALL")
+            assert sorted(job.result for job in jobs) == list(range(3))
+
     def test_ray(self):
         from deephyper.evaluator import Evaluator
 
@@ -70,3 +466,57 @@ class TestEvaluator:
         evaluator.submit(configs)
         jobs = evaluator.gather("BATCH", size=1)
         assert 1 <= len(jobs) and len(jobs) <= len(configs)
+
+    def test_ray_actors(self):
+        from deephyper.evaluator import Evaluator
+
+        def run(config):
+            import os
+
+            return os.getpid()
+
+        evaluator = Evaluator.create(
+            run,
+            method="ray",
+            method_kwargs={
+                "num_cpus": 1,
+                "num_workers": 1,
+                "use_actors": True,
+            },
+        )
+
+        configs = [{"x": i} for i in range(5)]
+        evaluator.submit(configs)
+        jobs = evaluator.gather("ALL")
+        # all jobs are executed by the same long-lived actor
+        assert len(set(job.result for job in jobs)) == 1
+        evaluator.close()
+
+    def test_ray_actors_close(self):
+        from deephyper.evaluator import Evaluator, Job
+
+        def run(config):
+            import time
+
+            time.sleep(config["t"])
+            return config["x"]
+
+        evaluator = Evaluator.create(
+            run,
+            method="ray",
+            method_kwargs={
+                "num_cpus": 2,
+                "num_workers": 2,
+                "use_actors": True,
+            },
+        )
+
+        # a job still running when the evaluator is closed is not given a new actor
+        evaluator.submit([{"x": 0, "t": 0}, {"x": 1, "t": 30}])
+        jobs = evaluator.gather("BATCH", size=1)
+        assert [job.config["x"] for job in jobs] == [0]
+        evaluator.close()
+        evaluator.cancel([job.id for job in evaluator.jobs if job.config["x"] == 1])
+        jobs = evaluator.gather("ALL")
+        assert [job.status for job in jobs] == [Job.CANCELLED]
+        assert evaluator._actors == [] and evaluator._idle_actors is None
@@ -0,0 +1,70 @@
+"""Measure the per-job overhead of the ``"thread"`` and ``"process"`` evaluators.
+
+The shared pool of the evaluators is compared to the previous behaviour where a new executor was created for each job. Run with:
+
+.. code-block:: bash
+
+    $ python overhead_benchmark.py --num-jobs 200 --num-workers 4
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from deephyper.evaluator import Evaluator, ProcessPoolEvaluator, ThreadPoolEvaluator
+
+
+def run(config):
+    return config["x"]
+
+
+class _PerJobExecutorMixin:
+    """Reproduce the behaviour of the evaluators before the executor was shared."""
+
+    executor_class = None
+
+    async def execute(self, job):
+        async with self.sem:
+            executor = self.executor_class(max_workers=1)
+            job.result = await self.loop.run_in_executor(
+                executor, job.run_function, job.config
+            )
+        return job
+
+
+class PerJobThreadPoolEvaluator(_PerJobExecutorMixin, ThreadPoolEvaluator):
+    executor_class = ThreadPoolExecutor
+
+
+class PerJobProcessPoolEvaluator(_PerJobExecutorMixin, ProcessPoolEvaluator):
+    executor_class = ProcessPoolExecutor
+
+
+def per_job_overhead(evaluator: Evaluator, num_jobs: int) -> float:
+    configs = [{"x": i} for i in range(num_jobs)]
+    t_start = time.time()
+    evaluator.submit(configs)
+    evaluator.gather("ALL")
+    duration = time.time() - t_start
+    evaluator.close()
+    return duration / num_jobs
+
+
+def main(num_jobs, num_workers):
+    evaluators = {
+        "thread (per-job executor)": PerJobThreadPoolEvaluator,
+        "thread (shared executor)": ThreadPoolEvaluator,
+        "process (per-job executor)": PerJobProcessPoolEvaluator,
+        "process (shared executor)": ProcessPoolEvaluator,
+    }
+    for name, eval_cls in evaluators.items():
+        evaluator = eval_cls(run, num_workers=num_workers)
+        overhead = per_job_overhead(evaluator, num_jobs)
+        print(f"{name:30s}: {overhead * 1000:8.3f} ms/job")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-jobs", type=int, default=200)
+    parser.add_argument("--num-workers", type=int, default=4)
+    args = parser.parse_args()
+    main(args.num_jobs, args.num_workers)
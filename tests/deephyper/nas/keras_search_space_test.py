@@ -1,8 +1,11 @@
+import copy
+
+import numpy as np
 import pytest
 import tensorflow as tf
 from deephyper.nas import KSearchSpace
-from deephyper.nas.node import ConstantNode, VariableNode
-from deephyper.nas.operation import operation, Concatenate
+from deephyper.nas.node import ConstantNode, MirrorNode, VariableNode
+from deephyper.nas.operation import operation, Concatenate, Connect, Identity, Zero
 
 Dense = operation(tf.keras.layers.Dense)
 @pytest.mark.incremental
@@ -67,3 +70,163 @@ class TestKSearchSpace:
 
         space = TestSpace([(5,), (5,)], (1,)).build()
         model = space.sample()
+
+    def test_sample_compiled(self):
+
+        class TestSpace(KSearchSpace):
+            def __init__(self, input_shape, output_shape):
+                super().__init__(input_shape, output_shape)
+
+            def build(self):
+                vnode = VariableNode()
+                self.connect(self.input_nodes[0], vnode)
+                vnode.add_op(Identity())
+                vnode.add_op(Dense(4))
+
+                mirror = MirrorNode(vnode)
+                self.connect(self.input_nodes[0], mirror)
+
+                # the skip connection is created when its operation is set
+                skip = VariableNode()
+                skip.add_op(Zero())
+                skip.add_op(Connect(self, self.input_nodes[0]))
+
+                merge = ConstantNode()
+                merge.set_op(Concatenate(self, [vnode, mirror, skip]))
+                output = ConstantNode(op=Dense(1))
+                self.connect(merge, output)
+                return self
+
+        space = TestSpace((5,), (1,)).build()
+        num_edges = space.graph.number_of_edges()
+
+        for choice in [[0, 0], [1, 0], [1, 1]]:
+            copied_space = copy.deepcopy(space)
+            copied_space.set_ops(choice)
+            expected = copied_space.create_model()
+
+            model = space.sample(choice)
+            assert model.count_params() == expected.count_params()
+            assert [l.output_shape for l in model.layers] == [
+                l.output_shape for l in expected.layers
+            ]
+
+        # the search space is compiled once and not modified by the samples
+        assert space.compile() is space._compiled[1] is not None
+        assert space.graph.number_of_edges() == num_edges
+
+        # the layers are created for each model, the mirror node shares its layer
+        model_1, model_2 = space.sample([1, 1]), space.sample([1, 1])
+        dense_1 = [l for l in model_1.layers if isinstance(l, tf.keras.layers.Dense)]
+        dense_2 = [l for l in model_2.layers if isinstance(l, tf.keras.layers.Dense)]
+        assert len(dense_1) == 2
+        assert not set(map(id, dense_1)) & set(map(id, dense_2))
+
+    def test_connect_cycle(self):
+        from deephyper.core.exceptions.nas.space import StructureHasACycle
+
+        class TestSpace(KSearchSpace):
+            def build(self):
+                return self
+
+        space = TestSpace((5,), (1,))
+        nodes = [ConstantNode() for _ in range(4)]
+        space.connect(nodes[2], nodes[3])
+        space.connect(nodes[0], nodes[1])
+        space.connect(nodes[1], nodes[2])
+        space.connect(space.input_nodes[0], nodes[0])
+
+        # the rejected edges are not added
+        for node1, node2 in [(nodes[3], nodes[0]), (nodes[2], nodes[1]), (nodes[1], nodes[1])]:
+            with pytest.raises(StructureHasACycle):
+                space.connect(node1, node2)
+            assert not space.graph.has_edge(node1, node2)
+
+        for node1, node2 in space.graph.edges:
+            assert space._order[node1] < space._order[node2]
+
+        # the cycles are checked once at the end of the block
+        with pytest.raises(StructureHasACycle):
+            with space.deferred_validation():
+                space.connect(nodes[3], nodes[1])
+                space.connect(nodes[0], nodes[3])
+        space.graph.remove_edge(nodes[3], nodes[1])
+
+        with space.deferred_validation():
+            space.connect(nodes[0], nodes[2])
+        with pytest.raises(StructureHasACycle):
+            space.connect(nodes[3], space.input_nodes[0])
+
+    def test_sample_parent(self, tmp_path):
+
+        class TestSpace(KSearchSpace):
+            def build(self):
+                prev = self.input_nodes[0]
+                for _ in range(2):
+                    vnode = VariableNode()
+                    self.connect(prev, vnode)
+                    vnode.add_op(Dense(4))
+                    vnode.add_op(Dense(8))
+                    prev = vnode
+                self.connect(prev, ConstantNode(op=Dense(1)))
+                return self
+
+        space = TestSpace((5,), (1,)).build()
+        parent = space.sample([0, 1])
+        for layer in parent.layers:
+            layer.set_weights([np.full(w.shape, 0.5) for w in layer.get_weights()])
+        weights_path = str(tmp_path / "parent.h5")
+        parent.save_weights(weights_path)
+
+        # the second node is mutated and the output layer gets inputs of another shape
+        child = space.sample([0, 0], parent=([0, 1], weights_path))
+        inherited = [
+            all(np.all(w == 0.5) for w in layer.get_weights())
+            for layer in child.layers
+            if len(layer.get_weights()) > 0
+        ]
+        assert inherited == [True, False, False]
+
+        # the unchanged output layer is inherited
+        child = space.sample([1, 1], parent=([0, 1], weights_path))
+        inherited = [
+            all(np.all(w == 0.5) for w in layer.get_weights())
+            for layer in child.layers
+            if len(layer.get_weights()) > 0
+        ]
+        assert inherited == [False, False, True]
+
+    def test_supernet(self):
+
+        class TestSpace(KSearchSpace):
+            def build(self):
+                prev = self.input_nodes[0]
+                for _ in range(2):
+                    vnode = VariableNode()
+                    self.connect(prev, vnode)
+                    vnode.add_op(Identity())
+                    vnode.add_op(Dense(4, "relu"))
+                    vnode.add_op(Dense(8, "relu"))
+                    prev = vnode
+                self.connect(prev, ConstantNode(op=Dense(1)))
+                return self
+
+        space = TestSpace((5,), (1,)).build()
+        supernet = space.build_supernet()
+
+        # the layers are shared by the architectures when their inputs have the same shape
+        layers = lambda model: [l for l in model.layers if isinstance(l, tf.keras.layers.Dense)]
+        dense_1, dense_2 = layers(supernet.model([1, 1])), layers(supernet.model([1, 2]))
+        assert dense_1[0] is dense_2[0]
+        assert not dense_1[1] is dense_2[1] and not dense_1[2] is dense_2[2]
+        assert layers(supernet.model([2, 1]))[2] is dense_1[2]
+        assert supernet.model([1, 1]) is supernet.model([1, 1])
+
+        X = np.random.rand(256, 5).astype("float32")
+        y = X.sum(axis=1, keepdims=True)
+        dataset = tf.data.Dataset.from_tensor_slices(({"input_0": X}, y)).batch(32)
+        history = supernet.fit(dataset, num_epochs=5, learning_rate=0.01, random_state=42)
+        assert history["loss"][-1] < history["loss"][0]
+
+        scores = supernet.score([[0, 0], [1, 2], [2, 2]], dataset, metric="mse", num_batches=2)
+        assert len(scores) == 3 and all(np.isfinite(scores))
@@ -0,0 +1,75 @@
+import numpy as np
+import tensorflow as tf
+from deephyper.nas import KSearchSpace
+from deephyper.nas.node import ConstantNode, VariableNode
+from deephyper.nas.operation import operation, Identity
+from deephyper.nas.run._cache import WorkerCache
+from deephyper.nas.run._util import get_search_space, setup_data
+
+Dense = operation(tf.keras.layers.Dense)
+
+CALLS = {"load_data": 0, "build": 0}
+
+
+def load_data(n=100):
+    CALLS["load_data"] += 1
+    X, y = np.random.rand(n, 3), np.random.rand(n, 1)
+    return (X, y), (X, y)
+
+
+class Space(KSearchSpace):
+    def build(self):
+        CALLS["build"] += 1
+        vnode = VariableNode()
+        self.connect(self.input_nodes[0], vnode)
+        vnode.add_op(Identity())
+        vnode.add_op(Dense(4))
+        output = ConstantNode(op=Dense(self.output_shape[0]))
+        self.connect(vnode, output)
+        return self
+
+
+def test_worker_cache_lru_by_footprint():
+    cache = WorkerCache(max_bytes=3 * 800)
+    for i in range(3):
+        cache.get_or_create(("array", i), lambda: np.zeros(100))
+    assert len(cache) == 3 and cache.nbytes == 3 * 800
+
+    # the least recently used array is discarded
+    cache.get_or_create(("array", 0), lambda: None)
+    cache.get_or_create(("array", 3), lambda: np.zeros(100))
+    assert len(cache) == 3 and cache.hits == 1
+    assert cache.get_or_create(("array", 1), lambda: "created") == "created"
+
+    # too large to be cached
+    cache.get_or_create(("array", 4), lambda: np.zeros(1000))
+    assert cache.nbytes <= cache.max_bytes
+
+    # disabled
+    cache = WorkerCache(max_bytes=0)
+    assert cache.get_or_create(("array", 0), lambda: 1) == 1 and len(cache) == 0
+
+
+def test_worker_cache_data_and_search_space():
+    cache = WorkerCache(max_bytes=2 ** 20)
+    calls = dict(CALLS)
+
+    for arch_seq in [[0], [1], [1]]:
+        config = {
+            "load_data": {"func": load_data, "kwargs": {"n": 50}},
+            "search_space": {"class": Space, "kwargs": None},
+        }
+        input_shape, output_shape = setup_data(config, cache=cache)
+        space = get_search_space(config, input_shape, output_shape, seed=42, cache=cache)
+        model = space.sample(arch_seq)
+        assert np.shape(config["data"]["train_X"]) == (50, 3)
+        assert model.output_shape == (None, 1)
+
+    assert CALLS["load_data"] - calls["load_data"] == 1
+    assert CALLS["build"] - calls["build"] == 1
+
+    # other keyword arguments of "load_data"
+    config["load_data"]["kwargs"] = {"n": 20}
+    setup_data(config, cache=cache)
+    assert np.shape(config["data"]["train_X"]) == (20, 3)
+    assert CALLS["load_data"] - calls["load_data"] == 2
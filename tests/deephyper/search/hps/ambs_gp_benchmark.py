@@ -0,0 +1,85 @@
+"""Regret and wall time of AMBS with the Gaussian-process surrogate (``"GP"``) compared to the random forest (``"RF"``).
+
+Each search maximizes the negated Ackley, Levy and Rosenbrock functions of ``deephyper.benchmark.benchmark_functions_wrappers``. The simple regret (distance between the global optimum and the best objective found) is given after a fraction and after all of the evaluations, with the wall time of the search. Run with:
+
+    python ambs_gp_benchmark.py --max-evals 200 --num-dims 5 --surrogate-model RF GP
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+from deephyper.benchmark.benchmark_functions_wrappers import ackley_, levy_, rosen_
+from deephyper.evaluator import Evaluator
+from deephyper.problem import HpProblem
+from deephyper.search.hps import AMBS
+
+FUNCTIONS = {"ackley": ackley_, "levy": levy_, "rosen": rosen_}
+
+
+def create_run(func, num_dims):
+    def run(config):
+        x = np.array([config[f"x{i}"] for i in range(num_dims)])
+        return float(func(x))
+
+    return run
+
+
+def create_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--functions", nargs="+", default=list(FUNCTIONS), choices=list(FUNCTIONS))
+    parser.add_argument("--surrogate-model", nargs="+", default=["RF", "GP"])
+    parser.add_argument("--max-evals", type=int, default=200)
+    parser.add_argument("--num-dims", type=int, default=5)
+    parser.add_argument("--num-workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser
+
+
+def main(functions, surrogate_model, max_evals, num_dims, num_workers, repeat):
+    checkpoints = [max_evals // 4, max_evals // 2, max_evals]
+    print(
+        f"{'function':>8} {'surrogate':>10} "
+        + " ".join(f"{f'regret@{n}':>12}" for n in checkpoints)
+        + f" {'time':>9}"
+    )
+    for name in functions:
+        func, (a, b), minimas = FUNCTIONS[name]()
+        optimum = func(np.array(minimas(num_dims)))
+
+        problem = HpProblem()
+        for i in range(num_dims):
+            problem.add_hyperparameter((float(a), float(b)), f"x{i}")
+
+        for surrogate in surrogate_model:
+            regrets, durations = [], []
+            for seed in range(repeat):
+                evaluator = Evaluator.create(
+                    create_run(func, num_dims),
+                    method="thread",
+                    method_kwargs={"num_workers": num_workers},
+                )
+                search = AMBS(
+                    problem,
+                    evaluator,
+                    random_state=seed,
+                    surrogate_model=surrogate,
+                    acq_optimizer="vectorized",
+                    log_dir=tempfile.mkdtemp(),
+                )
+                t_start = time.time()
+                res = search.search(max_evals=max_evals)
+                durations.append(time.time() - t_start)
+                best = np.maximum.accumulate(res["objective"].values)
+                regrets.append([optimum - best[min(n, len(best)) - 1] for n in checkpoints])
+            regrets = np.mean(regrets, axis=0)
+            print(
+                f"{name:>8} {surrogate:>10} "
+                + " ".join(f"{r:>12.3f}" for r in regrets)
+                + f" {np.mean(durations):>8.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    main(**vars(args))
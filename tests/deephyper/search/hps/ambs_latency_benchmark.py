@@ -0,0 +1,74 @@
+"""Latency of the "tell + ask" step of AMBS with respect to the number of observations.
+
+The step of the search loop (``AMBS._tell_and_ask``) is timed when one new result is received, for different values of ``refit_interval``. The latency of the previous implementation (``tell`` followed by ``ask(n_points=1)``, which fitted the surrogate model twice) is given as reference. Run with:
+
+    python ambs_latency_benchmark.py --num-obs 100 500 1000 2000 --refit-interval 1 10
+"""
+import argparse
+import time
+
+import numpy as np
+from deephyper.evaluator import Evaluator
+from deephyper.problem import HpProblem
+from deephyper.search.hps import AMBS
+
+
+def run(config):
+    return -sum(v ** 2 for k, v in config.items() if k.startswith("x"))
+
+
+def create_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-obs", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    parser.add_argument("--refit-interval", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--num-dims", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    return parser
+
+
+def create_search(problem, num_obs, refit_interval):
+    evaluator = Evaluator.create(run, method="thread")
+    search = AMBS(problem, evaluator, random_state=42, refit_interval=refit_interval)
+    search._setup_optimizer()
+    search._search_start = time.time()
+
+    # observations of a previous search
+    X = search._opt.space.rvs(n_samples=num_obs, random_state=42)
+    y = [-run(search.to_dict(x)) for x in X]
+    search._opt.tell(X, y)
+    return search
+
+
+def legacy_tell_and_ask(search, opt_X, opt_y):
+    search._opt.tell(opt_X, opt_y)
+    return search._opt.ask(n_points=1, strategy=search._liar_strategy)
+
+
+def main(num_obs, refit_interval, num_dims, repeat):
+    problem = HpProblem()
+    for i in range(num_dims):
+        problem.add_hyperparameter((-10.0, 10.0), f"x{i}")
+
+    variants = {"legacy": (1, legacy_tell_and_ask)}
+    for k in refit_interval:
+        variants[f"refit_interval={k}"] = (k, AMBS._tell_and_ask)
+
+    print(f"{'num_obs':>8} " + " ".join(f"{name:>20}" for name in variants))
+    for n in num_obs:
+        latencies = []
+        for k, tell_and_ask in variants.values():
+            search = create_search(problem, n, k)
+            timings = []
+            new_X = search._opt.space.rvs(n_samples=1, random_state=0)
+            for _ in range(repeat):
+                new_y = [-run(search.to_dict(x)) for x in new_X]
+                t_start = time.time()
+                new_X = tell_and_ask(search, new_X, new_y)
+                timings.append(time.time() - t_start)
+            latencies.append(np.mean(timings))
+        print(f"{n:>8} " + " ".join(f"{t * 1000:>18.1f}ms" for t in latencies))
+
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    main(**vars(args))
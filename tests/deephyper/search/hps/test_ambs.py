@@ -9,6 +9,13 @@ def run(config):
     return config["x"]
 
 
+def run_slow(config):
+    import time
+
+    time.sleep(0.05)
+    return config["x"]
+
+
 problem = HpProblem()
 problem.add_hyperparameter((0.0, 10.0), "x")
 
@@ -41,5 +48,168 @@ def test_ambs():
     assert np.array_equal(res1_array, res2_array)
 
 
+
+def test_ambs_refit_interval():
+
+    evaluator = Evaluator.create(run, method="thread", method_kwargs={"num_workers": 1})
+
+    search = AMBS(problem, evaluator, random_state=42, refit_interval=5)
+    res = search.search(max_evals=20)
+
+    assert len(res) == 20
+    # the results received between two fits are recorded without fitting
+    assert 0 < search._num_unfitted < 5
+    assert len(search._opt.Xi) == 20
+
+
+def test_ambs_async_fit():
+
+    evaluator = Evaluator.create(
+        run_slow, method="thread", method_kwargs={"num_workers": 2}
+    )
+
+    search = AMBS(problem, evaluator, random_state=42, async_fit=True)
+    res = search.search(max_evals=40)
+
+    assert len(res) >= 40
+    assert len(search._opt.Xi) >= 40
+    # the background thread is stopped at the end of the search
+    assert search._fit_executor is None
+    assert "background_fit" in evaluator.get_trace_summary()["search_overhead"]
+
+
+def test_ambs_vectorized():
+
+    evaluator = Evaluator.create(run, method="thread", method_kwargs={"num_workers": 2})
+
+    search = AMBS(problem, evaluator, random_state=42, acq_optimizer="vectorized")
+    res = search.search(max_evals=20)
+
+    assert len(res) >= 20
+    # configurations are not evaluated twice
+    assert len(res["x"].unique()) == len(res)
+    assert len(search._generator.X) == 10000
+
+    with pytest.raises(ValueError):
+        AMBS(problem, evaluator, acq_optimizer="lbfgs")
+
+
+def test_ambs_batch_strategies():
+
+    for acq_optimizer in ["sampling", "vectorized"]:
+        for liar_strategy in ["qUCB", "qTS"]:
+            evaluator = Evaluator.create(
+                run, method="thread", method_kwargs={"num_workers": 4}
+            )
+            search = AMBS(
+                problem,
+                evaluator,
+                random_state=42,
+                acq_optimizer=acq_optimizer,
+                liar_strategy=liar_strategy,
+            )
+            search._setup_optimizer()
+            search._search_start = 0
+
+            X = search._opt.space.rvs(n_samples=10, random_state=42)
+            y = [-x[0] for x in X]
+            new_X = search._tell_and_ask(X, y)
+
+            # the batch is selected with a single fit of the surrogate model
+            assert len(new_X) == 10
+            assert len(set(x[0] for x in new_X)) == 10
+            assert len(search._opt.models) == 1
+
+
+def test_ambs_gp():
+
+    for acq_optimizer in ["sampling", "vectorized"]:
+        evaluator = Evaluator.create(run, method="thread", method_kwargs={"num_workers": 2})
+        search = AMBS(
+            problem,
+            evaluator,
+            random_state=42,
+            surrogate_model="GP",
+            acq_optimizer=acq_optimizer,
+        )
+        res = search.search(max_evals=20)
+        assert len(res) >= 20
+
+    # the model is updated incrementally once its inducing points are selected
+    evaluator = Evaluator.create(run, method="thread", method_kwargs={"num_workers": 4})
+    search = AMBS(
+        problem,
+        evaluator,
+        random_state=42,
+        surrogate_model="GP",
+        acq_optimizer="vectorized",
+    )
+    search._setup_optimizer()
+    search._opt.base_estimator_.num_inducing = 20
+    search._search_start = 0
+
+    X = search._opt.space.rvs(n_samples=20, random_state=42)
+    search._tell_and_ask(X, [-x[0] for x in X], n_points=1)
+    new_X = search._tell_and_ask(X[:4], [-x[0] for x in X[:4]])
+    model = search._opt.models[0]
+    assert len(new_X) == 4
+    assert model.n_samples_fit_ == 20 and model.n_samples_ == 24
+
+
+def test_ambs_checkpoint(tmp_path):
+
+    create_evaluator = lambda: Evaluator.create(
+        run, method="thread", method_kwargs={"num_workers": 1}
+    )
+
+    search = AMBS(problem, create_evaluator(), random_state=42, log_dir=tmp_path)
+    search.search(max_evals=15, checkpoint_interval=0)
+    assert (tmp_path / "checkpoint.pkl").exists()
+
+    restored = AMBS(problem, create_evaluator(), random_state=0, log_dir=tmp_path)
+    restored.load_checkpoint()
+
+    # the optimizer, the random state and the evaluations are restored
+    assert restored._opt.Xi == search._opt.Xi
+    assert restored._opt.yi == search._opt.yi
+    assert np.array_equal(
+        restored._random_state.get_state()[1], search._random_state.get_state()[1]
+    )
+    assert len(restored._evaluator.get_evals()) == 15
+
+    res = restored.search(max_evals=5)
+    assert len(res) == 20
+
+
+def run_budget(config):
+    from deephyper.evaluator.report import Reporter
+
+    reporter = Reporter()
+    for budget in range(config["initial_budget"], config["budget"]):
+        objective = config["x"] * (1 - 1 / (budget + 2))
+        reporter.record(budget + 1, objective)
+    return reporter.result(objective)
+
+
+def test_ambs_scheduler(tmp_path):
+    from deephyper.search import SuccessiveHalving
+
+    evaluator = Evaluator.create(
+        run_budget, method="thread", method_kwargs={"num_workers": 2}
+    )
+    scheduler = SuccessiveHalving(min_budget=1, max_budget=9, reduction_factor=3)
+    search = AMBS(
+        problem, evaluator, random_state=42, scheduler=scheduler, log_dir=tmp_path
+    )
+    res = search.search(max_evals=40)
+
+    # a gather can return several jobs when the last evaluation is received
+    assert len(res) >= 40
+    assert set(res["budget"]) == {1, 3, 9}
+    # the surrogate model only learns from the first rung of each trial
+    assert len(search._opt.yi) == (res["initial_budget"] == 0).sum()
+    assert len(search._opt.yi) <= scheduler.num_trials
+
+
 if __name__ == "__main__":
     test_ambs()
@@ -0,0 +1,74 @@
+import ConfigSpace as CS
+import numpy as np
+import skopt
+from deephyper.problem import HpProblem
+from deephyper.search.hps._candidates import CandidateGenerator
+
+
+def create_problem():
+    problem = HpProblem()
+    clf = problem.add_hyperparameter(["RF", "Ada", "KN", "SVC"], "classifier")
+    n_estimators = problem.add_hyperparameter((1, 2000, "log-uniform"), "n_estimators")
+    problem.add_condition(
+        CS.OrConjunction(
+            CS.EqualsCondition(n_estimators, clf, "RF"),
+            CS.EqualsCondition(n_estimators, clf, "Ada"),
+        )
+    )
+    gamma = problem.add_hyperparameter((1e-5, 10.0, "log-uniform"), "gamma")
+    problem.add_condition(CS.InCondition(gamma, clf, ["SVC"]))
+    x = problem.add_hyperparameter((0, 10), "x")
+    problem.add_forbidden_clause(
+        CS.ForbiddenAndConjunction(
+            CS.ForbiddenEqualsClause(clf, "KN"), CS.ForbiddenInClause(x, [0, 1, 2])
+        )
+    )
+    return problem
+
+
+def test_candidates_are_valid():
+    problem = create_problem()
+    space = skopt.Optimizer(dimensions=problem.space, base_estimator="RF").space
+    generator = CandidateGenerator(space, pool_size=2000, random_state=42)
+
+    refreshed = generator.refresh()
+    assert len(refreshed) == len(generator.X) == 2000
+
+    points = [generator.point(i) for i in range(len(generator.X))]
+    hp_names = problem.space.get_hyperparameter_names()
+    for point in points:
+        config = {
+            name: value
+            for name, value in zip(hp_names, point)
+            if not (value == "NA" or (isinstance(value, float) and np.isnan(value)))
+        }
+        CS.Configuration(problem.space, config).is_valid_configuration()
+
+    # same encoding as the search space of the optimizer
+    X = space.imp_const.fit_transform(space.transform(points))
+    assert np.allclose(X, generator.X)
+    assert np.allclose(generator.encode(points), generator.X)
+
+
+def test_candidates_refresh():
+    problem = create_problem()
+    space = skopt.Optimizer(dimensions=problem.space, base_estimator="RF").space
+    generator = CandidateGenerator(
+        space, pool_size=1000, refresh_rate=0.1, local_rate=0.1, random_state=42
+    )
+    generator.refresh()
+    incumbent = generator.point(0)
+
+    generator.remove([10, 20])
+    refreshed = generator.refresh(incumbent=incumbent)
+    # perturbations of the incumbent, random candidates and removed candidates
+    assert 190 <= len(refreshed) <= 202
+    assert 10 in refreshed and 20 in refreshed
+
+    # the selected candidates are not sampled again
+    generator.mark_seen(generator.X[:1])
+    assert generator.is_seen(generator.X[0])
+    assert not generator.is_seen(generator.X[1])
+    assert generator.seen[0] and not generator.seen[1:].any()
+    generator.remove([0])
+    assert not generator.seen.any()
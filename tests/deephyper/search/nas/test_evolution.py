@@ -0,0 +1,203 @@
+import numpy as np
+import tensorflow as tf
+from deephyper.evaluator import Evaluator
+from deephyper.nas import KSearchSpace
+from deephyper.nas.node import ConstantNode, VariableNode
+from deephyper.nas.operation import operation, Identity
+from deephyper.nas.run import run_debug_arch
+from deephyper.problem import NaProblem
+from deephyper.search.nas import AgEBO, RegularizedEvolution
+from deephyper.search.nas._arch_index import ArchIndex
+
+# the search space is built here, the benchmark problems depend on the deepspace package
+
+Dense = operation(tf.keras.layers.Dense)
+
+
+def load_data():
+    rng = np.random.RandomState(42)
+    X = rng.rand(200, 4)
+    y = X.sum(axis=1, keepdims=True)
+    return (X[:150], y[:150]), (X[150:], y[150:])
+
+
+class Space(KSearchSpace):
+    def build(self):
+        prev = self.input_nodes[0]
+        for _ in range(3):
+            vnode = VariableNode()
+            self.connect(prev, vnode)
+            vnode.add_op(Identity())
+            for units in [2, 4, 8]:
+                vnode.add_op(Dense(units))
+            prev = vnode
+        output = ConstantNode(op=Dense(self.output_shape[0]))
+        self.connect(prev, output)
+        return self
+
+
+Problem = NaProblem()
+Problem.load_data(load_data)
+Problem.search_space(Space)
+Problem.hyperparameters(batch_size=100, learning_rate=0.1, optimizer="adam", num_epochs=1)
+Problem.loss("mse")
+Problem.metrics(["r2"])
+Problem.objective("val_r2")
+
+HybridProblem = NaProblem()
+HybridProblem.load_data(load_data)
+HybridProblem.search_space(Space)
+HybridProblem.hyperparameters(
+    batch_size=HybridProblem.add_hyperparameter((1, 100), "batch_size"),
+    learning_rate=HybridProblem.add_hyperparameter(
+        (1e-4, 1e-1, "log-uniform"), "learning_rate"
+    ),
+    num_epochs=1,
+)
+HybridProblem.loss("mse")
+HybridProblem.metrics(["r2"])
+HybridProblem.objective("val_r2")
+
+
+def create_evaluator():
+    return Evaluator.create(
+        run_debug_arch, method="thread", method_kwargs={"num_workers": 1}
+    )
+
+
+def test_regevo_checkpoint(tmp_path):
+
+    search = RegularizedEvolution(
+        Problem,
+        create_evaluator(),
+        random_state=42,
+        log_dir=tmp_path,
+        population_size=5,
+        sample_size=2,
+    )
+    search.search(max_evals=8, checkpoint_interval=0)
+
+    restored = RegularizedEvolution(
+        Problem,
+        create_evaluator(),
+        log_dir=tmp_path,
+        population_size=5,
+        sample_size=2,
+    )
+    restored.load_checkpoint()
+    assert [(job.config, job.result) for job in restored._population] == [
+        (job.config, job.result) for job in search._population
+    ]
+
+    res = restored.search(max_evals=4)
+    assert len(res) == 12
+
+
+def test_regevo_filter_duplicated():
+
+    index = ArchIndex([(0, 2), (0, 3)])
+    index.add([2, 1])
+    assert [2, 1] in index and not [1, 2] in index
+    assert index.key([2, 1]) == 9
+
+    # the architectures of large search spaces are hashed without colliding
+    index = ArchIndex([(0, 1)] * 100)
+    arch_38, arch_last = [0] * 100, [0] * 100
+    arch_38[38], arch_last[-1] = 1, 1
+    index.add(arch_38)
+    assert arch_38 in index and not arch_last in index
+    assert index.key(arch_38) < 2 ** 64
+
+    search = RegularizedEvolution(
+        Problem,
+        create_evaluator(),
+        random_state=42,
+        population_size=5,
+        sample_size=2,
+        filter_duplicated=True,
+    )
+    res = search.search(max_evals=20)
+
+    # children equal to an evaluated architecture are mutated again
+    assert len(res["arch_seq"].unique()) == len(res)
+    assert len(search._arch_index) == len(res)
+
+
+def test_regevo_filter_duplicated_checkpoint(tmp_path):
+
+    search = RegularizedEvolution(
+        Problem,
+        create_evaluator(),
+        random_state=42,
+        log_dir=tmp_path,
+        population_size=5,
+        sample_size=2,
+        filter_duplicated=True,
+    )
+    search.search(max_evals=8, checkpoint_interval=0)
+
+    # the index of the generated architectures is rebuilt from the results
+    restored = RegularizedEvolution(
+        Problem,
+        create_evaluator(),
+        log_dir=tmp_path,
+        population_size=5,
+        sample_size=2,
+        filter_duplicated=True,
+    )
+    restored.load_checkpoint()
+    assert len(restored._arch_index) == len(search._arch_index)
+
+    res = restored.search(max_evals=4)
+    assert len(res["arch_seq"].unique()) == len(res)
+
+
+def test_regevo_inherit_weights(tmp_path):
+
+    search = RegularizedEvolution(
+        Problem,
+        create_evaluator(),
+        random_state=42,
+        log_dir=tmp_path,
+        inherit_weights=True,
+    )
+
+    # the weights of all the architectures are saved, the children load the weights of their parent
+    parent = search._random_search_space()
+    child = search._copy_mutate_arch(parent)
+    assert child["inherit_weights"] and child["parent_arch_seq"] == parent
+    assert search._gen_random_batch(1)[0]["inherit_weights"]
+    assert not "parent_arch_seq" in search._gen_random_batch(1)[0]
+
+
+def test_agebo_checkpoint(tmp_path):
+
+    search = AgEBO(
+        HybridProblem,
+        create_evaluator(),
+        random_state=42,
+        log_dir=tmp_path,
+        population_size=5,
+        sample_size=2,
+        n_points=100,
+    )
+    search.search(max_evals=8, checkpoint_interval=0)
+
+    # the fitted optimizer of the hyperparameters is restored with the population
+    restored = AgEBO(
+        HybridProblem,
+        create_evaluator(),
+        log_dir=tmp_path,
+        population_size=5,
+        sample_size=2,
+        n_points=100,
+    )
+    restored.load_checkpoint()
+    assert [(job.config, job.result) for job in restored._population] == [
+        (job.config, job.result) for job in search._population
+    ]
+    assert restored._hp_opt.Xi == search._hp_opt.Xi
+    assert len(restored._hp_opt.models) == len(search._hp_opt.models)
+
+    res = restored.search(max_evals=4)
+    assert len(res) == 12
@@ -0,0 +1,66 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+from deephyper.core.exceptions import DeephyperRuntimeError
+from deephyper.evaluator import Evaluator
+from deephyper.problem import HpProblem
+from deephyper.search import MultiSearch
+from deephyper.search.hps import AMBS
+
+problem = HpProblem()
+problem.add_hyperparameter((0.0, 10.0), "x")
+
+lock = threading.Lock()
+running = [0, 0]  # Running jobs, maximum of running jobs.
+
+
+def run(config):
+    with lock:
+        running[0] += 1
+        running[1] = max(running)
+    time.sleep(0.01)
+    with lock:
+        running[0] -= 1
+    return config["x"]
+
+
+def test_multi_search(tmp_path):
+
+    running[:] = [0, 0]
+    evaluator = Evaluator.create(run, method="thread", method_kwargs={"num_workers": 4})
+    driver = MultiSearch(evaluator)
+    searches = []
+    for seed in range(3):
+        log_dir = tmp_path / f"search{seed}"
+        log_dir.mkdir()
+        searches.append(
+            AMBS(
+                problem,
+                driver.create_evaluator(num_workers=2),
+                random_state=seed,
+                log_dir=log_dir,
+                surrogate_model="DUMMY",
+                n_points=100,
+            )
+        )
+    results = driver.search(searches, max_evals=20)
+
+    # each search has its own evaluations and the workers are not over-subscribed
+    assert running[1] <= 4
+    for seed, res in enumerate(results):
+        assert len(res) >= 20
+        assert len(pd.read_csv(tmp_path / f"search{seed}" / "results.csv")) == len(res)
+
+    # the shared time budget stops all the searches
+    searches = [
+        AMBS(problem, driver.create_evaluator(), log_dir=tmp_path / f"search{seed}")
+        for seed in range(2)
+    ]
+    t_start = time.time()
+    driver.search(searches, timeout=1)
+    assert time.time() - t_start < 3
+
+    with pytest.raises(DeephyperRuntimeError):
+        driver.search([AMBS(problem, evaluator, log_dir=tmp_path)])
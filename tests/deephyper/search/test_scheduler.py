@@ -0,0 +1,84 @@
+from deephyper.evaluator import Job
+from deephyper.search import Hyperband, SuccessiveHalving
+
+
+def complete(config, result, reports=()):
+    job = Job(0, config, None)
+    job.result = result
+    job.reports = list(reports)
+    return job
+
+
+def test_successive_halving_budgets():
+
+    assert SuccessiveHalving(1, 27, 3).budgets == [1, 3, 9, 27]
+    assert SuccessiveHalving(1, 10, 3).budgets == [1, 3, 10]
+    assert SuccessiveHalving(2, 8, 2).budgets == [2, 4, 8]
+
+
+def test_successive_halving_promotions():
+
+    scheduler = SuccessiveHalving(1, 9, 3)
+    configs = [scheduler.new_trial({"x": i}) for i in range(6)]
+    assert [c["budget"] for c in configs] == [1] * 6
+    assert [c["trial_id"] for c in configs] == list(range(6))
+
+    # the trials are paused until a third of the rung can be promoted
+    results, promotions = scheduler.update([complete(configs[0], 0), complete(configs[1], 1)])
+    assert results == [({"x": 0}, 0), ({"x": 1}, 1)]
+    assert promotions == []
+
+    results, promotions = scheduler.update([complete(configs[2], 2)])
+    assert promotions == [{"x": 2, "trial_id": 2, "budget": 3, "initial_budget": 1}]
+
+    # the best trial not promoted yet is promoted
+    results, promotions = scheduler.update(
+        [complete(configs[i], i) for i in range(3, 6)]
+    )
+    assert [p["trial_id"] for p in promotions] == [5, 4]
+
+    # promoted trials are not given back to the search
+    results, promotions = scheduler.update([complete(promotions[0], 10)])
+    assert results == []
+
+
+def test_successive_halving_reports():
+
+    scheduler = SuccessiveHalving(1, 9, 3)
+    configs = [scheduler.new_trial({"x": i}) for i in range(3)]
+    promoted = {**configs[0], "budget": 9}
+
+    # the objectives reported at the budgets of the previous rungs are recorded
+    scheduler.update([complete(promoted, 5, reports=[(1, 1), (2, 2), (3, 3), (9, 5)])])
+    assert scheduler._rungs[(0, 0)] == {0: 1}
+    assert scheduler._rungs[(0, 1)] == {0: 3}
+    assert scheduler._rungs[(0, 2)] == {0: 5}
+
+
+def test_hyperband():
+
+    scheduler = Hyperband(1, 9, 3, random_state=42)
+    configs = [scheduler.new_trial({"x": i}) for i in range(100)]
+    budgets = [c["budget"] for c in configs]
+
+    # most trials start in the most aggressive bracket
+    assert set(budgets) == {1, 3, 9}
+    assert budgets.count(1) > budgets.count(3) > budgets.count(9)
+
+
+def test_hyperband_results_at_first_budget():
+
+    scheduler = Hyperband(1, 9, 3, random_state=42)
+    configs = [scheduler.new_trial({"x": i}) for i in range(50)]
+    first = next(c for c in configs if c["budget"] == 1)
+    later = [c for c in configs if c["budget"] > 1][:2]
+
+    # the search only receives objectives at the budget of the first rung
+    results, _ = scheduler.update(
+        [
+            complete(first, 1),
+            complete(later[0], 10, reports=[(1, 2), (3, 5), (later[0]["budget"], 10)]),
+            complete(later[1], 20),
+        ]
+    )
+    assert results == [({"x": first["x"]}, 1), ({"x": later[0]["x"]}, 2)]